@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Benchmark: list of tuples vs columnar CardStore
+
+Streams synthetic tense-card rows the way a parser produces them (every
+value a new string object, labels and words repeating as in the decks)
+into a list of tuples and into a CardStore, and reports memory held
+(tracemalloc, strings included), build time, and the time to iterate
+every row and to scan one column.
+
+Usage: python3 benchmarks/bench_card_store.py [--sizes 100000,1000000]
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from lib.card_store import CardStore
+
+SYLLABLES = "가나다라마바사아자차카타파하고노도로모보소오조초코토포호"
+CATEGORIES = ["Past Tense", "Future Tense (을 거예요)", "Intention (려고 하다)", "Probability (것 같다)"]
+FIELDS = ["category", "dict_form", "polite", "casual", "meaning", "notes"]
+
+# Distinct verbs; a large corpus repeats them across categories and decks
+VOCABULARY = 5000
+
+
+def parsed_rows(count):
+    """Yield rows as freshly parsed JSON lines, like a data file loader."""
+    n = len(SYLLABLES)
+    for i in range(count):
+        word = i % VOCABULARY
+        stem = SYLLABLES[word % n] + SYLLABLES[(word // n) % n] + SYLLABLES[(word // (n * n)) % n]
+        line = json.dumps([CATEGORIES[i % len(CATEGORIES)], stem + "다", stem + "어요", stem + "어",
+                           f"to do thing {word}", ""], ensure_ascii=False)
+        yield tuple(json.loads(line))
+
+
+def measure(build):
+    """(result, bytes held, seconds) for build(); timed untraced, as tracing slows allocation."""
+    gc.collect()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    del result
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    held = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, held, elapsed
+
+
+def timed(function):
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", default="100000,1000000")
+    args = parser.parse_args()
+
+    print(f"{'rows':>9}  {'store':<10} {'MB held':>8} {'bytes/row':>10} {'build s':>8} "
+          f"{'iterate s':>10} {'column s':>9}")
+    for count in (int(s) for s in args.sizes.split(",")):
+        for name in ("tuples", "CardStore"):
+            if name == "tuples":
+                rows, held, build = measure(lambda: list(parsed_rows(count)))
+                iterate = timed(lambda: [row for row in rows])
+                column = timed(lambda: [row[4] for row in rows])
+            else:
+                rows, held, build = measure(lambda: CardStore(FIELDS).extend(parsed_rows(count)))
+                iterate = timed(lambda: [row for row in rows])
+                column = timed(lambda: list(rows.view("meaning")))
+            print(f"{count:>9}  {name:<10} {held / 1024 / 1024:>8.1f} {held / count:>10.1f} {build:>8.2f} "
+                  f"{iterate:>10.2f} {column:>9.2f}")
+            del rows
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Benchmark: counting word frequencies with 1..N worker processes
+
+Writes a corpus of --mb megabytes by sampling the Korean lines of the
+data files, counts it with each number of workers in --jobs, and checks
+that every run gives the same counts. Then writes the frequency table
+and times lookups against the mapped file.
+
+Usage: python3 benchmarks/bench_frequency.py [--mb 200] [--jobs 1 2 4]
+"""
+
+import argparse
+import os
+import random
+import re
+import shutil
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from lib.frequency import FrequencyTable, count_corpus, write_table
+
+
+def sample_lines():
+    lines = []
+    for directory, _, files in os.walk(os.path.join(ROOT, "data")):
+        for name in files:
+            with open(os.path.join(directory, name), encoding="utf-8", errors="ignore") as f:
+                lines.extend(line for line in f if re.search("[가-힣]", line))
+    return lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--mb", type=int, default=200)
+    parser.add_argument("--jobs", type=int, nargs="+", default=[1, 2, 4])
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp()
+    try:
+        corpus = os.path.join(workdir, "corpus.txt")
+        lines = sample_lines()
+        rng = random.Random(0)
+        with open(corpus, "w", encoding="utf-8") as f:
+            while f.tell() < args.mb << 20:
+                f.write("".join(rng.choices(lines, k=10000)))
+        size = os.path.getsize(corpus)
+
+        print(f"{size / 1e6:.0f} MB corpus, {os.cpu_count()} CPUs")
+        print(f"{'jobs':>4} {'seconds':>8} {'MB/s':>7}")
+        results = []
+        for jobs in args.jobs:
+            start = time.perf_counter()
+            counts = count_corpus([corpus], workers=jobs, chunk_bytes=8 << 20)
+            elapsed = time.perf_counter() - start
+            results.append(counts)
+            print(f"{jobs:>4} {elapsed:>8.2f} {size / 1e6 / elapsed:>7.1f}")
+        print(f"same counts: {'yes' if all(counts == results[0] for counts in results) else 'NO'}")
+
+        table_path = os.path.join(workdir, "freq.bin")
+        entries = write_table(results[0], table_path)
+        words = list(results[0])
+        start = time.perf_counter()
+        with FrequencyTable(table_path) as table:
+            for word in words:
+                table.rank(word)
+        elapsed = time.perf_counter() - start
+        print(f"table: {entries} entries, {os.path.getsize(table_path) / 1024:.0f} KB, "
+              f"{elapsed / len(words) * 1e6:.1f}µs per lookup")
+    finally:
+        shutil.rmtree(workdir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Hangul jamo decomposition and composition throughput
+
+Takes every Korean string of the deck data, repeated up to --syllables
+million code points, and times decomposing it into jamo indexes,
+composing the syllables back and spelling it out in jamo: per character
+in pure Python, and over whole arrays with NumPy (lib/hangul.py). Also
+checks that both give the same results. Reports the best of --repeat
+runs in millions of syllables per second.
+
+Usage: python3 benchmarks/bench_hangul.py [--syllables 5] [--repeat 3]
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from lib import hangul
+from lib.data_files import DATA_DIR, DataFile, deck_data_files
+
+
+def corpus_text():
+    """Every Korean string of the deck data, one per line."""
+    strings = []
+    for module in sorted(os.listdir(DATA_DIR)):
+        for path in deck_data_files(module):
+            for row in DataFile(os.path.relpath(path, DATA_DIR)):
+                strings.extend(value for value in row.values()
+                               if isinstance(value, str) and re.search("[가-힣]", value))
+    return "\n".join(strings)
+
+
+def best(repeat, function, *args):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function(*args)
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+
+def python_decompose(text):
+    return [hangul.decompose(char) for char in text]
+
+
+def python_compose(indexes):
+    return "".join(hangul.compose(*parts) for parts in indexes if parts)
+
+
+def numpy_compose(parts):
+    initial, medial, final = parts
+    syllable = initial >= 0
+    return hangul.compose_array(initial[syllable], medial[syllable], final[syllable])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--syllables", type=float, default=5, help="millions of code points")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    base = corpus_text()
+    text = (base * (int(args.syllables * 1e6) // len(base) + 1))[:int(args.syllables * 1e6)]
+    syllables = sum(map(hangul.is_syllable, text))
+    million = syllables / 1e6
+    print(f"{len(text) / 1e6:.1f}M code points, {million:.1f}M syllables "
+          f"(corpus: {len(base)} code points repeated)")
+    print(f"{'operation':<12} {'python M/s':>11} {'numpy M/s':>10}")
+
+    python_results = {}
+    seconds, python_results["decompose"] = best(args.repeat, python_decompose, text)
+    python_rates = {"decompose": million / seconds}
+    seconds, python_results["compose"] = best(args.repeat, python_compose, python_results["decompose"])
+    python_rates["compose"] = million / seconds
+    seconds, python_results["jamo"] = best(args.repeat, hangul.to_jamo, text)
+    python_rates["jamo"] = million / seconds
+
+    try:
+        hangul.numpy()
+    except ImportError as e:
+        for operation, rate in python_rates.items():
+            print(f"{operation:<12} {rate:>11.1f} {'-':>10}")
+        print(f"numpy: {e}")
+        return
+
+    codes = hangul.codepoints(text)
+    numpy_rates = {}
+    seconds, parts = best(args.repeat, hangul.decompose_array, codes)
+    numpy_rates["decompose"] = million / seconds
+    seconds, composed = best(args.repeat, numpy_compose, parts)
+    numpy_rates["compose"] = million / seconds
+    seconds, spelled = best(args.repeat, hangul.jamo_array, codes)
+    numpy_rates["jamo"] = million / seconds
+    for operation, rate in python_rates.items():
+        print(f"{operation:<12} {rate:>11.1f} {numpy_rates[operation]:>10.1f}")
+
+    same = (hangul.from_codepoints(composed) == python_results["compose"]
+            and hangul.from_codepoints(spelled) == python_results["jamo"]
+            and [tuple(map(int, indexes)) if indexes[0] >= 0 else None for indexes in zip(*parts)]
+            == python_results["decompose"])
+    print(f"same results: {'yes' if same else 'NO'}")
+
+
+if __name__ == "__main__":
+    main()
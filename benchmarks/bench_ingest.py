@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Benchmark: streaming ingestion vs the cached deck build
+
+Writes a synthetic frequency list (TSV, a quarter of the rows duplicates)
+and builds a word deck from it with lib.ingest.stream_deck and with
+lib.deck_spec.build_deck, reporting wall time and peak RSS. Audio uses
+SilentTTS; "text only" runs leave audio out, which shows what the rows
+themselves cost (each packaged clip keeps ~1 KB of zip and manifest
+bookkeeping until the package is closed). Every run happens in a fresh
+subprocess.
+
+Usage: python3 benchmarks/bench_ingest.py [--sizes 10000,100000,300000]
+"""
+
+import argparse
+import json
+import os
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+SYLLABLES = "가나다라마바사아자차카타파하고노도로모보소오조초코토포호"
+
+
+def write_source(path, count):
+    n = len(SYLLABLES)
+    distinct = max(1, count * 3 // 4)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("rank\tlemma\tgloss\n")
+        for i in range(count):
+            w = i % distinct
+            korean = "".join(SYLLABLES[(w // n ** k) % n] for k in range(4))
+            f.write(f"{i}\t{korean}\tword {w}\n")
+
+
+def run_one(engine, count, audio):
+    """Build one deck in this process and return its measurements."""
+    from lib.build_context import BuildContext, SilentTTS
+    from lib.deck_spec import DeckSpec, Section, build_deck
+    from lib.ingest import IngestSource, stream_deck
+    from lib.korean_deck_base import create_word_model, WORD_NOTE_FIELDS
+    from lib.records import WordRow
+
+    workdir = tempfile.mkdtemp()
+    source = os.path.join(workdir, "freq.tsv")
+    write_source(source, count)
+    os.chdir(workdir)
+
+    rows = IngestSource(source, {"korean": "lemma", "english": "gloss"})
+    # build_deck has no dedupe; it gets every row
+    spec = DeckSpec(1, "Benchmark", create_word_model,
+                    [Section("words", rows, WordRow, fields=WORD_NOTE_FIELDS, audio="korean" if audio else None)])
+
+    start = time.perf_counter()
+    with BuildContext(tts=SilentTTS, cache_dir=os.path.join(workdir, "cache")) as context:
+        if engine == "stream":
+            stream_deck(spec, "deck.apkg", context)
+        else:
+            build_deck(spec, "deck.apkg", context)
+    elapsed = time.perf_counter() - start
+    os.chdir(ROOT)
+    shutil.rmtree(workdir)
+
+    # ru_maxrss is KB on Linux, bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        peak //= 1024
+    return {"seconds": elapsed, "peak_mb": peak / 1024}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", default="10000,100000,300000")
+    parser.add_argument("--child", nargs=3, metavar=("ENGINE", "COUNT", "AUDIO"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        with open(os.devnull, "w") as devnull:
+            stdout, sys.stdout = sys.stdout, devnull
+            result = run_one(args.child[0], int(args.child[1]), args.child[2] == "1")
+            sys.stdout = stdout
+        print(json.dumps(result))
+        return
+
+    print(f"{'rows':>9}  {'engine':<12} {'audio':<10} {'seconds':>9} {'rows/s':>9} {'peak MB':>9}")
+    for count in (int(s) for s in args.sizes.split(",")):
+        for audio in (False, True):
+            for engine in ("stream", "build_deck"):
+                out = subprocess.run(
+                    [sys.executable, __file__, "--child", engine, str(count), "1" if audio else "0"],
+                    check=True, capture_output=True, text=True,
+                )
+                r = json.loads(out.stdout.strip().splitlines()[-1])
+                print(f"{count:>9}  {engine:<12} {'silent' if audio else 'text only':<10} {r['seconds']:>9.2f} "
+                      f"{count / r['seconds']:>9.0f} {r['peak_mb']:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
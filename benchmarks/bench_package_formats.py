@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Benchmark: legacy (.anki2) vs anki21b package layout
+
+Converts every shipped deck to the anki21b layout and back, checks the
+results hold the same notes, cards, models and media, and reports package
+size, write time and read time for each layout. A synthetic deck is then
+written with StreamingPackageWriter in both layouts and compared the same
+way.
+
+Usage: python3 benchmarks/bench_package_formats.py [--decks-dir decks] [--notes 20000]
+"""
+
+import argparse
+import glob
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmarks.bench_package_writer import make_notes
+from lib.apkg_reader import ApkgReader
+from lib.package_convert import compare_packages, convert_package
+from lib.package_writer import StreamingPackageWriter
+
+
+def read_all(path):
+    """Time a full read: collection plus every media file."""
+    start = time.perf_counter()
+    with ApkgReader(path) as reader:
+        reader.open_collection().close()
+        for entry, _, _ in reader.media():
+            reader.read_media(entry)
+    return time.perf_counter() - start
+
+
+def timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    fn(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def bench_shipped(decks_dir, work_dir):
+    print(f"{'deck':<36} {'anki2 KB':>9} {'21b KB':>9} {'write 2':>8} {'write 21b':>9} "
+          f"{'read 2':>7} {'read 21b':>8}  equal")
+    totals = [0, 0]
+    failed = 0
+    for path in sorted(glob.glob(os.path.join(decks_dir, "*.apkg"))):
+        name = os.path.basename(path)
+        legacy = os.path.join(work_dir, "legacy_" + name)
+        modern = os.path.join(work_dir, "modern_" + name)
+
+        write_legacy = timed(convert_package, path, legacy, "anki2")
+        write_modern = timed(convert_package, path, modern, "anki21b")
+        problems = compare_packages(legacy, modern) + compare_packages(path, modern)
+        failed += bool(problems)
+
+        sizes = os.path.getsize(legacy), os.path.getsize(modern)
+        totals[0] += sizes[0]
+        totals[1] += sizes[1]
+        print(f"{name[:36]:<36} {sizes[0] / 1024:>9.1f} {sizes[1] / 1024:>9.1f} "
+              f"{write_legacy:>8.3f} {write_modern:>9.3f} {read_all(legacy):>7.3f} {read_all(modern):>8.3f}  "
+              f"{'yes' if not problems else '; '.join(problems[:3])}")
+    if totals[0]:
+        print(f"{'total':<36} {totals[0] / 1024:>9.1f} {totals[1] / 1024:>9.1f}"
+              f"  ({100 * (totals[1] - totals[0]) / totals[0]:+.1f}%)")
+    return failed
+
+
+def bench_synthetic(notes, work_dir):
+    from lib.korean_deck_base import create_word_model
+
+    # Incompressible stand-ins for audio clips, one per 50 notes
+    media_dir = os.path.join(work_dir, "media")
+    os.makedirs(media_dir)
+    media = []
+    for i in range(0, notes, 50):
+        path = os.path.join(media_dir, f"audio_{i:08x}.mp3")
+        with open(path, "wb") as f:
+            f.write(os.urandom(8000))
+        media.append(path)
+
+    model = create_word_model()
+    paths = {}
+    print()
+    print(f"{'synthetic':<12} {'notes':>7} {'seconds':>8} {'KB':>9}")
+    for package_format in ("anki2", "anki21b"):
+        path = paths[package_format] = os.path.join(work_dir, f"synthetic.{package_format}.apkg")
+        start = time.perf_counter()
+        with StreamingPackageWriter(path, 1, "Benchmark", timestamp=0, verify_media=False,
+                                    package_format=package_format) as writer:
+            writer.add_notes(make_notes(model, notes))
+            for media_path in media:
+                writer.add_media_file(media_path)
+        elapsed = time.perf_counter() - start
+        print(f"{package_format:<12} {notes:>7} {elapsed:>8.2f} {os.path.getsize(path) / 1024:>9.1f}")
+
+    problems = compare_packages(paths["anki2"], paths["anki21b"])
+    print(f"equivalent: {'yes' if not problems else '; '.join(problems[:3])}")
+    return bool(problems)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--decks-dir", default=os.path.join(ROOT, "decks"))
+    parser.add_argument("--notes", type=int, default=20000, help="synthetic deck size (0 to skip)")
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp()
+    try:
+        failed = bench_shipped(args.decks_dir, work_dir)
+        if args.notes:
+            failed += bench_synthetic(args.notes, work_dir)
+    finally:
+        try:
+            shutil.rmtree(work_dir)
+        except:
+            pass
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
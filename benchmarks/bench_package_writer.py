@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Benchmark: genanki.Package vs StreamingPackageWriter
+
+Writes synthetic word-model decks of increasing size and reports wall time
+and peak RSS for each writer. Every run happens in a fresh subprocess so
+peak memory is measured in isolation.
+
+Usage: python3 benchmarks/bench_package_writer.py [--sizes 10000,100000,1000000]
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+SYLLABLES = "가나다라마바사아자차카타파하고노도로모보소오조초코토포호"
+
+
+def make_notes(model, count):
+    """Yield synthetic word notes with realistic field sizes."""
+    import genanki
+    n = len(SYLLABLES)
+    for i in range(count):
+        korean = SYLLABLES[i % n] + SYLLABLES[(i // n) % n] + SYLLABLES[(i // (n * n)) % n] + "다"
+        yield genanki.Note(
+            model=model,
+            fields=[
+                korean,
+                f"meaning {i}",
+                f"romanization {i}",
+                f"{korean} 예문이에요.",
+                f"Example sentence {i}.",
+                f'<span style="color:#E53935">{korean}</span>',
+                f'<span style="color:#E53935">word {i}</span>',
+                f"[sound:audio_{i:08x}.mp3]",
+            ],
+        )
+
+
+def run_one(writer_name, count):
+    """Write one package in this process and return its measurements."""
+    import genanki
+    from lib.korean_deck_base import create_word_model
+    from lib.package_writer import StreamingPackageWriter
+
+    model = create_word_model()
+    fd, path = tempfile.mkstemp(suffix=".apkg")
+    os.close(fd)
+
+    start = time.perf_counter()
+    if writer_name == "genanki":
+        deck = genanki.Deck(1, "Benchmark")
+        for note in make_notes(model, count):
+            deck.add_note(note)
+        genanki.Package(deck).write_to_file(path)
+    else:
+        with StreamingPackageWriter(path, 1, "Benchmark") as writer:
+            writer.add_notes(make_notes(model, count))
+    elapsed = time.perf_counter() - start
+
+    size = os.path.getsize(path)
+    os.remove(path)
+    # ru_maxrss is KB on Linux, bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        peak //= 1024
+    return {"seconds": elapsed, "peak_mb": peak / 1024, "package_mb": size / 1024 / 1024}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", default="10000,100000,1000000")
+    parser.add_argument("--genanki-max", type=int, default=100000,
+                        help="skip genanki above this many notes (it holds every note in memory)")
+    parser.add_argument("--child", nargs=2, metavar=("WRITER", "COUNT"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_one(args.child[0], int(args.child[1]))))
+        return
+
+    print(f"{'notes':>9}  {'writer':<10} {'seconds':>9} {'notes/s':>10} {'peak MB':>9} {'apkg MB':>9}")
+    for count in (int(s) for s in args.sizes.split(",")):
+        for writer_name in ("genanki", "streaming"):
+            if writer_name == "genanki" and count > args.genanki_max:
+                print(f"{count:>9}  {writer_name:<10} {'skipped':>9}")
+                continue
+            out = subprocess.run(
+                [sys.executable, __file__, "--child", writer_name, str(count)],
+                check=True, capture_output=True, text=True,
+            )
+            r = json.loads(out.stdout.strip().splitlines()[-1])
+            print(f"{count:>9}  {writer_name:<10} {r['seconds']:>9.2f} {count / r['seconds']:>10.0f} "
+                  f"{r['peak_mb']:>9.1f} {r['package_mb']:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
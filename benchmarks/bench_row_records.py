@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Benchmark: memory per deck row for each way of holding a table
+
+Builds synthetic word and sentence tables and measures, with tracemalloc,
+what holding the rows costs on top of their strings: plain tuples,
+per-row dicts (what Section.records() returned before typed records),
+the NamedTuple records of lib.records, and the KoreanWordCard /
+KoreanSentenceCard objects of lib.korean_deck_base. Also times
+load_records(), the one-time validation a Section does.
+
+Usage: python3 benchmarks/bench_row_records.py [--sizes 100000,1000000]
+"""
+
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from lib.korean_deck_base import KoreanSentenceCard, KoreanWordCard
+from lib.records import SentenceRow, WordRow, load_records
+
+SYLLABLES = "가나다라마바사아자차카타파하고노도로모보소오조초코토포호"
+
+
+def word_columns(count):
+    """Synthetic word rows as tuples, strings created up front."""
+    n = len(SYLLABLES)
+    rows = []
+    for i in range(count):
+        korean = SYLLABLES[i % n] + SYLLABLES[(i // n) % n] + SYLLABLES[(i // (n * n)) % n] + "다"
+        rows.append((korean, f"meaning {i}", f"romanization {i}", f"{korean} 예문이에요.",
+                     f"Example sentence {i}.", [(korean, f"meaning {i}")]))
+    return rows
+
+
+def sentence_columns(count):
+    n = len(SYLLABLES)
+    rows = []
+    for i in range(count):
+        korean = SYLLABLES[i % n] + SYLLABLES[(i // n) % n] + "를 먹어요."
+        rows.append((korean, f"I eat {i}.", f"breakdown {i}", [(korean, f"I eat {i}.")]))
+    return rows
+
+
+def measure(build, rows):
+    """Bytes allocated by build(rows), which must keep its result alive."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    held = build(rows)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del held
+    return after - before
+
+
+WORD_FIELDS = WordRow._fields
+SENTENCE_FIELDS = SentenceRow._fields
+
+WORD_KINDS = [
+    ("tuple", lambda rows: [(*row,) for row in rows]),
+    ("dict", lambda rows: [dict(zip(WORD_FIELDS, row)) for row in rows]),
+    ("WordRow", lambda rows: [WordRow._make(row) for row in rows]),
+    ("KoreanWordCard", lambda rows: [KoreanWordCard(*row[:5], word_pairs=row[5]) for row in rows]),
+]
+
+SENTENCE_KINDS = [
+    ("tuple", lambda rows: [(*row,) for row in rows]),
+    ("dict", lambda rows: [dict(zip(SENTENCE_FIELDS, row)) for row in rows]),
+    ("SentenceRow", lambda rows: [SentenceRow._make(row) for row in rows]),
+    ("KoreanSentenceCard", lambda rows: [KoreanSentenceCard(*row[:3], word_pairs=row[3]) for row in rows]),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", default="100000,1000000")
+    args = parser.parse_args()
+
+    print(f"{'rows':>9}  {'table':<9} {'record':<20} {'bytes/row':>10} {'total MB':>9}")
+    for count in (int(s) for s in args.sizes.split(",")):
+        for table, columns, kinds in (("words", word_columns, WORD_KINDS),
+                                      ("sentences", sentence_columns, SENTENCE_KINDS)):
+            rows = columns(count)
+            for name, build in kinds:
+                size = measure(build, rows)
+                print(f"{count:>9}  {table:<9} {name:<20} {size / count:>10.1f} {size / 1024 / 1024:>9.1f}")
+
+            row_type = WordRow if table == "words" else SentenceRow
+            start = time.perf_counter()
+            load_records(row_type, rows, table)
+            elapsed = time.perf_counter() - start
+            print(f"{count:>9}  {table:<9} {'load_records()':<20} {elapsed / count * 1e6:>8.2f}us {elapsed:>8.2f}s")
+            del rows
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Benchmark: building synthetic decks of growing size
+
+For each size, a fresh subprocess generates synthetic data (see
+lib/synthetic.py) and builds it with silent audio and a build cache,
+then builds it again from that cache. Reports notes per second and the
+peak memory of each run, to show where the pipeline stops scaling
+linearly.
+
+Usage: python3 benchmarks/bench_scale.py [--sizes 1000 10000 100000] [--seed 0]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def run(notes, seed, workdir):
+    """Generate and build twice in this process; returns seconds and peak memory."""
+    from lib.build_context import BuildContext, SilentTTS
+    from lib.deck_spec import build_deck
+    from lib.synthetic import synthetic_specs, write_corpus
+
+    data_dir = os.path.join(workdir, "data")
+    start = time.perf_counter()
+    write_corpus(data_dir, notes, seed)
+    result = {"generate": time.perf_counter() - start}
+    specs = synthetic_specs(data_dir)
+    for build in ("cold", "cached"):
+        start = time.perf_counter()
+        for spec in specs:
+            with BuildContext(tts=SilentTTS, cache_dir=os.path.join(workdir, "cache")) as context, \
+                    contextlib.redirect_stdout(io.StringIO()):
+                build_deck(spec, os.path.join(workdir, f"{spec.deck_id}.apkg"), context)
+        result[build] = time.perf_counter() - start
+    result["peak_mb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--child", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        workdir = tempfile.mkdtemp()
+        try:
+            print(json.dumps(run(args.child, args.seed, workdir)))
+        finally:
+            shutil.rmtree(workdir)
+        return
+
+    print(f"{'notes':>8} {'generate s':>10} {'cold s':>8} {'notes/s':>8} {'cached s':>9} {'notes/s':>8} {'peak MB':>8}")
+    for notes in args.sizes:
+        r = json.loads(subprocess.run([sys.executable, __file__, "--child", str(notes), "--seed", str(args.seed)],
+                                      check=True, capture_output=True, text=True).stdout)
+        print(f"{notes:>8} {r['generate']:>10.1f} {r['cold']:>8.1f} {notes / r['cold']:>8.0f} "
+              f"{r['cached']:>9.1f} {notes / r['cached']:>8.0f} {r['peak_mb']:>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
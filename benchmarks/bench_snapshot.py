@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Benchmark: loading every deck table from text vs from the data snapshot
+
+Copies data/ to a temporary directory, then in fresh subprocesses reads
+every row of every data file through DataFile: once parsing the text
+files, once from a compiled snapshot (lib.data_snapshot). Also checks
+that both give the same rows. Reports the best of --repeat runs.
+
+Usage: python3 benchmarks/bench_snapshot.py [--repeat 5]
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def load_all(data_dir):
+    """Read every table in this process; returns (ms, rows, digest of the rows)."""
+    import hashlib
+    from lib.data_files import DataFile, all_data_files
+
+    files = all_data_files(data_dir)
+    start = time.perf_counter()
+    tables = [list(DataFile(relpath, data_dir)) for relpath in files]
+    elapsed = time.perf_counter() - start
+    digest = hashlib.sha1(json.dumps(tables, ensure_ascii=False, sort_keys=True).encode("utf-8")).hexdigest()
+    return {"ms": elapsed * 1000, "rows": sum(map(len, tables)), "digest": digest}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--child", metavar="DATA_DIR", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(load_all(args.child)))
+        return
+
+    from lib.data_files import compile_snapshot
+    from lib.data_snapshot import snapshot_path, SNAPSHOT_NAME
+
+    workdir = tempfile.mkdtemp()
+    try:
+        data_dir = os.path.join(workdir, "data")
+        shutil.copytree(os.path.join(ROOT, "data"), data_dir, ignore=shutil.ignore_patterns(SNAPSHOT_NAME))
+
+        def run():
+            runs = [json.loads(subprocess.run([sys.executable, __file__, "--child", data_dir], check=True,
+                                              capture_output=True, text=True).stdout)
+                    for _ in range(args.repeat)]
+            return min(runs, key=lambda r: r["ms"])
+
+        text = run()
+        start = time.perf_counter()
+        compile_snapshot(data_dir)
+        compile_ms = (time.perf_counter() - start) * 1000
+        snapshot = run()
+
+        size = sum(os.path.getsize(os.path.join(d, f)) for d, _, fs in os.walk(data_dir) for f in fs
+                   if f != SNAPSHOT_NAME)
+        print(f"{text['rows']} rows in {size / 1024:.0f} KB of data files; "
+              f"snapshot {os.path.getsize(snapshot_path(data_dir)) / 1024:.0f} KB, compiled in {compile_ms:.0f}ms")
+        print(f"{'source':<10} {'load ms':>8}")
+        print(f"{'text':<10} {text['ms']:>8.1f}")
+        print(f"{'snapshot':<10} {snapshot['ms']:>8.1f}")
+        print(f"same rows: {'yes' if text['digest'] == snapshot['digest'] else 'NO'}")
+    finally:
+        shutil.rmtree(workdir)
+
+
+if __name__ == "__main__":
+    main()
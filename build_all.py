@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Korean Deck Builder
+
+Discovers every korean_*.py generator and builds all decks in parallel,
+one worker process per deck, then reports per-deck timing and counts.
+Exits non-zero if any deck fails.
+
+With --watch, keeps running and rebuilds only the decks whose generator
+or imported lib modules changed. Clips and the outputs of every build
+stage are cached in .build_cache (see lib.stage_cache), so an edited row
+is the only one rendered and sent to TTS again, and decks whose inputs did
+not change are not repackaged.
+
+The data files are compiled into a snapshot first, if any changed (see
+lib.data_snapshot), so workers load their tables without parsing them.
+Every deck's data is then checked (see validate_decks.py) and new
+errors, those not in data/known_issues.tsv, are listed; with --strict,
+they stop the build.
+
+With --using, builds only the decks whose content uses the given texts,
+found through the content repository (see content_repo.py).
+
+Usage: python3 build_all.py [--jobs N] [--watch] [--strict] [--using TEXT ...] [deck ...]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Add lib to path
+sys.path.insert(0, os.path.join(ROOT, 'lib'))
+
+from lib.build_runner import build_all, discover_generators
+from lib.content_repo import DEFAULT_FILENAME as CONTENT_FILENAME, ContentRepository
+from lib.data_files import compile_snapshot
+from lib.stage_cache import StageStats
+from lib.validation import ERROR, validate_modules
+from lib.watch import watch
+
+DEFAULT_CACHE_DIR = ".build_cache"
+
+
+def print_result(result):
+    if result.ok:
+        print(f"✓ {result.module}: {result.notes} notes, {result.cards} cards, "
+              f"{result.media} media in {result.seconds:.1f}s")
+    else:
+        print(f"✗ {result.module}: failed after {result.seconds:.1f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build every Korean deck in parallel.")
+    parser.add_argument("decks", nargs="*", help="generator modules to build (default: all)")
+    parser.add_argument("--jobs", "-j", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--verbose", "-v", action="store_true", help="show each generator's output")
+    parser.add_argument("--watch", action="store_true", help="rebuild affected decks whenever sources change")
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR, help="clip and stage cache kept across builds")
+    parser.add_argument("--no-cache", action="store_true", help="run every stage and synthesize every clip again")
+    parser.add_argument("--strict", action="store_true", help="do not build if the data has errors")
+    parser.add_argument("--using", nargs="+", metavar="TEXT",
+                        help="only decks with an entry, example or clip using one of these Korean texts")
+    args = parser.parse_args()
+
+    # Generators write relative to the working directory
+    os.chdir(ROOT)
+    sys.path.insert(0, ROOT)
+
+    available = discover_generators(ROOT)
+    modules = [name.replace(".py", "") for name in args.decks] or available
+    unknown = [name for name in modules if name not in available]
+    if unknown:
+        parser.error(f"unknown generator(s): {', '.join(unknown)}")
+
+    cache_dir = None if args.no_cache else args.cache_dir
+
+    if args.using:
+        with ContentRepository(os.path.join(args.cache_dir, CONTENT_FILENAME)) as repo:
+            repo.import_modules(modules)
+            using = {deck["module"] for deck in repo.decks_using(args.using)}
+        modules = [name for name in modules if name in using]
+        if not modules:
+            print(f"No decks use {', '.join(args.using)}.")
+            return 0
+
+    start = time.perf_counter()
+    compiled = compile_snapshot()
+    if compiled:
+        print(f"✓ Data snapshot compiled: {len(compiled)} tables in {time.perf_counter() - start:.2f}s")
+
+    start = time.perf_counter()
+    errors = [issue for issue in validate_modules(modules) if issue.severity == ERROR]
+    if errors:
+        print(f"✗ {len(errors)} data errors ({time.perf_counter() - start:.2f}s); "
+              f"see python3 validate_decks.py")
+        for issue in errors:
+            print(f"  - {issue.format()}")
+        if args.strict:
+            return 1
+    else:
+        print(f"✓ Data checked in {time.perf_counter() - start:.2f}s")
+
+    print(f"Building {len(modules)} decks...")
+    failed = run_build(modules, args, cache_dir)
+    if not args.watch:
+        return 1 if failed else 0
+
+    def rebuild(affected, changed):
+        print(f"\nChanged: {', '.join(changed)}")
+        if not affected:
+            print("No decks depend on it.")
+            return
+        print(f"Rebuilding {', '.join(affected)}...")
+        compile_snapshot()
+        # Fresh interpreters, so workers import the edited sources
+        run_build(affected, args, cache_dir, fresh_processes=True)
+
+    print(f"\nWatching {len(modules)} generators and their lib modules (Ctrl-C to stop)...")
+    try:
+        watch(ROOT, modules, rebuild)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def run_build(modules, args, cache_dir, fresh_processes=False):
+    """Build decks and print the report. Returns the failed results."""
+    start = time.perf_counter()
+    results = build_all(modules, args.jobs, on_result=print_result,
+                        cache_dir=cache_dir, fresh_processes=fresh_processes)
+    elapsed = time.perf_counter() - start
+
+    failed = [r for r in results if not r.ok]
+    print(f"\n{'deck':<32} {'status':<7} {'seconds':>8} {'notes':>6} {'cards':>6} {'media':>6} {'tts':>5}")
+    for r in results:
+        print(f"{r.module:<32} {'ok' if r.ok else 'FAILED':<7} {r.seconds:>8.1f} {r.notes:>6} {r.cards:>6} "
+              f"{r.media:>6} {r.stats.audio_generated:>5}")
+    slowest = max((r.seconds for r in results), default=0)
+    print(f"\n{len(results) - len(failed)}/{len(results)} decks built in {elapsed:.1f}s "
+          f"(slowest deck {slowest:.1f}s, sum {sum(r.seconds for r in results):.1f}s)")
+    stages = StageStats()
+    for r in results:
+        stages.merge(r.stats.stages)
+    if stages.format():
+        print(f"Cached stages (reused/total): {stages.format()}")
+
+    for r in results:
+        if args.verbose or not r.ok:
+            print(f"\n--- {r.module} ---")
+            print(r.log.rstrip())
+            print(r.error.rstrip())
+    return failed
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Korean Deck Build Daemon
+
+Keeps a build process running with generators imported, models created
+and stage caches loaded, and builds decks on request over a Unix socket.
+Edited sources are reloaded before each build.
+
+Usage:
+    python3 build_daemon.py serve [--silent] &
+    python3 build_daemon.py build [deck ...]
+    python3 build_daemon.py status
+    python3 build_daemon.py stop
+"""
+
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Add lib to path
+sys.path.insert(0, os.path.join(ROOT, 'lib'))
+
+from lib.build_client import DEFAULT_SOCKET, ping, request
+
+
+def serve(args):
+    # Heavy imports only on the server side; the client stays fast
+    from lib.build_context import SilentTTS
+    from lib.build_daemon import BuildDaemon
+
+    daemon = BuildDaemon(ROOT, cache_dir=None if args.no_cache else args.cache_dir,
+                         tts=SilentTTS if args.silent else None)
+    start = time.perf_counter()
+    modules = daemon.warm_up()
+    print(f"✓ Build daemon ready: {len(modules)} generators loaded in {time.perf_counter() - start:.1f}s")
+    print(f"  - listening on {args.socket} (pid {os.getpid()})")
+    sys.stdout.flush()
+    daemon.serve(args.socket)
+    print("✓ Build daemon stopped")
+    return 0
+
+
+def build(args):
+    start = time.perf_counter()
+    response = request(args.socket, {"command": "build", "decks": args.decks})
+    elapsed = time.perf_counter() - start
+    if "results" not in response:
+        print(f"✗ {response.get('error')}")
+        return 1
+
+    if response["reloaded"]:
+        print(f"Reloaded: {', '.join(response['reloaded'])}")
+    for r in response["results"]:
+        if r["ok"]:
+            print(f"✓ {r['module']}: {r['notes']} notes, {r['cards']} cards, {r['media']} media "
+                  f"in {r['seconds'] * 1000:.0f}ms (tts {r['tts']}; cached {r['stages'] or 'nothing'})")
+        else:
+            print(f"✗ {r['module']}: failed after {r['seconds'] * 1000:.0f}ms")
+        if args.verbose or not r["ok"]:
+            print(r["log"].rstrip())
+            print(r["error"].rstrip())
+    overhead = elapsed - response["seconds"]
+    print(f"\n{len(response['results'])} decks in {elapsed * 1000:.0f}ms "
+          f"(build {response['seconds'] * 1000:.0f}ms, request overhead {overhead * 1000:.1f}ms)")
+    return 0 if response["ok"] else 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Warm build server for the Korean decks.")
+    parser.add_argument("--socket", default=os.path.join(ROOT, DEFAULT_SOCKET), help="daemon socket path")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    server = commands.add_parser("serve", help="run the daemon in the foreground")
+    server.add_argument("--cache-dir", default=os.path.join(ROOT, ".build_cache"),
+                        help="clip and stage cache kept across builds")
+    server.add_argument("--no-cache", action="store_true", help="run every stage on every build")
+    server.add_argument("--silent", action="store_true", help="write empty clips instead of calling TTS (dry run)")
+
+    client = commands.add_parser("build", help="build decks in the running daemon")
+    client.add_argument("decks", nargs="*", help="generator modules to build (default: all)")
+    client.add_argument("--verbose", "-v", action="store_true", help="show each generator's output")
+
+    commands.add_parser("status", help="show whether a daemon is running")
+    commands.add_parser("stop", help="stop the running daemon")
+    args = parser.parse_args()
+
+    if args.command == "serve":
+        # Generators write relative to the working directory
+        os.chdir(ROOT)
+        sys.path.insert(0, ROOT)
+        return serve(args)
+
+    if not ping(args.socket):
+        print(f"No build daemon on {args.socket}; start one with: python3 build_daemon.py serve &")
+        return 2
+    if args.command == "build":
+        return build(args)
+    response = request(args.socket, {"command": args.command})
+    if args.command == "status":
+        print(f"✓ Build daemon pid {response['pid']}, up {response['uptime']:.0f}s, "
+              f"{response['builds']} decks built, {response['reloads']} module reloads")
+    else:
+        print("✓ Stop requested")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
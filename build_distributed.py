@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Korean Deck Distributed Builder
+
+Splits a build into audio and deck jobs on a SQLite queue in a shared
+directory. Start one coordinator, and workers on any machines that mount
+the same directory; the coordinator merges the results when the queue
+drains.
+
+Usage:
+    python3 build_distributed.py coordinator /mnt/shared/build --local-workers 4
+    python3 build_distributed.py worker /mnt/shared/build
+"""
+
+import argparse
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Add lib to path
+sys.path.insert(0, os.path.join(ROOT, 'lib'))
+
+from lib.build_context import SilentTTS
+from lib.build_runner import discover_generators
+from lib.distributed_build import MANIFEST_NAME, coordinate, run_worker
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build decks with workers on several machines.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    coordinator = commands.add_parser("coordinator", help="queue a build, wait for it and merge the results")
+    coordinator.add_argument("shared_dir")
+    coordinator.add_argument("decks", nargs="*", help="generator modules to build (default: all)")
+    coordinator.add_argument("--local-workers", type=int, default=0, help="workers to start on this machine")
+
+    worker = commands.add_parser("worker", help="run jobs until the queue drains")
+    worker.add_argument("shared_dir")
+    worker.add_argument("--lease", type=float, default=None, help="lease length in seconds")
+
+    for command in (coordinator, worker):
+        command.add_argument("--silent", action="store_true", help="write empty clips instead of calling TTS (dry run)")
+
+    args = parser.parse_args()
+    shared_dir = os.path.abspath(args.shared_dir)
+    os.chdir(ROOT)
+    sys.path.insert(0, ROOT)
+
+    if args.command == "worker":
+        completed = run_worker(shared_dir, tts=SilentTTS if args.silent else None, lease_seconds=args.lease)
+        print(f"✓ Worker finished: {completed} jobs")
+        return 0
+
+    available = discover_generators(ROOT)
+    modules = [name.replace(".py", "") for name in args.decks] or available
+    unknown = [name for name in modules if name not in available]
+    if unknown:
+        parser.error(f"unknown generator(s): {', '.join(unknown)}")
+
+    worker_command = [sys.executable, os.path.abspath(__file__), "worker", shared_dir]
+    if args.silent:
+        worker_command.append("--silent")
+
+    print(f"Building {len(modules)} decks in {shared_dir}...")
+    manifest = coordinate(shared_dir, modules, worker_command, args.local_workers)
+
+    for name, deck in sorted(manifest["decks"].items()):
+        print(f"✓ {name}: {deck['notes']} notes, {deck['media']} media -> {', '.join(deck['packages'])}")
+    for failure in manifest["failed"]:
+        print(f"✗ {failure['kind']} {failure['key']}: {failure['error']}")
+    print(f"\n{len(manifest['decks'])}/{len(modules)} decks, {len(manifest['audio'])} clips; "
+          f"manifest written to {os.path.join(shared_dir, MANIFEST_NAME)}")
+    return 1 if manifest["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Korean Shared Media Pack Builder
+
+Splits the built decks into content-only packages plus one shared,
+versioned media pack holding the deduplicated audio of every deck.
+Import the media pack once; later text fixes only need the small
+content packages.
+
+Usage: python3 build_media_pack.py [--decks-dir decks] [--output-dir decks/split]
+"""
+
+import argparse
+import glob
+import os
+import sys
+
+# Add lib to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'lib'))
+
+from lib.media_pack import build_media_pack, MANIFEST_NAME
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build content-only decks plus a shared media pack.")
+    parser.add_argument("--decks-dir", default="decks", help="directory of built .apkg files")
+    parser.add_argument("--output-dir", default=os.path.join("decks", "split"), help="where to write the split packages")
+    args = parser.parse_args()
+
+    packages = sorted(glob.glob(os.path.join(args.decks_dir, "*.apkg")))
+    if not packages:
+        print(f"No packages found in {args.decks_dir}")
+        return 1
+
+    manifest = build_media_pack(packages, args.output_dir)
+    pack = manifest["media_pack"]
+
+    print(f"✓ Media pack v{pack['version']}: {pack['file']}")
+    print(f"  - {pack['files']} audio files, {pack['bytes'] / 1024:.0f} KB")
+    if pack["mismatched"]:
+        print(f"  - {len(pack['mismatched'])} files differed between decks (first copy kept)")
+    for name, info in sorted(manifest["decks"].items()):
+        print(f"✓ {name}: {info['bytes'] / 1024:.1f} KB ({info['media']} audio files in pack)")
+    print(f"\nManifest written to {os.path.join(args.output_dir, MANIFEST_NAME)}")
+    print("Import the media pack first, then the content decks: File → Import...")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
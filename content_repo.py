@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Korean Content Repository
+
+Imports every deck's data into the SQLite content repository and queries
+it across decks: where a word or romanization is taught, which decks use
+a text (and so need rebuilding when it changes), and which entries
+repeat across decks. Every command first brings the repository up to
+date; only sections whose data changed are reimported.
+
+Usage:
+    python3 content_repo.py import
+    python3 content_repo.py find 먹다
+    python3 content_repo.py find --prefix meok
+    python3 content_repo.py decks 안녕하세요 감사합니다
+    python3 content_repo.py duplicates
+"""
+
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Add lib to path
+sys.path.insert(0, os.path.join(ROOT, 'lib'))
+
+from lib.build_runner import discover_generators
+from lib.content_repo import DEFAULT_FILENAME, ContentRepository
+
+DEFAULT_CACHE_DIR = ".build_cache"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import and query the content of every deck.")
+    parser.add_argument("--db", default=os.path.join(ROOT, DEFAULT_CACHE_DIR, DEFAULT_FILENAME),
+                        help="repository file (default: in the build cache)")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("import", help="import changed sections and show table sizes")
+    find = commands.add_parser("find", help="entries with this Korean text or romanization")
+    find.add_argument("text")
+    find.add_argument("--prefix", action="store_true", help="match the start of the text")
+    decks = commands.add_parser("decks", help="decks using any of these texts, to rebuild")
+    decks.add_argument("texts", nargs="+")
+    commands.add_parser("duplicates", help="Korean texts taught in more than one deck")
+    args = parser.parse_args()
+
+    sys.path.insert(0, ROOT)
+    with ContentRepository(args.db) as repo:
+        start = time.perf_counter()
+        imported = repo.import_modules(discover_generators(ROOT))
+        import_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        if args.command == "import":
+            changed = {module: count for module, count in imported.items() if count}
+            print(f"✓ {len(imported)} decks up to date in {args.db} ({import_seconds * 1000:.0f}ms)")
+            for module, count in changed.items():
+                print(f"  - {module}: {count} section(s) reimported")
+            print("  - " + ", ".join(f"{count} {table}" for table, count in repo.counts().items()))
+            return 0
+
+        if args.command == "find":
+            hits = repo.find(args.text, prefix=args.prefix)
+            for hit in hits:
+                print(f"  - {hit['korean']} ({hit['romanization'] or '-'}) {hit['english'] or ''}  "
+                      f"[{hit['module']} / {hit['section']} #{hit['position'] + 1}]")
+            found = f"{len(hits)} entries"
+        elif args.command == "decks":
+            hits = repo.decks_using(args.texts)
+            for hit in hits:
+                print(f"  - {hit['module']}: {hit['deck_name']}")
+            found = f"{len(hits)} decks"
+        else:
+            hits = repo.duplicates()
+            for hit in hits:
+                print(f"  - {hit['korean']}: {hit['decks']} decks ({', '.join(hit['modules'])})")
+            found = f"{len(hits)} texts"
+        print(f"{'✓' if hits else '✗'} {found} in {(time.perf_counter() - start) * 1000:.1f}ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
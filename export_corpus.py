@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Korean Deck Corpus Export
+
+Writes every note of the built packages (deck, model, fields, and the
+digest and size of its audio) to one Parquet or Arrow file, for
+column-wise analysis without the generators. Needs pyarrow.
+
+Usage:
+    python3 export_corpus.py corpus.parquet
+    python3 export_corpus.py corpus.arrow decks/03_korean_numbers.apkg decks/05_korean_time.apkg
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Add lib to path
+sys.path.insert(0, os.path.join(ROOT, 'lib'))
+
+from lib.corpus_export import export_corpus
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export every note of the built decks to Parquet or Arrow.")
+    parser.add_argument("output", help=".parquet, .arrow or .feather file")
+    parser.add_argument("packages", nargs="*", help="packages to export (default: decks/*.apkg)")
+    args = parser.parse_args()
+
+    packages = args.packages or sorted(glob.glob(os.path.join(ROOT, "decks", "*.apkg")))
+    if not packages:
+        print("✗ No packages to export; build the decks first")
+        return 1
+
+    def report(path, notes, media_bytes):
+        print(f"  - {os.path.basename(path)}: {notes} notes, {media_bytes / 1024:.0f} KB audio")
+
+    start = time.perf_counter()
+    try:
+        notes = export_corpus(packages, args.output, on_package=report)
+    except (ImportError, OSError, ValueError) as e:
+        print(f"✗ {e}")
+        return 1
+    print(f"✓ Exported {notes} notes from {len(packages)} packages to {args.output} "
+          f"in {time.perf_counter() - start:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Korean Word List Ingestion
+
+Builds a word or sentence deck from an external CSV, TSV or JSONL file
+(frequency lists, dictionary exports), streaming it in chunks so memory
+stays flat however long the list is. Duplicate rows are skipped.
+
+Usage:
+    python3 ingest_wordlist.py freq.tsv --map korean=lemma,english=gloss --name "Top 10k Words"
+    python3 ingest_wordlist.py sentences.jsonl --kind sentence --map korean=ko,english=en --silent
+"""
+
+import argparse
+import hashlib
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Add lib to path
+sys.path.insert(0, os.path.join(ROOT, 'lib'))
+
+from lib.build_context import BuildContext, SilentTTS
+from lib.deck_spec import DeckSpec, Section
+from lib.ingest import DEFAULT_CHUNK_SIZE, IngestSource, stream_deck
+from lib.korean_deck_base import (
+    create_sentence_model, create_word_model, SENTENCE_NOTE_FIELDS, WORD_NOTE_FIELDS
+)
+from lib.records import SentenceRow, WordRow
+
+KINDS = {
+    "word": (WordRow, create_word_model, WORD_NOTE_FIELDS),
+    "sentence": (SentenceRow, create_sentence_model, SENTENCE_NOTE_FIELDS),
+}
+
+
+def parse_map(text):
+    """"korean=lemma,english=gloss" -> {"korean": "lemma", "english": "gloss"}"""
+    columns = {}
+    for item in filter(None, text.split(",")):
+        field, sep, column = item.partition("=")
+        if not sep:
+            raise argparse.ArgumentTypeError(f"expected field=column, got {item!r}")
+        columns[field.strip()] = column.strip()
+    return columns
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build a deck from a large external word list.")
+    parser.add_argument("source", help="CSV, TSV or JSONL file")
+    parser.add_argument("--kind", choices=sorted(KINDS), default="word", help="note model to use")
+    parser.add_argument("--map", type=parse_map, default=None,
+                        help="row field=source column pairs (default: columns named like the fields)")
+    parser.add_argument("--format", choices=["csv", "tsv", "jsonl"], help="source format (default: from extension)")
+    parser.add_argument("--name", help="deck name (default: the file name)")
+    parser.add_argument("--deck-id", type=int, help="Anki deck ID (default: derived from the name)")
+    parser.add_argument("--output", help="package path (default: decks/<file name>.apkg)")
+    parser.add_argument("--dedupe", default="korean", help="comma-separated fields identifying duplicates ('' keeps all)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="rows processed at a time")
+    parser.add_argument("--cache-dir", default=os.path.join(ROOT, ".build_cache"), help="clip cache kept across builds")
+    parser.add_argument("--silent", action="store_true", help="write empty clips instead of calling TTS (dry run)")
+    parser.add_argument("--no-audio", action="store_true", help="leave audio out")
+    args = parser.parse_args()
+
+    row_type, model, fields = KINDS[args.kind]
+    columns = args.map or {field: field for field in row_type._fields if field != "word_pairs"}
+    dedupe = [field for field in args.dedupe.split(",") if field]
+    unknown = [field for field in list(columns) + dedupe if field not in row_type._fields]
+    if unknown:
+        parser.error(f"{row_type.__name__} has no field(s) {', '.join(unknown)}; "
+                     f"fields are {', '.join(row_type._fields)}")
+
+    stem = os.path.splitext(os.path.basename(args.source))[0]
+    name = args.name or stem
+    # Stable across runs, so re-importing updates the same deck
+    deck_id = args.deck_id or (1 << 30) + int(hashlib.sha1(name.encode("utf-8")).hexdigest()[:7], 16)
+    spec = DeckSpec(
+        deck_id=deck_id,
+        deck_name=name,
+        model=model,
+        sections=[Section(f"{args.kind} cards", IngestSource(args.source, columns, args.format), row_type,
+                          fields=fields, audio=None if args.no_audio else "korean")],
+    )
+
+    with BuildContext(tts=SilentTTS if args.silent else None, cache_dir=args.cache_dir) as context:
+        try:
+            stream_deck(spec, args.output or os.path.join("decks", f"{stem}.apkg"), context,
+                        dedupe=dedupe, chunk_size=args.chunk_size)
+        except (OSError, ValueError) as e:
+            print(f"✗ {e}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
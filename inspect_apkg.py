@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Korean Deck Package Inspector
+
+Lists the models, notes and media of a built .apkg, or shows what changed
+between two builds, without importing anything into Anki.
+
+Usage:
+    python3 inspect_apkg.py show decks/12_korean_grammar_intermediate.apkg
+    python3 inspect_apkg.py diff old.apkg new.apkg
+    python3 inspect_apkg.py diff decks/12_korean_grammar_intermediate.apkg --source
+"""
+
+import argparse
+import os
+import sys
+
+# Add lib to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'lib'))
+
+from lib.apkg_inspect import (
+    build_from_source, diff_packages, format_diff, format_summary, load_package, source_module_for
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect and diff Anki packages.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    show = commands.add_parser("show", help="list models, notes and media")
+    show.add_argument("package")
+    show.add_argument("--limit", type=int, default=None, help="show at most this many notes and media")
+
+    diff = commands.add_parser("diff", help="note-level diff of two packages, or a package and its sources")
+    diff.add_argument("old")
+    diff.add_argument("new", nargs="?", help="second package (omit with --source)")
+    diff.add_argument("--source", nargs="?", const="", default=None,
+                      help="compare against the generator module (inferred from the package name if omitted)")
+
+    args = parser.parse_args()
+
+    if args.command == "show":
+        print(format_summary(load_package(args.package), args.limit))
+        return 0
+
+    old = load_package(args.old)
+    if args.source is not None:
+        new = build_from_source(args.source or source_module_for(args.old))
+    elif args.new:
+        new = load_package(args.new)
+    else:
+        parser.error("diff needs a second package or --source")
+
+    result = diff_packages(old, new)
+    print(format_diff(old, new, result))
+    return 0 if result.empty else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
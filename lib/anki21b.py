@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Newer Anki package format (Anki 2.1.50+).
+
+Packages in this format carry a zstd-compressed `collection.anki21b`,
+zstd-compressed media entries, a protobuf media manifest listing each
+file's name, size and SHA-1, and a `meta` entry announcing the format.
+A small legacy `collection.anki2` asks older clients to update.
+
+The collection itself keeps the schema the legacy writer produces; Anki
+upgrades it when importing, exactly as it does for legacy packages.
+"""
+
+import itertools
+import sqlite3
+from typing import List, Tuple
+
+import genanki
+
+
+COLLECTION_NAME = "collection.anki21b"
+LEGACY_COLLECTION_NAME = "collection.anki2"
+
+# PackageMetadata.Version
+VERSION_LEGACY_2 = 2
+VERSION_LATEST = 3
+
+DEFAULT_ZSTD_LEVEL = 3
+
+
+def zstd():
+    """Import zstandard, which the newer format requires."""
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError("The anki21b package format needs zstandard: pip install zstandard")
+    return zstandard
+
+
+# =============================================================================
+# PROTOBUF ENCODING
+# =============================================================================
+# The two messages involved are tiny, so they are encoded by hand:
+#
+#   message PackageMetadata { Version version = 1; }
+#   message MediaEntries { repeated MediaEntry entries = 1; }
+#   message MediaEntry { string name = 1; uint32 size = 2; bytes sha1 = 3; }
+
+def _varint(value: int) -> bytes:
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def _read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    result = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, pos
+        shift += 7
+
+
+def _fields(data: bytes):
+    """Yield (field number, value) for a flat protobuf message."""
+    pos = 0
+    while pos < len(data):
+        key, pos = _read_varint(data, pos)
+        number, wire_type = key >> 3, key & 7
+        if wire_type == 0:
+            value, pos = _read_varint(data, pos)
+        elif wire_type == 2:
+            length, pos = _read_varint(data, pos)
+            value, pos = data[pos:pos + length], pos + length
+        else:
+            raise ValueError(f"Unsupported protobuf wire type {wire_type}")
+        yield number, value
+
+
+def encode_meta(version: int = VERSION_LATEST) -> bytes:
+    return b"\x08" + _varint(version)
+
+
+def decode_meta(data: bytes) -> int:
+    for number, value in _fields(data):
+        if number == 1:
+            return value
+    return VERSION_LEGACY_2
+
+
+def encode_media_entries(entries: List[Tuple[str, int, bytes]]) -> bytes:
+    """Encode (name, size, sha1 digest) entries, in zip entry order."""
+    out = bytearray()
+    for name, size, sha1 in entries:
+        name_bytes = name.encode("utf-8")
+        entry = (b"\x0a" + _varint(len(name_bytes)) + name_bytes
+                 + b"\x10" + _varint(size)
+                 + b"\x1a" + _varint(len(sha1)) + sha1)
+        out += b"\x0a" + _varint(len(entry)) + entry
+    return bytes(out)
+
+
+def decode_media_entries(data: bytes) -> List[Tuple[str, int, bytes]]:
+    entries = []
+    for number, value in _fields(data):
+        if number != 1:
+            continue
+        name, size, sha1 = "", 0, b""
+        for field, item in _fields(value):
+            if field == 1:
+                name = item.decode("utf-8")
+            elif field == 2:
+                size = item
+            elif field == 3:
+                sha1 = item
+        entries.append((name, size, sha1))
+    return entries
+
+
+# =============================================================================
+# LEGACY STUB
+# =============================================================================
+
+def legacy_stub_collection() -> bytes:
+    """A one-note legacy collection telling older Anki versions to update."""
+    deck = genanki.Deck(1, "Default")
+    deck.add_note(genanki.Note(
+        model=genanki.BASIC_MODEL,
+        fields=["This package needs Anki 2.1.50 or newer. Please update Anki and import it again.", ""],
+    ))
+
+    conn = sqlite3.connect(":memory:")
+    try:
+        genanki.Package(deck).write_to_db(conn.cursor(), 0, itertools.count(1))
+        conn.commit()
+        return conn.serialize()
+    finally:
+        conn.close()
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+Structural inspection and diffing of .apkg packages.
+
+Packages are read straight from the zip (see lib.apkg_reader); media is
+compared by the size and checksum recorded in the zip directory or the
+anki21b media manifest, so no media bytes are decompressed. A package can
+also be compared with the deck its generator module would build right
+now: the module is run in a build context whose TTS is a silent
+stand-in, and audio filenames are derived from the spoken text either
+way, so references still line up.
+"""
+
+import contextlib
+import importlib
+import io
+import json
+import os
+import re
+import tempfile
+from typing import Dict, List, Optional, Tuple
+
+from lib.apkg_reader import ApkgReader
+from lib.build_context import BuildContext, SilentTTS
+
+
+FIELD_PREVIEW = 60
+
+
+class NoteInfo:
+    """One note as stored in a package."""
+
+    def __init__(self, guid: str, model_id: int, fields: List[str]):
+        self.guid = guid
+        self.model_id = model_id
+        self.fields = fields
+
+    @property
+    def key(self) -> Tuple[int, str]:
+        """Fallback identity for notes whose GUID changed with their content."""
+        return self.model_id, self.fields[0] if self.fields else ""
+
+
+class PackageSummary:
+    """Models, notes and media of one package."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.models: Dict[int, Tuple[str, List[str]]] = {}
+        self.notes: List[NoteInfo] = []
+        # Anki keeps one note per GUID on import, so notes sharing a GUID
+        # never all arrive
+        self.guids: Dict[str, List[NoteInfo]] = {}
+        self.media: Dict[str, Tuple[int, str]] = {}  # filename -> (size, fingerprint)
+        self.decks: List[str] = []
+        self.collection_size = 0
+        self.package_size = os.path.getsize(path)
+
+    def add_note(self, note: NoteInfo) -> None:
+        self.notes.append(note)
+        self.guids.setdefault(note.guid, []).append(note)
+
+    @property
+    def duplicate_guids(self) -> Dict[str, List[NoteInfo]]:
+        """GUIDs shared by more than one note, with those notes."""
+        return {guid: notes for guid, notes in self.guids.items() if len(notes) > 1}
+
+
+def load_package(path: str) -> PackageSummary:
+    """Read a package's structure without extracting it."""
+    summary = PackageSummary(path)
+
+    with ApkgReader(path) as reader:
+        data = reader.collection_bytes()
+        summary.collection_size = len(data)
+        for entry, filename in reader.media_map().items():
+            summary.media[filename] = (reader.media_size(entry), reader.media_fingerprint(entry))
+
+        conn = reader.open_collection(data)
+
+    try:
+        models_json, decks_json = conn.execute("SELECT models, decks FROM col").fetchone()
+        for model_id, model in json.loads(models_json).items():
+            summary.models[int(model_id)] = (model["name"], [f["name"] for f in model["flds"]])
+        summary.decks = [d["name"] for d_id, d in json.loads(decks_json).items() if d_id != "1"]
+
+        for guid, model_id, flds in conn.execute("SELECT guid, mid, flds FROM notes ORDER BY id"):
+            summary.add_note(NoteInfo(guid, model_id, flds.split("\x1f")))
+    finally:
+        conn.close()
+
+    return summary
+
+
+# =============================================================================
+# BUILDING FROM SOURCES
+# =============================================================================
+
+def source_module_for(package_path: str) -> str:
+    """12_korean_grammar_intermediate.apkg -> korean_grammar_intermediate"""
+    name = os.path.splitext(os.path.basename(package_path))[0]
+    return re.sub(r"^\d+_", "", name).split(".part")[0]
+
+
+def build_from_source(module_name: str) -> PackageSummary:
+    """
+    Build a deck from its generator module, without audio, and load it.
+
+    Raises:
+        ValueError: if the module has no generate_deck(output_file=..., context=...)
+    """
+    module = importlib.import_module(module_name.replace(".py", ""))
+    if not hasattr(module, "generate_deck"):
+        raise ValueError(f"{module_name} has no generate_deck()")
+
+    fd, output_path = tempfile.mkstemp(suffix=".apkg")
+    os.close(fd)
+
+    try:
+        with BuildContext(tts=SilentTTS) as context, contextlib.redirect_stdout(io.StringIO()):
+            module.generate_deck(output_file=output_path, context=context)
+        summary = load_package(output_path)
+    finally:
+        os.remove(output_path)
+
+    # Silent clips carry no sizes worth comparing
+    summary.media = {name: (-1, "") for name in summary.media}
+    summary.path = f"{module.__name__}.py (sources)"
+    return summary
+
+
+# =============================================================================
+# DIFF
+# =============================================================================
+
+class PackageDiff:
+    """Note- and media-level differences between two packages."""
+
+    def __init__(self):
+        self.added: List[NoteInfo] = []
+        self.removed: List[NoteInfo] = []
+        self.changed: List[Tuple[NoteInfo, NoteInfo, List[int]]] = []
+        self.unchanged = 0
+        self.media_added: List[str] = []
+        self.media_removed: List[str] = []
+        self.media_changed: List[str] = []
+
+    @property
+    def empty(self) -> bool:
+        return not (self.added or self.removed or self.changed
+                    or self.media_added or self.media_removed or self.media_changed)
+
+
+def _media_differs(old: Tuple[int, str], new: Tuple[int, str]) -> bool:
+    """Compare fingerprints of the same kind, otherwise just sizes."""
+    if not old[1] or not new[1]:
+        return False
+    if old[1].split(":")[0] != new[1].split(":")[0]:
+        return old[0] != new[0]
+    return old != new
+
+
+def diff_packages(old: PackageSummary, new: PackageSummary) -> PackageDiff:
+    """
+    Compare two packages note by note.
+
+    Notes are matched by GUID first, in package order where a GUID is
+    duplicated. genanki derives GUIDs from field content, so notes left
+    over are matched again by model and first field and reported as
+    changed rather than removed and re-added.
+    """
+    diff = PackageDiff()
+
+    unmatched_old = {}
+    for guid, notes in old.guids.items():
+        others = new.guids.get(guid, [])
+        for note, other in zip(notes, others):
+            changed = [i for i, (a, b) in enumerate(zip(note.fields, other.fields)) if a != b]
+            if changed or len(note.fields) != len(other.fields):
+                diff.changed.append((note, other, changed))
+            else:
+                diff.unchanged += 1
+        for note in notes[len(others):]:
+            unmatched_old.setdefault(note.key, []).append(note)
+
+    for guid, notes in new.guids.items():
+        for note in notes[len(old.guids.get(guid, [])):]:
+            candidates = unmatched_old.get(note.key)
+            if candidates:
+                before = candidates.pop(0)
+                changed = [i for i in range(max(len(before.fields), len(note.fields)))
+                           if i >= len(before.fields) or i >= len(note.fields)
+                           or before.fields[i] != note.fields[i]]
+                diff.changed.append((before, note, changed))
+            else:
+                diff.added.append(note)
+
+    for notes in unmatched_old.values():
+        diff.removed.extend(notes)
+
+    for name, (size, fingerprint) in new.media.items():
+        if name not in old.media:
+            diff.media_added.append(name)
+        elif _media_differs(old.media[name], (size, fingerprint)):
+            diff.media_changed.append(name)
+    diff.media_removed = [name for name in old.media if name not in new.media]
+
+    return diff
+
+
+# =============================================================================
+# REPORTING
+# =============================================================================
+
+def _preview(value: str) -> str:
+    value = value.replace("\n", "\\n")
+    return value if len(value) <= FIELD_PREVIEW else value[:FIELD_PREVIEW - 1] + "…"
+
+
+def _kb(size: int) -> str:
+    return f"{size / 1024:.1f} KB"
+
+
+def format_summary(summary: PackageSummary, limit: Optional[int] = None) -> str:
+    """Human-readable listing of a package's models, notes and media."""
+    lines = [
+        f"{summary.path}: {_kb(summary.package_size)}",
+        f"  decks: {', '.join(summary.decks)}",
+        f"  collection: {_kb(summary.collection_size)}, {len(summary.notes)} notes, "
+        f"{len(summary.media)} media ({_kb(sum(size for size, _ in summary.media.values()))})",
+        "",
+        "Models:",
+    ]
+    counts: Dict[int, int] = {}
+    for note in summary.notes:
+        counts[note.model_id] = counts.get(note.model_id, 0) + 1
+    for model_id, (name, fields) in summary.models.items():
+        lines.append(f"  {model_id} {name}: {counts.get(model_id, 0)} notes, fields {', '.join(fields)}")
+
+    lines.append("")
+    lines.append("Notes:")
+    for i, note in enumerate(summary.notes):
+        if limit is not None and i >= limit:
+            lines.append(f"  ... {len(summary.notes) - limit} more")
+            break
+        size = sum(len(field.encode("utf-8")) for field in note.fields)
+        lines.append(f"  {note.guid:<12} {size:>6} B  {_preview(note.fields[0])}")
+
+    duplicates = _format_duplicates(summary)
+    if duplicates:
+        lines.append("")
+        lines.extend(duplicates)
+
+    lines.append("")
+    lines.append("Media:")
+    for i, (name, (size, _)) in enumerate(sorted(summary.media.items())):
+        if limit is not None and i >= limit:
+            lines.append(f"  ... {len(summary.media) - limit} more")
+            break
+        lines.append(f"  {name:<32} {_kb(size):>10}")
+
+    return "\n".join(lines)
+
+
+def _format_duplicates(summary: PackageSummary) -> List[str]:
+    """Lines reporting notes that share a GUID, which Anki would import as one."""
+    duplicates = summary.duplicate_guids
+    if not duplicates:
+        return []
+    lines = [f"Duplicate GUIDs: {len(duplicates)} ({sum(map(len, duplicates.values()))} notes; "
+             f"{len(summary.guids)} distinct GUIDs in all)"]
+    for guid, notes in duplicates.items():
+        lines.append(f"! {guid:<12} x{len(notes)}  " + " | ".join(_preview(note.fields[0]) for note in notes))
+    return lines
+
+
+def format_diff(old: PackageSummary, new: PackageSummary, diff: PackageDiff) -> str:
+    """Human-readable note and media diff."""
+    lines = [
+        f"--- {old.path}",
+        f"+++ {new.path}",
+        f"Notes: +{len(diff.added)} -{len(diff.removed)} ~{len(diff.changed)} ({diff.unchanged} unchanged)",
+    ]
+    for note in diff.added:
+        lines.append(f"+ {_preview(note.fields[0])}")
+    for note in diff.removed:
+        lines.append(f"- {_preview(note.fields[0])}")
+    for before, after, changed in diff.changed:
+        field_names = new.models.get(after.model_id, ("", []))[1]
+        lines.append(f"~ {_preview(after.fields[0])}")
+        for i in changed:
+            name = field_names[i] if i < len(field_names) else f"field {i}"
+            a = before.fields[i] if i < len(before.fields) else ""
+            b = after.fields[i] if i < len(after.fields) else ""
+            lines.append(f"    {name}: {_preview(a)!r} -> {_preview(b)!r}")
+
+    delta = (sum(new.media[n][0] for n in diff.media_added if new.media[n][0] > 0)
+             - sum(old.media[n][0] for n in diff.media_removed if old.media[n][0] > 0))
+    lines.append(
+        f"Media: +{len(diff.media_added)} -{len(diff.media_removed)} ~{len(diff.media_changed)}"
+        + (f" ({'+' if delta >= 0 else ''}{_kb(delta)})" if delta else "")
+    )
+    for name in diff.media_added:
+        lines.append(f"+ {name}")
+    for name in diff.media_removed:
+        lines.append(f"- {name}")
+    for name in diff.media_changed:
+        lines.append(f"~ {name} ({_kb(old.media[name][0])} -> {_kb(new.media[name][0])})")
+
+    for label, summary in (("Old", old), ("New", new)):
+        duplicates = _format_duplicates(summary)
+        if duplicates:
+            lines.append(f"{label} package: {duplicates[0]}")
+            lines.extend(duplicates[1:])
+
+    return "\n".join(lines)
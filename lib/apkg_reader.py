@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Read-only access to built .apkg packages.
+
+Opens the zip in place and loads the SQLite collection into memory, so
+packages can be examined or re-packed without extracting them to disk.
+Both the legacy layout and the newer anki21b layout (zstd-compressed
+collection and media, protobuf media manifest) are understood.
+"""
+
+import json
+import sqlite3
+import zipfile
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from lib import anki21b
+
+
+# Collection entry names, newest format first
+COLLECTION_NAMES = [anki21b.COLLECTION_NAME, "collection.anki21", anki21b.LEGACY_COLLECTION_NAME]
+
+
+class ApkgReader:
+    """Random access to the collection and media entries of one package."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.zip = zipfile.ZipFile(path)
+        self._names = set(self.zip.namelist())
+        self._media_map = None
+        self._manifest: Optional[Dict[str, Tuple[int, bytes]]] = None
+
+    def __enter__(self) -> "ApkgReader":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.zip.close()
+
+    @property
+    def collection_name(self) -> str:
+        """Name of the collection entry inside the zip."""
+        for name in COLLECTION_NAMES:
+            if name in self._names:
+                return name
+        raise ValueError(f"{self.path}: no collection in package")
+
+    @property
+    def version(self) -> int:
+        """Package format version from the meta entry (2 for legacy packages)."""
+        if "meta" in self._names:
+            return anki21b.decode_meta(self.zip.read("meta"))
+        return anki21b.VERSION_LEGACY_2
+
+    @property
+    def is_anki21b(self) -> bool:
+        return self.version >= anki21b.VERSION_LATEST
+
+    def collection_bytes(self) -> bytes:
+        """Raw bytes of the SQLite collection."""
+        data = self.zip.read(self.collection_name)
+        if self.collection_name == anki21b.COLLECTION_NAME:
+            data = anki21b.zstd().ZstdDecompressor().decompressobj().decompress(data)
+        return data
+
+    def open_collection(self, data: Optional[bytes] = None) -> sqlite3.Connection:
+        """Load the collection (or already-read collection bytes) into an in-memory SQLite database."""
+        conn = sqlite3.connect(":memory:")
+        conn.deserialize(self.collection_bytes() if data is None else data)
+        return conn
+
+    def _media_manifest(self) -> Dict[str, Tuple[int, bytes]]:
+        """Zip entry -> (size, sha1) from an anki21b media manifest."""
+        if self._manifest is None:
+            data = anki21b.zstd().ZstdDecompressor().decompressobj().decompress(self.zip.read("media"))
+            entries = anki21b.decode_media_entries(data)
+            self._manifest = {str(idx): (size, sha1) for idx, (_, size, sha1) in enumerate(entries)}
+            self._media_map = {str(idx): name for idx, (name, _, _) in enumerate(entries)}
+        return self._manifest
+
+    def media_map(self) -> Dict[str, str]:
+        """Map of zip entry name -> media filename."""
+        if self._media_map is None:
+            if "media" not in self._names:
+                self._media_map = {}
+            elif self.is_anki21b:
+                self._media_manifest()
+            else:
+                self._media_map = json.loads(self.zip.read("media") or b"{}")
+        return self._media_map
+
+    def media_size(self, entry: str) -> int:
+        """Uncompressed size of one media file."""
+        if self.is_anki21b:
+            return self._media_manifest()[entry][0]
+        return self.zip.getinfo(entry).file_size
+
+    def media_fingerprint(self, entry: str) -> str:
+        """
+        Content fingerprint of one media file, without reading it.
+
+        Legacy packages give the zip CRC ("crc:..."), anki21b packages the
+        manifest SHA-1 ("sha1:..."); only fingerprints of the same kind
+        are comparable.
+        """
+        if self.is_anki21b:
+            return "sha1:" + self._media_manifest()[entry][1].hex()
+        return f"crc:{self.zip.getinfo(entry).CRC:08x}"
+
+    def media(self) -> Iterator[Tuple[str, str, int]]:
+        """Yield (zip entry, media filename, size) for every media file."""
+        for entry, filename in self.media_map().items():
+            yield entry, filename, self.media_size(entry)
+
+    def media_names(self) -> List[str]:
+        """Media filenames shipped in this package."""
+        return list(self.media_map().values())
+
+    def read_media(self, entry: str) -> bytes:
+        """Bytes of one media file, by zip entry name."""
+        data = self.zip.read(entry)
+        if self.is_anki21b:
+            data = anki21b.zstd().ZstdDecompressor().decompressobj().decompress(data)
+        return data
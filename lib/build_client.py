@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+Client side of the build daemon (see lib.build_daemon).
+
+Kept free of build imports, so a client process starts in milliseconds.
+"""
+
+import json
+import os
+import socket
+from typing import Any, Dict, Optional
+
+
+DEFAULT_SOCKET = os.path.join(".build_cache", "daemon.sock")
+
+
+def request(socket_path: str, message: Dict[str, Any], timeout: Optional[float] = None) -> Dict[str, Any]:
+    """Send one request to a daemon and return its response."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(socket_path)
+        sock.sendall(json.dumps(message, ensure_ascii=False).encode("utf-8") + b"\n")
+        with sock.makefile("rb") as reader:
+            return json.loads(reader.readline())
+
+
+def ping(socket_path: str) -> bool:
+    """True if a daemon answers on the socket."""
+    try:
+        return request(socket_path, {"command": "status"}, timeout=2).get("ok", False)
+    except (OSError, ValueError):
+        return False
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Per-build state for deck generation.
+
+A BuildContext owns everything one deck build used to keep in module
+globals: the temporary audio directory, the list of media files written,
+the text -> clip cache and build statistics. Generators receive it and
+pass it down to note construction, so several decks can be built at once
+in the same process, each with its own context.
+
+With a cache_dir, synthesized clips are also kept across builds, keyed by
+TTS backend, language and text, so a rebuild only calls TTS for text it
+has not spoken before. The same directory holds each deck's stage cache
+(see lib.stage_cache) and the content repository decks read their rows
+from (see lib.content_repo):
+
+    <cache_dir>/audio/<key>.mp3
+    <cache_dir>/stages/<deck id>.json
+    <cache_dir>/content.db
+"""
+
+import contextlib
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from gtts import gTTS
+
+from lib.content_repo import DEFAULT_FILENAME as CONTENT_FILENAME, ContentRepository
+from lib.stage_cache import StageCache, StageStats
+
+
+def clip_name(text: str) -> str:
+    """Default clip filename: a hash of the text, so equal texts share a clip."""
+    text_hash = hashlib.md5(text.encode('utf-8')).hexdigest()[:8]
+    return f"audio_{text_hash}.mp3"
+
+
+class SilentTTS:
+    """Drop-in for gTTS that writes an empty clip instead of calling the API."""
+
+    def __init__(self, text: str = "", lang: str = "ko", **kwargs):
+        self.text = text
+
+    def save(self, path: str) -> None:
+        open(path, "wb").close()
+
+
+class BuildStats:
+    """Counters for one build."""
+
+    def __init__(self):
+        self.audio_generated = 0
+        self.audio_reused = 0
+        self.audio_cached = 0
+        self.audio_failed = 0
+        self.tts_seconds = 0.0
+        self.notes = 0
+        self.stage_seconds: Dict[str, float] = {}
+        self.stages = StageStats()
+
+    def __repr__(self) -> str:
+        return (f"BuildStats(generated={self.audio_generated}, reused={self.audio_reused}, "
+                f"cached={self.audio_cached}, failed={self.audio_failed}, tts={self.tts_seconds:.1f}s)")
+
+
+class BuildContext:
+    """
+    Audio directory, media registry, caches and stats of one deck build.
+
+    Example:
+        >>> with BuildContext() as context:
+        ...     filename = context.audio("안녕하세요")
+        ...     write_package(deck, context.media_files, "decks/x.apkg")
+    """
+
+    def __init__(
+        self,
+        audio_dir: Optional[str] = None,
+        tts: Optional[Callable[..., Any]] = None,
+        lang: str = "ko",
+        cache_dir: Optional[str] = None,
+    ):
+        """
+        Args:
+            audio_dir: Where to write clips (default: a fresh temporary
+                directory, removed on close)
+            tts: gTTS-compatible factory, called as tts(text=..., lang=...)
+            lang: TTS language
+            cache_dir: Directory of clips and stage outputs kept across
+                builds (default: none)
+        """
+        self._owns_dir = audio_dir is None
+        self.audio_dir = audio_dir or tempfile.mkdtemp()
+        self.tts = tts or gTTS
+        self.lang = lang
+        self.cache_dir = cache_dir
+        self.clip_dir = os.path.join(cache_dir, "audio") if cache_dir else None
+        if self.clip_dir:
+            os.makedirs(self.clip_dir, exist_ok=True)
+        self.media_files: List[str] = []
+        self.stats = BuildStats()
+        self._audio_cache: Dict[str, Optional[str]] = {}
+        self._content: Optional[ContentRepository] = None
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "BuildContext":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Remove the audio directory if this context created it."""
+        if self._content is not None:
+            self._content.close()
+            self._content = None
+        if self._owns_dir:
+            try:
+                shutil.rmtree(self.audio_dir)
+            except:
+                pass
+
+    def add_media_file(self, path: str) -> None:
+        """Register a media file written outside of audio()."""
+        with self._lock:
+            self.media_files.append(path)
+
+    def release_media(self) -> List[str]:
+        """
+        Hand over the media registered so far and forget it.
+
+        For builds that package media as they go (see lib.ingest): the
+        files stay in the audio directory, but the context no longer
+        remembers them or which texts it has spoken.
+        """
+        with self._lock:
+            media, self.media_files = self.media_files, []
+            self._audio_cache.clear()
+        return media
+
+    def audio(self, text: str, filename: Optional[str] = None) -> Optional[str]:
+        """
+        Generate a TTS clip for Korean text, once per text.
+
+        Args:
+            text: Text to speak
+            filename: Clip filename (default: audio_<md5 prefix>.mp3)
+
+        Returns:
+            The clip filename, or None if there is no text or TTS failed
+        """
+        if not text:
+            return None
+
+        key = f"{filename}\x1f{text}" if filename else text
+        with self._lock:
+            if key in self._audio_cache:
+                self.stats.audio_reused += 1
+                return self._audio_cache[key]
+
+        if filename is None:
+            filename = clip_name(text)
+        audio_path = os.path.join(self.audio_dir, filename)
+
+        cached = self._clip_cache_path(text)
+        if cached and os.path.exists(cached):
+            _link_or_copy(cached, audio_path)
+            with self._lock:
+                self.stats.audio_cached += 1
+                self.media_files.append(audio_path)
+                self._audio_cache[key] = filename
+            return filename
+
+        start = time.perf_counter()
+        try:
+            self.tts(text=text, lang=self.lang).save(audio_path)
+            if cached:
+                # Publish atomically; concurrent builds may cache the same clip
+                tmp_path = f"{cached}.{os.getpid()}.{threading.get_ident()}.tmp"
+                shutil.copyfile(audio_path, tmp_path)
+                os.replace(tmp_path, cached)
+        except Exception as e:
+            print(f"Warning: Could not generate audio for '{text}': {e}")
+            filename = None
+        elapsed = time.perf_counter() - start
+
+        with self._lock:
+            self.stats.tts_seconds += elapsed
+            if filename is None:
+                self.stats.audio_failed += 1
+            else:
+                self.stats.audio_generated += 1
+                self.media_files.append(audio_path)
+            self._audio_cache[key] = filename
+        return filename
+
+    def audio_key(self, text: str) -> str:
+        """What a clip depends on: TTS backend, language and text."""
+        backend = getattr(self.tts, "__name__", type(self.tts).__name__)
+        return hashlib.sha1(f"{backend}\x1f{self.lang}\x1f{text}".encode("utf-8")).hexdigest()
+
+    def has_cached_clip(self, text: str) -> bool:
+        """True if audio(text) would be served from the cross-build cache."""
+        path = self._clip_cache_path(text)
+        return bool(path) and os.path.exists(path)
+
+    def _clip_cache_path(self, text: str) -> Optional[str]:
+        if not self.clip_dir:
+            return None
+        return os.path.join(self.clip_dir, f"{self.audio_key(text)[:20]}.mp3")
+
+    def stage_cache(self, name: str) -> StageCache:
+        """The stage cache of one deck; empty and unsaved without a cache_dir."""
+        if not self.cache_dir:
+            return StageCache()
+        return StageCache.open(os.path.join(self.cache_dir, "stages", f"{name}.json"))
+
+    def content(self) -> Optional[ContentRepository]:
+        """The content repository in the cache_dir, opened once; None without a cache_dir."""
+        if not self.cache_dir:
+            return None
+        with self._lock:
+            if self._content is None:
+                self._content = ContentRepository(os.path.join(self.cache_dir, CONTENT_FILENAME))
+            return self._content
+
+
+def _link_or_copy(source: str, dest: str) -> None:
+    try:
+        os.link(source, dest)
+    except OSError:
+        shutil.copyfile(source, dest)
+
+
+@contextlib.contextmanager
+def build_context(context: Optional[BuildContext] = None) -> Iterator[BuildContext]:
+    """
+    Use the caller's context, or a fresh one closed on exit.
+
+    Generators take an optional context; this lets them run standalone
+    and inside a larger build alike.
+    """
+    if context is not None:
+        yield context
+        return
+    with BuildContext() as context:
+        yield context
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Long-lived build server that keeps a warm interpreter between builds.
+
+A one-off build pays for interpreter startup, importing genanki and gTTS,
+importing every generator, creating every model and reading the stage
+caches. The daemon does that once and then builds decks on request over
+a Unix socket, so an edit-and-rebuild loop costs only the build itself.
+
+Before each request, source files of loaded repository modules are
+checked for changes. A changed module is reloaded, and so is every
+loaded module importing it, dependencies first. Modules that import each
+other are reloaded together, as one unit. A module first imported since
+the last check is current and is only recorded. A change to this module
+itself needs a daemon restart.
+
+Protocol: one JSON object per line. The client sends a request and reads
+one response, then the connection closes.
+
+    {"command": "build", "decks": ["korean_numbers"]}
+    {"command": "status"}
+    {"command": "stop"}
+"""
+
+import importlib
+import json
+import os
+import socketserver
+import sys
+import threading
+import time
+from graphlib import TopologicalSorter
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from lib import build_runner, deck_spec
+from lib.build_client import ping
+from lib.watch import local_imports, snapshot
+
+
+def result_to_json(result: "build_runner.DeckResult") -> Dict[str, Any]:
+    return {
+        "module": result.module,
+        "ok": result.ok,
+        "seconds": round(result.seconds, 4),
+        "notes": result.notes,
+        "cards": result.cards,
+        "media": result.media,
+        "tts": result.stats.audio_generated,
+        "stages": result.stats.stages.format(),
+        "output_paths": result.output_paths,
+        "error": result.error,
+        "log": result.log,
+    }
+
+
+def _components(graph: Dict[str, Set[str]]) -> List[List[str]]:
+    """Strongly connected components of a dependency graph (Tarjan's algorithm), members sorted."""
+    index: Dict[str, int] = {}
+    low: Dict[str, int] = {}
+    stack: List[str] = []
+    on_stack: Set[str] = set()
+    components: List[List[str]] = []
+
+    def visit(name: str) -> None:
+        index[name] = low[name] = len(index)
+        stack.append(name)
+        on_stack.add(name)
+        for other in sorted(graph[name]):
+            if other not in index:
+                visit(other)
+                low[name] = min(low[name], low[other])
+            elif other in on_stack:
+                low[name] = min(low[name], index[other])
+        if low[name] == index[name]:
+            members = []
+            while True:
+                member = stack.pop()
+                on_stack.discard(member)
+                members.append(member)
+                if member == name:
+                    break
+            components.append(sorted(members))
+
+    for name in sorted(graph):
+        if name not in index:
+            visit(name)
+    return components
+
+
+class BuildDaemon:
+    """
+    Builds decks in this process, keeping modules, models and caches loaded.
+
+    Example:
+        >>> daemon = BuildDaemon(ROOT, cache_dir=".build_cache")
+        >>> daemon.serve(".build_cache/daemon.sock")
+    """
+
+    def __init__(self, root: str, cache_dir: Optional[str] = None, tts: Optional[Callable[..., Any]] = None):
+        """
+        Args:
+            root: Repository root; generators are built relative to it
+            cache_dir: Clip and stage cache (see BuildContext)
+            tts: TTS factory (default: gTTS)
+        """
+        self.root = os.path.abspath(root)
+        self.cache_dir = cache_dir
+        self.tts = tts
+        self.started = time.time()
+        self.builds = 0
+        self.reloads = 0
+        self._server: Optional[socketserver.UnixStreamServer] = None
+        self._mtimes: Dict[str, int] = {}
+        self._imports: Dict[str, Tuple[int, Set[str]]] = {}
+
+    # -------------------------------------------------------------------------
+    # Warm state
+    # -------------------------------------------------------------------------
+
+    def _repo_modules(self) -> Dict[str, str]:
+        """Loaded module name -> source file, for importable modules of this repository."""
+        modules = {}
+        for name, module in list(sys.modules.items()):
+            path = getattr(module, "__file__", None)
+            # Scripts (__main__ and its multiprocessing alias) have no spec to reload from
+            if getattr(module, "__spec__", None) is None:
+                continue
+            if path and path.endswith(".py") and os.path.abspath(path).startswith(self.root + os.sep):
+                modules[name] = os.path.abspath(path)
+        return modules
+
+    def warm_up(self) -> List[str]:
+        """Import every generator and create its model. Returns the generators."""
+        modules = build_runner.discover_generators(self.root)
+        for name in modules:
+            spec = getattr(importlib.import_module(name), "DECK_SPEC", None)
+            if spec is not None:
+                deck_spec.deck_model(spec)
+        self._mtimes = snapshot(self._repo_modules().values())
+        return modules
+
+    def refresh(self) -> List[str]:
+        """Reload modules whose source changed, and their importers. Returns the reloaded names."""
+        loaded = self._repo_modules()
+        now = snapshot(loaded.values())
+        # Modules imported since the last check (during a build) were loaded from their current source
+        changed = {path for path, mtime in now.items() if path in self._mtimes and self._mtimes[path] != mtime}
+        if not changed:
+            self._mtimes = now
+            return []
+
+        imports = {name: self._local_imports(path, now.get(path)) for name, path in loaded.items()}
+        stale = {name for name, path in loaded.items() if path in changed}
+        while True:
+            stale_files = {loaded[name] for name in stale}
+            importers = {name for name in loaded if imports[name] & stale_files} - stale
+            if not importers:
+                break
+            stale |= importers
+        # The daemon cannot swap itself out while serving
+        stale.discard(__name__)
+
+        # Dependencies first, so importers bind the reloaded objects; a cycle
+        # is one node, reloaded twice so each member binds the others' new objects
+        graph = {name: {other for other in stale if other != name and loaded[other] in imports[name]}
+                 for name in stale}
+        components = _components(graph)
+        component_of = {name: index for index, members in enumerate(components) for name in members}
+        order = []
+        for index in TopologicalSorter({
+            index: {component_of[other] for name in members for other in graph[name]} - {index}
+            for index, members in enumerate(components)
+        }).static_order():
+            members = components[index]
+            for _ in range(2 if len(members) > 1 else 1):
+                for name in members:
+                    importlib.reload(sys.modules[name])
+            order.extend(members)
+        self.reloads += len(order)
+        self._mtimes = snapshot(self._repo_modules().values())
+        return order
+
+    def _local_imports(self, path: str, mtime: Optional[int]) -> Set[str]:
+        """local_imports(), parsed again only when the file changed."""
+        cached = self._imports.get(path)
+        if cached is None or cached[0] != mtime:
+            cached = self._imports[path] = (mtime, local_imports(path, self.root))
+        return cached[1]
+
+    # -------------------------------------------------------------------------
+    # Requests
+    # -------------------------------------------------------------------------
+
+    def build(self, decks: List[str]) -> Dict[str, Any]:
+        reloaded = self.refresh()
+        available = build_runner.discover_generators(self.root)
+        modules = [name.replace(".py", "") for name in decks] or available
+        unknown = [name for name in modules if name not in available]
+        if unknown:
+            return {"ok": False, "error": f"unknown generator(s): {', '.join(unknown)}"}
+
+        start = time.perf_counter()
+        results = [build_runner.build_deck(name, tts=self.tts, cache_dir=self.cache_dir) for name in modules]
+        self.builds += len(results)
+        return {
+            "ok": all(result.ok for result in results),
+            "reloaded": reloaded,
+            "seconds": round(time.perf_counter() - start, 4),
+            "results": [result_to_json(result) for result in results],
+        }
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "ok": True,
+            "pid": os.getpid(),
+            "uptime": round(time.time() - self.started, 1),
+            "builds": self.builds,
+            "reloads": self.reloads,
+            "modules": len(self._repo_modules()),
+        }
+
+    def handle(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        command = request.get("command")
+        if command == "build":
+            return self.build(request.get("decks") or [])
+        if command == "status":
+            return self.status()
+        if command == "stop":
+            # shutdown() waits for serve_forever(), which is running this request
+            threading.Thread(target=self._server.shutdown).start()
+            return {"ok": True}
+        return {"ok": False, "error": f"unknown command {command!r}"}
+
+    def serve(self, socket_path: str) -> None:
+        """Serve requests until a stop request arrives."""
+        if os.path.exists(socket_path):
+            if ping(socket_path):
+                raise RuntimeError(f"a build daemon is already listening on {socket_path}")
+            os.remove(socket_path)
+        os.makedirs(os.path.dirname(socket_path) or ".", exist_ok=True)
+
+        daemon = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                line = self.rfile.readline()
+                try:
+                    response = daemon.handle(json.loads(line))
+                except Exception as e:
+                    response = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+                self.wfile.write(json.dumps(response, ensure_ascii=False).encode("utf-8") + b"\n")
+
+        with socketserver.UnixStreamServer(socket_path, Handler) as server:
+            self._server = server
+            try:
+                server.serve_forever()
+            finally:
+                try:
+                    os.remove(socket_path)
+                except:
+                    pass
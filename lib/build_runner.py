@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Parallel build of every deck generator.
+
+Generator modules are the top-level korean_*.py files that define
+generate_deck(output_file=...). Each one is built in its own worker
+process, so a full rebuild takes about as long as the slowest deck.
+Counts are read back from the finished package rather than from the
+generator's console output.
+"""
+
+import contextlib
+import glob
+import importlib
+import inspect
+import io
+import multiprocessing
+import os
+import re
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Callable, Iterable, List, Optional
+
+from lib.apkg_reader import ApkgReader
+from lib.build_context import BuildContext, BuildStats
+from lib.sharding import shard_path
+
+
+GENERATOR_GLOB = "korean_*.py"
+GENERATE_RE = re.compile(r"^def generate_deck\(", re.MULTILINE)
+
+
+class DeckResult:
+    """Outcome of building one deck."""
+
+    def __init__(self, module: str):
+        self.module = module
+        self.output_paths: List[str] = []
+        self.ok = False
+        self.seconds = 0.0
+        self.notes = 0
+        self.cards = 0
+        self.media = 0
+        self.stats = BuildStats()
+        self.error = ""
+        self.log = ""
+
+
+def discover_generators(root: str) -> List[str]:
+    """Module names of every generator in `root`, in deck order of their output files."""
+    modules = []
+    for path in glob.glob(os.path.join(root, GENERATOR_GLOB)):
+        with open(path, encoding="utf-8") as f:
+            if GENERATE_RE.search(f.read()):
+                modules.append(os.path.splitext(os.path.basename(path))[0])
+    return sorted(modules, key=lambda name: (default_output(root, name) or "", name))
+
+
+def default_output(root: str, module_name: str) -> Optional[str]:
+    """The output_file default of a generator, read from its source."""
+    with open(os.path.join(root, module_name + ".py"), encoding="utf-8") as f:
+        match = re.search(r'^def generate_deck\(output_file="([^"]+)"', f.read(), re.MULTILINE)
+    return match.group(1) if match else None
+
+
+def package_outputs(output_file: str) -> List[str]:
+    """The package a build wrote, or its shards if the deck was sharded."""
+    if os.path.exists(output_file):
+        return [output_file]
+    shards = []
+    while os.path.exists(shard_path(output_file, len(shards) + 1)):
+        shards.append(shard_path(output_file, len(shards) + 1))
+    return shards
+
+
+def count_package(result: DeckResult) -> None:
+    """Fill in note, card and media counts from the written packages."""
+    for path in result.output_paths:
+        with ApkgReader(path) as reader:
+            result.media += len(reader.media_map())
+            conn = reader.open_collection()
+        try:
+            result.notes += conn.execute("SELECT count(*) FROM notes").fetchone()[0]
+            result.cards += conn.execute("SELECT count(*) FROM cards").fetchone()[0]
+        finally:
+            conn.close()
+
+
+def build_deck(
+    module_name: str,
+    output_dir: Optional[str] = None,
+    tts: Optional[Callable[..., Any]] = None,
+    cache_dir: Optional[str] = None,
+) -> DeckResult:
+    """
+    Import a generator and run its generate_deck().
+
+    Never raises; failures are reported on the returned result with the
+    traceback and whatever the generator printed.
+
+    Args:
+        module_name: Generator module
+        output_dir: Write the package here instead of its default location
+        tts: TTS factory for the build context (default: gTTS)
+        cache_dir: Clip cache kept across builds (see BuildContext)
+    """
+    result = DeckResult(module_name)
+    output = io.StringIO()
+    start = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(output):
+            module = importlib.import_module(module_name)
+            output_file = inspect.signature(module.generate_deck).parameters["output_file"].default
+            if output_dir:
+                output_file = os.path.join(output_dir, os.path.basename(output_file))
+            with BuildContext(tts=tts, cache_dir=cache_dir) as context:
+                module.generate_deck(output_file=output_file, context=context)
+            result.stats = context.stats
+        result.seconds = time.perf_counter() - start
+        result.output_paths = package_outputs(output_file)
+        if not result.output_paths:
+            raise FileNotFoundError(f"{module_name} wrote no package at {output_file}")
+        count_package(result)
+        result.ok = True
+    except Exception:
+        result.seconds = time.perf_counter() - start
+        result.error = traceback.format_exc()
+    result.log = output.getvalue()
+    return result
+
+
+def build_all(
+    modules: Iterable[str],
+    workers: Optional[int] = None,
+    on_result: Optional[Callable[[DeckResult], None]] = None,
+    cache_dir: Optional[str] = None,
+    fresh_processes: bool = False,
+) -> List[DeckResult]:
+    """
+    Build decks in a process pool sized to the machine.
+
+    Args:
+        modules: Generator module names
+        workers: Worker processes (default: CPU count)
+        on_result: Called with each result as soon as its deck finishes
+        cache_dir: Clip cache kept across builds (see BuildContext)
+        fresh_processes: Start workers with a clean interpreter instead of
+            forking, so they import the current source of every module
+
+    Returns:
+        Results in the order the modules were given
+    """
+    modules = list(modules)
+    results = {}
+    mp_context = multiprocessing.get_context("spawn") if fresh_processes else None
+    workers = min(workers or os.cpu_count() or 1, max(len(modules), 1))
+    with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context) as pool:
+        futures = {pool.submit(build_deck, name, cache_dir=cache_dir): name for name in modules}
+        for future in as_completed(futures):
+            result = future.result()
+            results[result.module] = result
+            if on_result:
+                on_result(result)
+    return [results[name] for name in modules]
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Columnar, string-interned storage for deck rows and notes.
+
+A list of tuples holds one pointer per field per row plus every string
+object the rows were built from; parsed data repeats the same values
+as separate objects (a section label on every row, shared romanization
+and example strings). CardStore keeps each distinct value once, in a
+StringTable, and each field as an array of 4-byte indexes into it:
+
+    strings   ["Future Tense", "가다", "갔어요", ...]
+    columns   category  [0, 0, 0, ...]
+              korean    [1, 5, 9, ...]
+
+Rows are rebuilt only when read, so assembling notes touches one row at
+a time; column() exposes a field's indexes as a memoryview without
+copying, and view() reads one field's values lazily.
+"""
+
+from array import array
+from typing import Any, Dict, Hashable, Iterator, List, NamedTuple, Optional, Sequence, Type
+
+
+def _hashable(value: Any) -> Hashable:
+    """Lists (word_pairs) as tuples, so they intern like strings."""
+    if isinstance(value, list):
+        return tuple(_hashable(item) for item in value)
+    return value
+
+
+class StringTable:
+    """Distinct values, each stored once and addressed by index."""
+
+    def __init__(self, values: Sequence[Any] = ()):
+        self.values: List[Any] = []
+        self._index: Dict[Hashable, int] = {}
+        for value in values:
+            self.intern(value)
+
+    def intern(self, value: Any) -> int:
+        """Index of value, adding it if new."""
+        value = _hashable(value)
+        index = self._index.get(value)
+        if index is None:
+            index = self._index[value] = len(self.values)
+            self.values.append(value)
+        return index
+
+    def __getitem__(self, index: int) -> Any:
+        return self.values[index]
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+class ColumnView:
+    """One field of a CardStore, read lazily."""
+
+    def __init__(self, ids: array, strings: StringTable):
+        self._ids = ids
+        self._values = strings.values
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __getitem__(self, index: int) -> Any:
+        return self._values[self._ids[index]]
+
+    def __iter__(self) -> Iterator[Any]:
+        values = self._values
+        return (values[i] for i in self._ids)
+
+
+class CardStore:
+    """
+    Rows stored as one index array per field over a shared StringTable.
+
+    Several stores can share a table, so a value repeated across the
+    sections of a deck, or between rows and notes, is kept once.
+
+    Example:
+        >>> store = CardStore(WordRow._fields, row_type=WordRow)
+        >>> store.extend(records)
+        >>> store[0]
+        WordRow(korean='저', english='I / me (humble)', ...)
+        >>> list(store.view("korean"))[:2]
+        ['저', '나']
+    """
+
+    def __init__(
+        self,
+        fields: Sequence[str],
+        strings: Optional[StringTable] = None,
+        row_type: Optional[Type[NamedTuple]] = None,
+    ):
+        """
+        Args:
+            fields: Field names, in row order
+            strings: Table to intern values in (default: a new one)
+            row_type: Class rows are returned as (default: tuple)
+        """
+        self.fields = list(fields)
+        self.strings = strings if strings is not None else StringTable()
+        self.row_type = row_type
+        self._columns = [array("I") for _ in self.fields]
+
+    def append(self, row: Sequence[Any]) -> None:
+        if len(row) != len(self.fields):
+            raise ValueError(f"row has {len(row)} values for {len(self.fields)} fields: {row!r}")
+        intern = self.strings.intern
+        for column, value in zip(self._columns, row):
+            column.append(intern(value))
+
+    def extend(self, rows: Iterator[Sequence[Any]]) -> "CardStore":
+        for row in rows:
+            self.append(row)
+        return self
+
+    def __len__(self) -> int:
+        return len(self._columns[0]) if self._columns else 0
+
+    def __getitem__(self, index: int) -> Any:
+        values = self.strings.values
+        row = [values[column[index]] for column in self._columns]
+        return self.row_type._make(row) if self.row_type else tuple(row)
+
+    def __iter__(self) -> Iterator[Any]:
+        values = self.strings.values
+        make = self.row_type._make if self.row_type else tuple
+        for ids in zip(*self._columns):
+            yield make([values[i] for i in ids])
+
+    def column(self, name: str) -> memoryview:
+        """A field's string indexes, without copying."""
+        return memoryview(self._columns[self.fields.index(name)])
+
+    def view(self, name: str) -> ColumnView:
+        """A field's values, read lazily."""
+        return ColumnView(self._columns[self.fields.index(name)], self.strings)
+
+    def nbytes(self) -> int:
+        """Size of the index arrays (the strings are shared)."""
+        return sum(column.itemsize * len(column) for column in self._columns)
+
+    def to_json(self) -> Dict[str, Any]:
+        """JSON-friendly form, with only the values this store uses."""
+        used = StringTable()
+        columns = [[used.intern(self.strings.values[i]) for i in column] for column in self._columns]
+        return {"fields": self.fields, "strings": used.values, "columns": columns}
+
+    @classmethod
+    def from_json(
+        cls,
+        data: Dict[str, Any],
+        strings: Optional[StringTable] = None,
+        row_type: Optional[Type[NamedTuple]] = None,
+    ) -> "CardStore":
+        """A store saved by to_json(), interning into `strings`."""
+        store = cls(data["fields"], strings, row_type)
+        remap = array("I", (store.strings.intern(value) for value in data["strings"]))
+        for column, ids in zip(store._columns, data["columns"]):
+            column.extend(remap[i] for i in ids)
+        return store
@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""
+SQLite repository of every deck's content, indexed for queries.
+
+The data files (see lib.data_files) are what is edited and reviewed;
+the repository is imported from them and answers what they cannot
+without reading every table: which decks teach a word, where a
+romanization is used, which entries repeat across decks. Builds read
+section rows from it too, by an indexed query per section.
+
+    decks       deck_id, generator module, name
+    sections    one per Section of a deck, with the rows_key it was
+                imported at
+    entries     one per record, in section order: its Korean text,
+                English and romanization, and every field as JSON
+    examples    an entry's example sentence and its translation
+    word_pairs  an entry's aligned (korean, english) parts
+    audio       text an entry speaks and its clip filename
+
+Which row field is an entry's Korean, English or romanization is read
+from the field names (KOREAN_FIELDS, ...); rows without one fall back to
+the text they speak.
+
+Imports are incremental: a section whose rows_key is unchanged is left
+alone, so keeping the repository current costs one digest per data file.
+Each import runs in one BEGIN IMMEDIATE transaction, so parallel deck
+builds can share the file.
+"""
+
+import importlib
+import json
+import os
+import sqlite3
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+DEFAULT_FILENAME = "content.db"
+
+# Candidate row fields for an entry's columns, in order of preference
+KOREAN_FIELDS = ("korean", "korean_char", "character", "dict_form", "plain", "particle", "form", "prompt")
+ENGLISH_FIELDS = ("english", "meaning", "name")
+ROMANIZATION_FIELDS = ("romanization", "roman", "pronunciation")
+EXAMPLE_FIELDS = (("example", "example_translation"), ("example", "ex_trans"), ("example", None))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS decks (
+    id INTEGER PRIMARY KEY,
+    module TEXT,
+    name TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sections (
+    id INTEGER PRIMARY KEY,
+    deck_id INTEGER NOT NULL REFERENCES decks (id),
+    position INTEGER NOT NULL,
+    label TEXT NOT NULL,
+    row_type TEXT NOT NULL,
+    rows_key TEXT NOT NULL,
+    UNIQUE (deck_id, label)
+);
+CREATE TABLE IF NOT EXISTS entries (
+    id INTEGER PRIMARY KEY,
+    section_id INTEGER NOT NULL REFERENCES sections (id),
+    position INTEGER NOT NULL,
+    korean TEXT,
+    english TEXT,
+    romanization TEXT,
+    fields TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS examples (
+    entry_id INTEGER PRIMARY KEY REFERENCES entries (id),
+    korean TEXT NOT NULL,
+    english TEXT
+);
+CREATE TABLE IF NOT EXISTS word_pairs (
+    entry_id INTEGER NOT NULL REFERENCES entries (id),
+    position INTEGER NOT NULL,
+    korean TEXT NOT NULL,
+    english TEXT NOT NULL,
+    PRIMARY KEY (entry_id, position)
+);
+CREATE TABLE IF NOT EXISTS audio (
+    entry_id INTEGER PRIMARY KEY REFERENCES entries (id),
+    text TEXT NOT NULL,
+    filename TEXT
+);
+CREATE INDEX IF NOT EXISTS ix_sections_deck ON sections (deck_id, position);
+CREATE INDEX IF NOT EXISTS ix_entries_section ON entries (section_id, position);
+CREATE INDEX IF NOT EXISTS ix_entries_korean ON entries (korean);
+CREATE INDEX IF NOT EXISTS ix_entries_romanization ON entries (romanization COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS ix_examples_korean ON examples (korean);
+CREATE INDEX IF NOT EXISTS ix_word_pairs_korean ON word_pairs (korean);
+CREATE INDEX IF NOT EXISTS ix_audio_text ON audio (text);
+"""
+
+# Where an entry is, for query results
+_PLACE = """
+    SELECT d.id, d.module, d.name, s.label, e.position, e.korean, e.english, e.romanization
+    FROM entries e JOIN sections s ON s.id = e.section_id JOIN decks d ON d.id = s.deck_id
+"""
+_PLACE_COLUMNS = ("deck_id", "module", "deck_name", "section", "position", "korean", "english", "romanization")
+
+
+def _first(record: Any, names: Sequence[str]) -> Optional[str]:
+    for name in names:
+        value = getattr(record, name, None)
+        if isinstance(value, str) and value:
+            return value
+    return None
+
+
+def _example(record: Any) -> Optional[Tuple[str, Optional[str]]]:
+    for korean, english in EXAMPLE_FIELDS:
+        text = getattr(record, korean, None)
+        if isinstance(text, str) and text:
+            return text, getattr(record, english, None) if english else None
+    return None
+
+
+class ContentRepository:
+    """
+    The content of every deck in one SQLite file.
+
+    Example:
+        >>> repo = ContentRepository(".build_cache/content.db")
+        >>> repo.import_modules(discover_generators(ROOT))
+        >>> [hit["deck_name"] for hit in repo.find("먹다")]
+        ['14. Korean Common Verbs - 자주 쓰는 동사', ...]
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: Database file, created with its schema if missing
+        """
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=60, isolation_level=None, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "ContentRepository":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _transaction(self, fn):
+        """Run fn(conn) in a write transaction; concurrent writers wait."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                result = fn(self._conn)
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+            return result
+
+    def _query(self, sql: str, params: Sequence[Any] = ()) -> List[tuple]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    # -------------------------------------------------------------------------
+    # Import
+    # -------------------------------------------------------------------------
+
+    def import_deck(self, spec, module: Optional[str] = None) -> int:
+        """
+        Bring one deck up to date with its spec.
+
+        Sections whose rows_key changed (or that are new) are reimported;
+        sections the spec no longer has are removed.
+
+        Args:
+            spec: The deck's lib.deck_spec.DeckSpec
+            module: Generator module, for partial rebuilds (default: keep
+                what an earlier import recorded)
+
+        Returns:
+            How many sections were reimported
+        """
+        # Keys and records are worked out before the write lock is taken
+        current = {label: key for label, key in self._query(
+            "SELECT s.label, s.rows_key FROM sections s WHERE s.deck_id = ?", (spec.deck_id,))}
+        stale = [(position, section, section.rows_key()) for position, section in enumerate(spec.sections)]
+        stale = [(position, section, key, section.records())
+                 for position, section, key in stale if current.get(section.label) != key]
+        labels = [section.label for section in spec.sections]
+
+        def write(conn):
+            conn.execute(
+                "INSERT INTO decks (id, module, name) VALUES (?, ?, ?) ON CONFLICT (id) DO UPDATE "
+                "SET name = excluded.name, module = COALESCE(excluded.module, decks.module)",
+                (spec.deck_id, module, spec.deck_name),
+            )
+            gone = [row[0] for row in conn.execute("SELECT id, label FROM sections WHERE deck_id = ?",
+                                                   (spec.deck_id,)) if row[1] not in labels]
+            for section_id in gone:
+                self._delete_section(conn, section_id)
+            for position, section, key, records in stale:
+                row = conn.execute("SELECT id FROM sections WHERE deck_id = ? AND label = ?",
+                                   (spec.deck_id, section.label)).fetchone()
+                if row:
+                    self._delete_section(conn, row[0])
+                section_id = conn.execute(
+                    "INSERT INTO sections (deck_id, position, label, row_type, rows_key) VALUES (?, ?, ?, ?, ?)",
+                    (spec.deck_id, position, section.label, section.row_type.__name__, key),
+                ).lastrowid
+                self._insert_entries(conn, section_id, section, records)
+            # Positions follow the spec even where rows did not change
+            for position, label in enumerate(labels):
+                conn.execute("UPDATE sections SET position = ? WHERE deck_id = ? AND label = ?",
+                             (position, spec.deck_id, label))
+            return len(stale)
+
+        return self._transaction(write)
+
+    def import_modules(self, modules: Iterable[str]) -> Dict[str, int]:
+        """
+        Import the DECK_SPEC of each generator module.
+
+        Returns:
+            Module -> sections reimported; modules without a DECK_SPEC are left out
+        """
+        imported = {}
+        for name in modules:
+            spec = getattr(importlib.import_module(name), "DECK_SPEC", None)
+            if spec is not None:
+                imported[name] = self.import_deck(spec, name)
+        return imported
+
+    @staticmethod
+    def _delete_section(conn: sqlite3.Connection, section_id: int) -> None:
+        entries = "SELECT id FROM entries WHERE section_id = ?"
+        for table in ("examples", "word_pairs", "audio"):
+            conn.execute(f"DELETE FROM {table} WHERE entry_id IN ({entries})", (section_id,))
+        conn.execute("DELETE FROM entries WHERE section_id = ?", (section_id,))
+        conn.execute("DELETE FROM sections WHERE id = ?", (section_id,))
+
+    @staticmethod
+    def _insert_entries(conn: sqlite3.Connection, section_id: int, section, records: List[Any]) -> None:
+        for position, record in enumerate(records):
+            request = section.audio_request(record)
+            korean = _first(record, KOREAN_FIELDS) or (request[0] if request else None)
+            entry_id = conn.execute(
+                "INSERT INTO entries (section_id, position, korean, english, romanization, fields) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (section_id, position, korean, _first(record, ENGLISH_FIELDS), _first(record, ROMANIZATION_FIELDS),
+                 json.dumps(record._asdict(), ensure_ascii=False)),
+            ).lastrowid
+            example = _example(record)
+            if example:
+                conn.execute("INSERT INTO examples (entry_id, korean, english) VALUES (?, ?, ?)",
+                             (entry_id,) + example)
+            word_pairs = section.word_pairs(record)
+            if word_pairs:
+                conn.executemany("INSERT INTO word_pairs (entry_id, position, korean, english) VALUES (?, ?, ?, ?)",
+                                 [(entry_id, i, pair[0], pair[1]) for i, pair in enumerate(word_pairs)])
+            if request:
+                conn.execute("INSERT INTO audio (entry_id, text, filename) VALUES (?, ?, ?)",
+                             (entry_id,) + request)
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def section_rows(self, spec, section) -> List[Dict[str, Any]]:
+        """
+        A section's records as field dicts, importing the deck first if
+        the section changed since it was last imported.
+        """
+        query = ("SELECT e.fields FROM entries e JOIN sections s ON s.id = e.section_id "
+                 "WHERE s.deck_id = ? AND s.label = ? AND s.rows_key = ? ORDER BY e.position")
+        params = (spec.deck_id, section.label, section.rows_key())
+        known = self._query("SELECT 1 FROM sections WHERE deck_id = ? AND label = ? AND rows_key = ?", params)
+        if not known:
+            self.import_deck(spec)
+        return [json.loads(fields) for fields, in self._query(query, params)]
+
+    def find(self, text: str, prefix: bool = False) -> List[Dict[str, Any]]:
+        """
+        Entries whose Korean text or romanization is `text`, in every deck.
+
+        Args:
+            text: Korean text or romanization (case-insensitive)
+            prefix: Match entries starting with `text` instead
+        """
+        if prefix:
+            # Range scans, so both indexes are used
+            upper = text + "\U0010ffff"
+            where = "(e.korean >= ? AND e.korean < ?) OR (e.romanization >= ? COLLATE NOCASE " \
+                    "AND e.romanization < ? COLLATE NOCASE)"
+            params = (text, upper, text, upper)
+        else:
+            where = "e.korean = ? OR e.romanization = ? COLLATE NOCASE"
+            params = (text, text)
+        rows = self._query(f"{_PLACE} WHERE {where} ORDER BY d.id, s.position, e.position", params)
+        return [dict(zip(_PLACE_COLUMNS, row)) for row in rows]
+
+    def decks_using(self, texts: Iterable[str]) -> List[Dict[str, Any]]:
+        """
+        Decks with an entry, example, word pair or clip that is one of `texts`.
+
+        This is what to rebuild after changing how those texts are
+        rendered or spoken.
+        """
+        texts = list(texts)
+        marks = ",".join("?" * len(texts))
+        rows = self._query(f"""
+            SELECT DISTINCT d.id, d.module, d.name FROM decks d
+            JOIN sections s ON s.deck_id = d.id JOIN entries e ON e.section_id = s.id
+            WHERE e.korean IN ({marks})
+               OR e.id IN (SELECT entry_id FROM examples WHERE korean IN ({marks}))
+               OR e.id IN (SELECT entry_id FROM word_pairs WHERE korean IN ({marks}))
+               OR e.id IN (SELECT entry_id FROM audio WHERE text IN ({marks}))
+            ORDER BY d.id
+        """, texts * 4)
+        return [{"deck_id": row[0], "module": row[1], "deck_name": row[2]} for row in rows]
+
+    def duplicates(self) -> List[Dict[str, Any]]:
+        """Korean texts with entries in more than one deck, most widespread first."""
+        rows = self._query("""
+            SELECT e.korean, COUNT(DISTINCT s.deck_id) AS decks, GROUP_CONCAT(DISTINCT d.module)
+            FROM entries e JOIN sections s ON s.id = e.section_id JOIN decks d ON d.id = s.deck_id
+            WHERE e.korean IS NOT NULL
+            GROUP BY e.korean HAVING decks > 1
+            ORDER BY decks DESC, e.korean
+        """)
+        return [{"korean": row[0], "decks": row[1], "modules": (row[2] or "").split(",")} for row in rows]
+
+    def counts(self) -> Dict[str, int]:
+        """Rows per table."""
+        tables = ("decks", "sections", "entries", "examples", "word_pairs", "audio")
+        return {table: self._query(f"SELECT COUNT(*) FROM {table}")[0][0] for table in tables}
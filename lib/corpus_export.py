@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Columnar export of every note in the built packages, for analysis.
+
+Each note becomes one row, read straight from the packages (see
+lib.apkg_reader), so analysis jobs need neither the generators nor Anki:
+
+    package       package filename
+    deck          deck name
+    model         note model name
+    guid          note GUID
+    tags          space-separated tags
+    fields        map of field name -> value
+    audio         list of {filename, digest, size} for each [sound:...]
+                  the note references (digest as in
+                  ApkgReader.media_fingerprint, size uncompressed)
+    media_bytes   total size of the note's clips
+
+Packages are exported one at a time, each written as it is read, so memory
+holds a single package's notes whatever the size of the corpus. The
+output is Parquet or Arrow IPC (Feather), chosen by the file extension.
+
+pyarrow is optional: only writing needs it, and note_rows() works
+without it.
+"""
+
+import json
+import os
+import re
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from lib.apkg_reader import ApkgReader
+
+
+SOUND_RE = re.compile(r"\[sound:([^\]]+)\]")
+
+COLUMNS = ("package", "deck", "model", "guid", "tags", "fields", "audio", "media_bytes")
+
+FORMATS = {".parquet": "parquet", ".arrow": "arrow", ".feather": "arrow"}
+
+
+def arrow():
+    """Import pyarrow, which writing the export requires."""
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError("Exporting the corpus needs pyarrow: pip install pyarrow")
+    return pyarrow
+
+
+def schema():
+    pa = arrow()
+    return pa.schema([
+        ("package", pa.string()),
+        ("deck", pa.string()),
+        ("model", pa.string()),
+        ("guid", pa.string()),
+        ("tags", pa.string()),
+        ("fields", pa.map_(pa.string(), pa.string())),
+        ("audio", pa.list_(pa.struct([("filename", pa.string()), ("digest", pa.string()), ("size", pa.int64())]))),
+        ("media_bytes", pa.int64()),
+    ])
+
+
+def note_rows(path: str) -> Dict[str, List[Any]]:
+    """
+    Every note of one package, as columns (see COLUMNS).
+
+    Media is described from the zip directory or anki21b manifest; no
+    clip is decompressed.
+    """
+    columns: Dict[str, List[Any]] = {name: [] for name in COLUMNS}
+    package = os.path.basename(path)
+
+    with ApkgReader(path) as reader:
+        media = {filename: (reader.media_fingerprint(entry), reader.media_size(entry))
+                 for entry, filename in reader.media_map().items()}
+        conn = reader.open_collection()
+
+    try:
+        models_json, decks_json = conn.execute("SELECT models, decks FROM col").fetchone()
+        models = {int(model_id): (model["name"], [field["name"] for field in model["flds"]])
+                  for model_id, model in json.loads(models_json).items()}
+        decks = {int(deck_id): deck["name"] for deck_id, deck in json.loads(decks_json).items()}
+        # A note's deck is that of its first card
+        note_decks = dict(conn.execute("SELECT nid, did FROM cards ORDER BY nid, ord DESC"))
+
+        for note_id, guid, model_id, tags, flds in conn.execute(
+                "SELECT id, guid, mid, tags, flds FROM notes ORDER BY id"):
+            model_name, field_names = models.get(model_id, (str(model_id), []))
+            values = flds.split("\x1f")
+            audio = []
+            for filename in SOUND_RE.findall(flds):
+                digest, size = media.get(filename, (None, None))
+                audio.append({"filename": filename, "digest": digest, "size": size})
+
+            columns["package"].append(package)
+            columns["deck"].append(decks.get(note_decks.get(note_id), ""))
+            columns["model"].append(model_name)
+            columns["guid"].append(guid)
+            columns["tags"].append(tags.strip())
+            columns["fields"].append(list(zip(field_names, values)))
+            columns["audio"].append(audio)
+            columns["media_bytes"].append(sum(clip["size"] or 0 for clip in audio))
+    finally:
+        conn.close()
+    return columns
+
+
+def export_corpus(
+    packages: Iterable[str],
+    output_path: str,
+    on_package: Optional[Callable[[str, int, int], None]] = None,
+) -> int:
+    """
+    Write every note of the packages to one Parquet or Arrow file.
+
+    The file is written under a temporary name and moved into place when
+    complete.
+
+    Args:
+        packages: .apkg paths
+        output_path: .parquet, .arrow or .feather file
+        on_package: Called with (path, notes, media bytes) as each package is written
+
+    Returns:
+        Notes written
+
+    Raises:
+        ImportError: pyarrow is not installed
+        ValueError: Unknown output extension
+    """
+    ext = os.path.splitext(output_path)[1].lower()
+    if ext not in FORMATS:
+        raise ValueError(f"{output_path}: unknown format {ext!r} (expected one of {', '.join(FORMATS)})")
+    pa = arrow()
+    table_schema = schema()
+
+    tmp_path = f"{output_path}.{os.getpid()}.tmp"
+    if FORMATS[ext] == "parquet":
+        import pyarrow.parquet as pq
+        writer = pq.ParquetWriter(tmp_path, table_schema, compression="zstd")
+    else:
+        writer = pa.ipc.new_file(tmp_path, table_schema)
+
+    notes = 0
+    try:
+        for path in packages:
+            columns = note_rows(path)
+            writer.write_table(pa.Table.from_pydict(columns, schema=table_schema))
+            notes += len(columns["guid"])
+            if on_package:
+                on_package(path, len(columns["guid"]), sum(columns["media_bytes"]))
+    except BaseException:
+        writer.close()
+        os.remove(tmp_path)
+        raise
+    writer.close()
+    os.replace(tmp_path, output_path)
+    return notes
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Deck content in data files, read lazily.
+
+Each deck section's rows live in one file under data/<generator module>/,
+so content is edited without touching Python and importing a generator
+reads nothing. Two formats are supported:
+
+    .jsonl   one JSON object per line, keyed by row field names; fields
+             with defaults may be left out
+    .tsv     a header line of field names, then one tab-separated row per
+             line; for tables whose fields are all plain strings
+
+In both, blank lines and lines starting with "#" are ignored, so tables
+can keep their section comments.
+
+A DataFile is read only when its rows are iterated. They come from the
+compiled data snapshot (see lib.data_snapshot) if it was compiled from
+the file as it is now, and are otherwise parsed line by line. Rows are
+kept per process and reused while the file's modification time is
+unchanged, or, when only the time changed, while its content hash is.
+"""
+
+import glob
+import hashlib
+import json
+import os
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from lib.data_snapshot import Directory, open_snapshot, snapshot_current, write_snapshot
+
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+
+FORMATS = (".jsonl", ".tsv")
+
+# path -> (mtime_ns, size, sha1, rows), shared by every DataFile of a path
+_parsed: Dict[str, Tuple[int, int, str, List[Dict[str, Any]]]] = {}
+
+
+def deck_data_files(module_name: str, data_dir: str = DATA_DIR) -> List[str]:
+    """Data files of one generator module (used for dependency tracking)."""
+    return sorted(path for ext in FORMATS for path in glob.glob(os.path.join(data_dir, module_name, "*" + ext)))
+
+
+def all_data_files(data_dir: str = DATA_DIR) -> List[str]:
+    """Every data file of every generator module, relative to data_dir."""
+    modules = sorted(name for name in os.listdir(data_dir) if os.path.isdir(os.path.join(data_dir, name)))
+    return [os.path.relpath(path, data_dir) for module in modules for path in deck_data_files(module, data_dir)]
+
+
+def compile_snapshot(data_dir: str = DATA_DIR, force: bool = False) -> Optional[Directory]:
+    """
+    Parse every data file into the data snapshot (see lib.data_snapshot), unless it is current.
+
+    Args:
+        data_dir: Root of the data files
+        force: Write it even if it is current
+
+    Returns:
+        The new snapshot's directory, or None if it was current
+    """
+    files = all_data_files(data_dir)
+    if not force and snapshot_current(data_dir, files):
+        return None
+
+    def tables():
+        for relpath in files:
+            source = DataFile(relpath, data_dir)
+            stat = os.stat(source.path)
+            rows = list(source)
+            yield relpath, source.digest(), stat.st_mtime_ns, stat.st_size, rows
+
+    return write_snapshot(data_dir, tables())
+
+
+def _content_lines(lines) -> Iterator[Tuple[int, str]]:
+    for number, line in enumerate(lines, 1):
+        line = line.rstrip("\r\n")
+        if line.strip() and not line.lstrip().startswith("#"):
+            yield number, line
+
+
+class DataFile:
+    """
+    A table of rows in a .jsonl or .tsv file.
+
+    Rows are dicts keyed by field name; Section passes them to
+    lib.records.load_records, which validates them once.
+
+    Example:
+        >>> rows = DataFile("korean_phrases_common/phrases.jsonl")
+        >>> next(iter(rows))
+        {'korean': '안녕하세요?', 'english': 'Hello? / How are you?', ...}
+    """
+
+    def __init__(self, path: str, data_dir: str = DATA_DIR):
+        """
+        Args:
+            path: File path relative to data_dir
+            data_dir: Root of the data files
+        """
+        self.data_dir = data_dir
+        self.relpath = os.path.normpath(path)
+        self.path = os.path.join(data_dir, path)
+        if not self.path.endswith(FORMATS):
+            raise ValueError(f"{path}: data files must be one of {', '.join(FORMATS)}")
+
+    def __repr__(self) -> str:
+        return f"DataFile({os.path.relpath(self.path, DATA_DIR)!r})"
+
+    def _current(self) -> Optional[Tuple[int, int, str, List[Dict[str, Any]]]]:
+        """Parsed rows still valid for the file on disk, or None."""
+        stat = os.stat(self.path)
+        cached = _parsed.get(self.path)
+        if cached is None:
+            return None
+        if cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached
+        # Touched but maybe not changed (checkout, copy): compare content
+        if stat.st_size == cached[1] and self._hash() == cached[2]:
+            cached = _parsed[self.path] = (stat.st_mtime_ns, stat.st_size) + cached[2:]
+            return cached
+        return None
+
+    def _snapshot(self, stat: os.stat_result):
+        """The data snapshot, if it holds this file as it is now."""
+        snapshot = open_snapshot(self.data_dir)
+        entry = snapshot.entry(self.relpath) if snapshot is not None else None
+        if entry is not None and entry[1:3] == (stat.st_mtime_ns, stat.st_size):
+            return snapshot
+        return None
+
+    def _hash(self) -> str:
+        sha1 = hashlib.sha1()
+        with open(self.path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 16), b""):
+                sha1.update(block)
+        return sha1.hexdigest()
+
+    def digest(self) -> str:
+        """SHA-1 of the file content, without parsing it."""
+        cached = self._current()
+        if cached is not None:
+            return cached[2]
+        snapshot = self._snapshot(os.stat(self.path))
+        if snapshot is not None:
+            return snapshot.entry(self.relpath)[0]
+        return self._hash()
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """Stream the rows, from memory or the snapshot while the file is unchanged, else parsed."""
+        cached = self._current()
+        if cached is not None:
+            yield from cached[3]
+            return
+
+        stat = os.stat(self.path)
+        snapshot = self._snapshot(stat)
+        if snapshot is not None:
+            rows = snapshot.rows(self.relpath)
+            _parsed[self.path] = (stat.st_mtime_ns, stat.st_size, snapshot.entry(self.relpath)[0], rows)
+            yield from rows
+            return
+
+        sha1 = hashlib.sha1()
+        rows = []
+
+        def lines(f):
+            for line in f:
+                sha1.update(line.encode("utf-8"))
+                yield line
+
+        with open(self.path, encoding="utf-8", newline="") as f:
+            parse = self._parse_tsv if self.path.endswith(".tsv") else self._parse_jsonl
+            for row in parse(lines(f)):
+                rows.append(row)
+                yield row
+        _parsed[self.path] = (stat.st_mtime_ns, stat.st_size, sha1.hexdigest(), rows)
+
+    def _parse_jsonl(self, lines) -> Iterator[Dict[str, Any]]:
+        for number, line in _content_lines(lines):
+            try:
+                row = json.loads(line)
+            except ValueError as e:
+                raise ValueError(f"{self.path}:{number}: {e}")
+            if not isinstance(row, dict):
+                raise ValueError(f"{self.path}:{number}: expected a JSON object, got {line}")
+            yield row
+
+    def _parse_tsv(self, lines) -> Iterator[Dict[str, Any]]:
+        numbered = _content_lines(lines)
+        try:
+            _, header = next(numbered)
+        except StopIteration:
+            return
+        fields = header.split("\t")
+        for number, line in numbered:
+            values = line.split("\t")
+            if len(values) != len(fields):
+                raise ValueError(f"{self.path}:{number}: {len(values)} values for {len(fields)} columns")
+            yield dict(zip(fields, values))
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Every data file's parsed rows in one memory-mapped binary snapshot.
+
+Parsing the text data files is the largest part of loading a deck's
+content. lib.data_files.compile_snapshot() parses them all once and
+write_snapshot() writes the rows to data/tables.snapshot:
+
+    header      magic, Python version, directory offset and length
+    tables      one marshal blob per data file: its rows as dicts
+    directory   marshal'd {relative path: (sha1, mtime_ns, size, offset, length)}
+
+Equal strings are interned to one object before dumping, so marshal
+writes each distinct value of a table once and refers back to it: each
+table carries its own string pool. The snapshot is mapped, not read; a
+table is unmarshalled from the mapping only when its DataFile is
+iterated.
+
+A table is used only while its source file has the modification time
+and size it was compiled from, so an edited file is parsed from text
+until the snapshot is compiled again. The snapshot is replaced
+atomically; processes that mapped the old one keep reading it.
+marshal is specific to the Python version, which the header records.
+
+This module knows nothing of the text formats: lib.data_files, which
+reads the snapshot, passes it the tables and file lists.
+"""
+
+import marshal
+import mmap
+import os
+import struct
+import sys
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+SNAPSHOT_NAME = "tables.snapshot"
+
+MAGIC = b"KOSNAP01"
+# magic, Python major, minor, directory offset, directory length
+HEADER = struct.Struct("<8sHHQQ")
+
+# Relative path -> (sha1, mtime_ns, size, offset, length)
+Directory = Dict[str, Tuple[str, int, int, int, int]]
+
+# Snapshot path -> (mtime_ns, open snapshot)
+_open: Dict[str, Tuple[int, "Snapshot"]] = {}
+
+
+# (relative path, sha1, mtime_ns, size, rows) of one table to write
+Table = Tuple[str, str, int, int, List[Dict[str, Any]]]
+
+
+def snapshot_path(data_dir: str) -> str:
+    return os.path.join(data_dir, SNAPSHOT_NAME)
+
+
+class Snapshot:
+    """A mapped snapshot file."""
+
+    def __init__(self, path: str):
+        """
+        Raises:
+            ValueError: Not a snapshot, or written by another Python version
+        """
+        self.path = path
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._map)
+        if len(self._map) < HEADER.size:
+            raise ValueError(f"{path}: truncated snapshot")
+        magic, major, minor, offset, length = HEADER.unpack_from(self._map)
+        if magic != MAGIC:
+            raise ValueError(f"{path}: not a data snapshot")
+        if (major, minor) != sys.version_info[:2]:
+            raise ValueError(f"{path}: written by Python {major}.{minor}")
+        self.directory: Directory = marshal.loads(self._view[offset:offset + length])
+
+    def close(self) -> None:
+        self._view.release()
+        self._map.close()
+
+    def entry(self, relpath: str) -> Optional[Tuple[str, int, int, int, int]]:
+        return self.directory.get(relpath)
+
+    def rows(self, relpath: str) -> List[Dict[str, Any]]:
+        """A table's rows, unmarshalled from the mapping."""
+        _, _, _, offset, length = self.directory[relpath]
+        return marshal.loads(self._view[offset:offset + length])
+
+
+def open_snapshot(data_dir: str) -> Optional[Snapshot]:
+    """The data directory's snapshot, mapped once per process and remapped when replaced; None if missing."""
+    path = snapshot_path(data_dir)
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        _open.pop(path, None)
+        return None
+    cached = _open.get(path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    try:
+        snapshot = Snapshot(path)
+    except (OSError, ValueError, EOFError):
+        return None
+    # The old mapping stays open: rows already handed out do not refer to it,
+    # but a concurrent reader might still be unmarshalling from it
+    _open[path] = (mtime_ns, snapshot)
+    return snapshot
+
+
+def snapshot_current(data_dir: str, files: Iterable[str]) -> bool:
+    """True if the snapshot covers exactly these data files (relative to data_dir), as they are now."""
+    snapshot = open_snapshot(data_dir)
+    if snapshot is None:
+        return False
+    files = list(files)
+    if set(files) != set(snapshot.directory):
+        return False
+    for relpath in files:
+        stat = os.stat(os.path.join(data_dir, relpath))
+        if snapshot.directory[relpath][1:3] != (stat.st_mtime_ns, stat.st_size):
+            return False
+    return True
+
+
+def write_snapshot(data_dir: str, tables: Iterable[Table]) -> Directory:
+    """
+    Write the snapshot of these tables, replacing the old one atomically.
+
+    Args:
+        data_dir: Root of the data files
+        tables: (relative path, sha1, mtime_ns, size, rows) of every data file
+
+    Returns:
+        The new snapshot's directory
+    """
+    pool: Dict[str, str] = {}
+
+    def interned(value):
+        if isinstance(value, str):
+            return pool.setdefault(value, value)
+        if isinstance(value, list):
+            return [interned(item) for item in value]
+        if isinstance(value, dict):
+            return {interned(key): interned(item) for key, item in value.items()}
+        return value
+
+    path = snapshot_path(data_dir)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    directory: Directory = {}
+    with open(tmp_path, "wb") as f:
+        f.write(bytes(HEADER.size))
+        for relpath, sha1, mtime_ns, size, rows in tables:
+            blob = marshal.dumps(interned(rows))
+            directory[relpath] = (sha1, mtime_ns, size, f.tell(), len(blob))
+            f.write(blob)
+        offset = f.tell()
+        blob = marshal.dumps(directory)
+        f.write(blob)
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, sys.version_info[0], sys.version_info[1], offset, len(blob)))
+    os.replace(tmp_path, path)
+    return directory
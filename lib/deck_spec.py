@@ -0,0 +1,402 @@
+#!/usr/bin/env python3
+"""
+Declarative deck specs and the engine that builds them.
+
+A generator module describes its deck as a DeckSpec: deck ID and name, a
+model factory, and one Section per data table saying how a row becomes
+note fields and which text is spoken. build_deck() runs every spec the
+same way, as the stages of lib.stage_cache: rows are loaded, colored
+HTML rendered, audio resolved (each batch's missing clips generated
+concurrently through the build context) and notes assembled; the package
+is then written only if something it is made of changed. With a cache
+directory on the build context, each stage reuses what the last build
+produced for unchanged inputs.
+
+Rows are typed records (see lib.records), validated once when a section
+is loaded. A section's table is usually a DataFile (see lib.data_files),
+read only when the section is built; with a cache directory, its rows
+are read through the build's content repository (see lib.content_repo),
+which reimports the section first if it changed. While a deck builds, its rows and
+note fields are held columnar and interned (see lib.card_store), one
+row at a time becoming a record. Field names in a Section refer to fields of its row type, to
+its `constants`, or to the derived values every row gets:
+
+    korean_colored, english_colored   color-aligned HTML from word_pairs
+    audio                             the [sound:...] tag, or ""
+"""
+
+import itertools
+import operator
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Type, Union
+
+import genanki
+
+from lib.build_context import BuildContext, build_context
+from lib.card_store import CardStore, StringTable
+from lib.korean_deck_base import ALIGNMENT_COLORS, create_colored_html
+from lib.data_files import DataFile
+from lib.package_writer import StreamingPackageWriter
+from lib.records import load_records
+from lib.sharding import remove_stale_outputs
+from lib.stage_cache import STAGES, StageCache, digest
+
+
+# Rows per batch; each batch's audio is generated concurrently
+DEFAULT_BATCH_SIZE = 64
+DEFAULT_AUDIO_WORKERS = 8
+
+Record = NamedTuple
+FieldSpec = Union[str, Callable[[Record], str]]
+
+# Values build_deck() works out for every record
+DERIVED_FIELDS = ("korean_colored", "english_colored", "audio")
+
+# Model factory -> model, so repeated builds in one process (see
+# lib.build_daemon) reuse models and genanki's per-model card requirements
+_models: Dict[Callable[[], genanki.Model], genanki.Model] = {}
+
+
+class Section:
+    """One data table of a deck and how its rows become notes."""
+
+    def __init__(
+        self,
+        label: str,
+        rows: Sequence[Any],
+        row_type: Type[NamedTuple],
+        fields: Sequence[FieldSpec],
+        audio: Optional[FieldSpec] = None,
+        audio_filename: Optional[Callable[[Record], str]] = None,
+        constants: Optional[Dict[str, str]] = None,
+        skip: Optional[Callable[[Record], bool]] = None,
+        guid: Optional[str] = None,
+    ):
+        """
+        Args:
+            label: Summary label, e.g. "particle cards"
+            rows: The table: a DataFile, or anything lib.records.load_records accepts
+            row_type: NamedTuple class of the rows (see lib.records)
+            fields: Note fields in model order; names or callables taking the record
+            audio: Field name or callable giving the text to speak
+            audio_filename: Callable giving the clip filename (default: hashed text)
+            constants: Fixed per-section values for fields the rows do not have
+            skip: Callable returning True for records to leave out
+            guid: Row field holding the note GUID (default: hashed from
+                the note fields), so a corrected row keeps the GUID notes
+                already imported into Anki have
+
+        Raises:
+            ValueError: A field name is not a row field, constant or derived field
+        """
+        self.label = label
+        self.rows = rows
+        self.row_type = row_type
+        self.fields = list(fields)
+        self.audio = audio
+        self.audio_filename = audio_filename
+        self.constants = constants or {}
+        self.skip = skip
+        self.guid = guid
+
+        # Resolved once, so records are never inspected per row
+        self._getters = [self._getter(field) for field in self.fields]
+        if audio is None or callable(audio):
+            self._audio = audio
+        else:
+            self._audio = operator.itemgetter(self._field_index(audio))
+        self._word_pairs = row_type._fields.index("word_pairs") if "word_pairs" in row_type._fields else None
+        self._guid = None if guid is None else operator.itemgetter(self._field_index(guid))
+
+    def _field_index(self, name: str) -> int:
+        if name not in self.row_type._fields:
+            raise ValueError(f"{self.label}: {self.row_type.__name__} has no field {name!r}")
+        return self.row_type._fields.index(name)
+
+    def _getter(self, field: FieldSpec) -> Callable[[Record, Dict[str, str]], str]:
+        """field(record, derived values) -> note field value."""
+        if callable(field):
+            return lambda record, derived: field(record)
+        if field in DERIVED_FIELDS:
+            return lambda record, derived: derived[field]
+        if field in self.constants:
+            value = self.constants[field]
+            return lambda record, derived: value
+        index = self._field_index(field)
+        return lambda record, derived: record[index]
+
+    def records(self, rows: Optional[Iterable[Any]] = None) -> List[Record]:
+        """The rows (default: the section's table) as validated records, without skipped ones."""
+        records = load_records(self.row_type, self.rows if rows is None else rows, self.label)
+        if self.skip is not None:
+            records = [record for record in records if not self.skip(record)]
+        return records
+
+    def word_pairs(self, record: Record) -> Optional[list]:
+        return record[self._word_pairs] if self._word_pairs is not None else None
+
+    def audio_request(self, record: Record) -> Optional[Tuple[str, Optional[str]]]:
+        """(text, filename) to speak for a record, or None."""
+        if self._audio is None:
+            return None
+        text = self._audio(record)
+        if not text:
+            return None
+        return text, self.audio_filename(record) if self.audio_filename else None
+
+    def note_fields(self, record: Record, derived: Dict[str, str]) -> List[str]:
+        """Field values in model order, given the record's derived values."""
+        return [getter(record, derived) for getter in self._getters]
+
+    def note_guid(self, record: Record) -> Optional[str]:
+        """The record's note GUID, or None to hash it from the note fields."""
+        return self._guid(record) if self._guid is not None else None
+
+    def rows_key(self) -> str:
+        """What the section's records depend on (see lib.stage_cache)."""
+        # A data file is keyed by its content hash, so cached records are
+        # reused without parsing it
+        rows = self.rows.digest() if isinstance(self.rows, DataFile) else self.rows
+        return digest(self.label, self.row_type.__name__, self.row_type._fields, self.skip, rows)
+
+
+class DeckSpec:
+    """Everything needed to build one deck."""
+
+    def __init__(
+        self,
+        deck_id: int,
+        deck_name: str,
+        model: Callable[[], genanki.Model],
+        sections: Sequence[Section],
+        description: str = "",
+    ):
+        """
+        Args:
+            deck_id: Anki deck ID
+            deck_name: Deck name shown in Anki
+            model: Factory for the note model
+            sections: Data tables, in note order
+            description: Deck description
+        """
+        self.deck_id = deck_id
+        self.deck_name = deck_name
+        self.model = model
+        self.sections = list(sections)
+        self.description = description
+
+    def section(self, label: str) -> Section:
+        """The section with this label; only its data is read when its records are loaded."""
+        for section in self.sections:
+            if section.label == label:
+                return section
+        raise KeyError(f"{self.deck_name}: no section {label!r}")
+
+
+def _batches(items: Iterable, size: int) -> Iterator[list]:
+    items = iter(items)
+    while True:
+        batch = list(itertools.islice(items, size))
+        if not batch:
+            return
+        yield batch
+
+
+def deck_model(spec: DeckSpec) -> genanki.Model:
+    """The spec's model, created once per process."""
+    model = _models.get(spec.model)
+    if model is None:
+        model = _models[spec.model] = spec.model()
+    return model
+
+
+def model_key(model: genanki.Model) -> str:
+    """What notes of a model depend on besides their fields."""
+    # Only what the generator set: genanki fills in defaults (ord, font, ...)
+    # when a package is written, which must not change the key
+    fields = [field["name"] for field in model.fields]
+    templates = [(template["name"], template["qfmt"], template["afmt"]) for template in model.templates]
+    return digest(model.model_id, model.name, fields, templates, model.css,
+                  model.model_type, model.sort_field_index)
+
+
+def _load_rows(spec: DeckSpec, section: Section, context: BuildContext, cache: StageCache,
+               strings: StringTable) -> CardStore:
+    key = section.rows_key()
+    cached = cache.get("rows", key, count=False)
+    # Validated when they were cached; caches from before columnar rows hold lists
+    if isinstance(cached, dict):
+        cache.stats.hit("rows")
+        return CardStore.from_json(cached, strings, section.row_type)
+    cache.stats.miss("rows")
+    content = context.content()
+    rows = content.section_rows(spec, section) if content is not None else None
+    store = CardStore(section.row_type._fields, strings, section.row_type).extend(section.records(rows))
+    cache.put("rows", key, store.to_json())
+    return store
+
+
+def _colored_html(word_pairs, palette: str, cache: StageCache) -> Tuple[str, str]:
+    key = digest(palette, word_pairs)
+    html = cache.get("html", key)
+    if html is None:
+        html = cache.put("html", key, list(create_colored_html(word_pairs)))
+    return html[0], html[1]
+
+
+def _package_up_to_date(path: str, recorded: Optional[Dict[str, Any]]) -> bool:
+    """True if the package a build recorded is still on disk, untouched."""
+    if not recorded:
+        return False
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return False
+    return stat.st_size == recorded["size"] and stat.st_mtime_ns == recorded["mtime_ns"]
+
+
+def build_deck(
+    spec: DeckSpec,
+    output_file: str,
+    context: Optional[BuildContext] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    audio_workers: int = DEFAULT_AUDIO_WORKERS,
+    **writer_options,
+) -> Optional[StreamingPackageWriter]:
+    """
+    Build a deck from its spec and write the package.
+
+    Args:
+        spec: The deck to build
+        output_file: Package path, relative to the working directory
+        context: Build context (default: a fresh one, cleaned up afterwards)
+        batch_size: Rows per batch
+        audio_workers: Threads generating a batch's audio
+        **writer_options: Passed to StreamingPackageWriter
+
+    Returns:
+        The finished writer, for counts, pruning and timing reports, or
+        None if the existing package was up to date
+    """
+    model = deck_model(spec)
+    model_digest = model_key(model)
+    # The palette is read per build so a changed palette re-renders
+    palette = digest(ALIGNMENT_COLORS, create_colored_html)
+    counts: Dict[str, int] = {}
+    stages = {stage: 0.0 for stage in STAGES}
+    # Rows and note fields of the whole deck intern into one table
+    strings = StringTable()
+    note_fields = CardStore([field["name"] for field in model.fields], strings)
+    note_guids: List[str] = []
+    note_cards: List[List[int]] = []
+    note_keys: List[str] = []
+    clips: Dict[Tuple[str, Optional[str]], str] = {}
+    to_link: List[Tuple[str, Optional[str]]] = []
+
+    with build_context(context) as context:
+        cache = context.stage_cache(str(spec.deck_id))
+        output_path = os.path.join(os.getcwd(), output_file)
+
+        with ThreadPoolExecutor(max_workers=audio_workers) as pool:
+            for section in spec.sections:
+                counts[section.label] = 0
+                start = time.perf_counter()
+                records = _load_rows(spec, section, context, cache, strings)
+                stages["rows"] += time.perf_counter() - start
+
+                for batch in _batches(records, batch_size):
+                    # Clips cached by an earlier build are only linked in if
+                    # the package is rewritten; the rest are spoken now,
+                    # each distinct text once, concurrently
+                    start = time.perf_counter()
+                    missing = []
+                    for request in dict.fromkeys(filter(None, map(section.audio_request, batch))):
+                        if request in clips or request in missing:
+                            continue
+                        key = digest(context.audio_key(request[0]), request[1])
+                        filename = cache.get("audio", key, count=False)
+                        if filename and context.has_cached_clip(request[0]):
+                            cache.stats.hit("audio")
+                            clips[request] = filename
+                            to_link.append(request)
+                        else:
+                            cache.stats.miss("audio")
+                            missing.append(request)
+                    for request, filename in zip(missing, pool.map(lambda request: context.audio(*request), missing)):
+                        if filename:
+                            clips[request] = cache.put("audio", digest(context.audio_key(request[0]), request[1]),
+                                                       filename)
+                    stages["audio"] += time.perf_counter() - start
+
+                    for record in batch:
+                        request = section.audio_request(record)
+                        filename = clips.get(request) if request else None
+                        derived = {"audio": f"[sound:{filename}]" if filename else ""}
+
+                        start = time.perf_counter()
+                        word_pairs = section.word_pairs(record)
+                        derived["korean_colored"], derived["english_colored"] = (
+                            _colored_html(word_pairs, palette, cache) if word_pairs else ("", "")
+                        )
+                        stages["html"] += time.perf_counter() - start
+
+                        start = time.perf_counter()
+                        fields = section.note_fields(record, derived)
+                        guid = section.note_guid(record)
+                        key = digest(model_digest, fields) if guid is None else digest(model_digest, fields, guid)
+                        assembled = cache.get("notes", key)
+                        if assembled is None:
+                            if len(fields) != len(model.fields):
+                                raise ValueError(f"{section.label}: note has {len(fields)} fields but model "
+                                                 f"{model.name} has {len(model.fields)}")
+                            note = genanki.Note(model=model, fields=fields, guid=guid)
+                            assembled = cache.put("notes", key, [note.guid, [card.ord for card in note.cards]])
+                        note_fields.append(fields)
+                        note_guids.append(assembled[0])
+                        note_cards.append(assembled[1])
+                        note_keys.append(key)
+                        counts[section.label] += 1
+                        stages["notes"] += time.perf_counter() - start
+
+        start = time.perf_counter()
+        media = sorted((filename, context.audio_key(request[0])) for request, filename in clips.items())
+        package_key = digest(spec.deck_id, spec.deck_name, spec.description, model_digest,
+                             sorted(writer_options.items()), note_keys, media)
+        writer = None
+        if _package_up_to_date(output_path, cache.get("package", package_key)):
+            note_count = len(note_fields)
+        else:
+            for request in to_link:
+                context.audio(*request)
+            with StreamingPackageWriter(output_path, spec.deck_id, spec.deck_name, spec.description,
+                                        **writer_options) as writer:
+                for fields, guid, card_ords in zip(note_fields, note_guids, note_cards):
+                    writer.add_assembled_note(model, fields, guid, card_ords)
+                for path in context.media_files:
+                    writer.add_media_file(path)
+            note_count = writer.note_count
+            stat = os.stat(output_path)
+            cache.put("package", package_key, {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns})
+        remove_stale_outputs(output_path, [output_path])
+        stages["package"] += time.perf_counter() - start
+        cache.save()
+
+        context.stats.stage_seconds.update(stages)
+        context.stats.stages.merge(cache.stats)
+        context.stats.notes += note_count
+
+        print(f"✓ Deck {'created' if writer else 'up to date'}: {output_file}")
+        for label, count in counts.items():
+            print(f"  - {count} {label}")
+        if len(counts) > 1:
+            print(f"  - Total: {note_count} cards")
+        if writer:
+            print(f"  - {writer.media_report()}")
+        print(f"  - cached stages: {cache.stats.format()}")
+        print("  - " + ", ".join(f"{stage} {seconds:.1f}s" for stage, seconds in stages.items())
+              + (f"; written in {writer.format_timings()}" if writer else ""))
+        print("\nImport this file into Anki: File → Import...")
+
+    return writer
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+Deck builds split into jobs on a shared queue (see lib.job_queue).
+
+The coordinator turns a build into two stages of jobs:
+
+    stage 0  one "audio" job per distinct clip across all decks, found by
+             walking each generator's DECK_SPEC
+    stage 1  one "deck" job per generator, building its package from the
+             clips stage 0 left in the shared media directory
+
+Workers on any host that can reach the shared directory lease jobs until
+the queue drains. The coordinator then merges the job results, ordered by
+key, into build_manifest.json, so the manifest does not depend on which
+worker ran what or in which order.
+
+Shared directory layout:
+
+    queue.db               the job queue
+    media/                 synthesized clips, by filename
+    decks/                 built packages
+    build_manifest.json    merged results
+"""
+
+import hashlib
+import importlib
+import json
+import os
+import shutil
+import subprocess
+import time
+import traceback
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from lib.build_context import clip_name
+from lib.build_runner import build_deck
+from lib.job_queue import DONE, FAILED, Heartbeat, JobQueue, worker_id
+
+
+AUDIO_STAGE = 0
+DECK_STAGE = 1
+
+QUEUE_NAME = "queue.db"
+MEDIA_DIR = "media"
+DECKS_DIR = "decks"
+MANIFEST_NAME = "build_manifest.json"
+
+DEFAULT_POLL_SECONDS = 1.0
+
+
+def _sha1(path: str) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+# =============================================================================
+# JOBS
+# =============================================================================
+
+def audio_jobs(modules: List[str]) -> List[Tuple[str, Dict[str, Any]]]:
+    """(clip filename, payload) for every distinct clip the decks speak."""
+    clips: Dict[str, Dict[str, Any]] = {}
+    for module_name in modules:
+        spec = getattr(importlib.import_module(module_name), "DECK_SPEC", None)
+        if spec is None:
+            continue
+        for section in spec.sections:
+            for record in section.records():
+                request = section.audio_request(record)
+                if request:
+                    text, filename = request
+                    clips.setdefault(filename or clip_name(text), {"text": text})
+    return sorted(clips.items())
+
+
+class SharedClips:
+    """
+    TTS factory for deck jobs: copies clips the audio stage synthesized.
+
+    Clips not found in the shared media directory (a generator without a
+    DECK_SPEC, or a failed audio job) are synthesized with `fallback`.
+    """
+
+    def __init__(self, media_dir: str, fallback: Optional[Callable[..., Any]] = None):
+        self.media_dir = media_dir
+        self.fallback = fallback
+
+    def __call__(self, text: str = "", lang: str = "ko", **kwargs) -> "_SharedClip":
+        return _SharedClip(self, text, lang)
+
+
+class _SharedClip:
+    def __init__(self, clips: SharedClips, text: str, lang: str):
+        self.clips = clips
+        self.text = text
+        self.lang = lang
+
+    def save(self, path: str) -> None:
+        source = os.path.join(self.clips.media_dir, os.path.basename(path))
+        if os.path.exists(source):
+            shutil.copyfile(source, path)
+        elif self.clips.fallback is not None:
+            self.clips.fallback(text=self.text, lang=self.lang).save(path)
+        else:
+            raise FileNotFoundError(f"clip not synthesized: {os.path.basename(path)}")
+
+
+def run_audio_job(payload: Dict[str, Any], filename: str, shared_dir: str, tts: Callable[..., Any]) -> Dict[str, Any]:
+    """Synthesize one clip into the shared media directory (atomically)."""
+    path = os.path.join(shared_dir, MEDIA_DIR, filename)
+    if not os.path.exists(path):
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        tts(text=payload["text"], lang=payload.get("lang", "ko")).save(tmp_path)
+        os.replace(tmp_path, path)
+    return {"size": os.path.getsize(path), "sha1": _sha1(path)}
+
+
+def run_deck_job(payload: Dict[str, Any], shared_dir: str, tts: Callable[..., Any]) -> Dict[str, Any]:
+    """Build one deck from the shared clips."""
+    result = build_deck(
+        payload["module"],
+        output_dir=os.path.join(shared_dir, DECKS_DIR),
+        tts=SharedClips(os.path.join(shared_dir, MEDIA_DIR), fallback=tts),
+    )
+    if not result.ok:
+        raise RuntimeError(result.error)
+    return {
+        "packages": [os.path.relpath(path, shared_dir) for path in result.output_paths],
+        "notes": result.notes,
+        "cards": result.cards,
+        "media": result.media,
+        "seconds": round(result.seconds, 3),
+    }
+
+
+# =============================================================================
+# WORKER
+# =============================================================================
+
+def run_worker(
+    shared_dir: str,
+    tts: Optional[Callable[..., Any]] = None,
+    poll: float = DEFAULT_POLL_SECONDS,
+    lease_seconds: Optional[float] = None,
+    log: Callable[[str], None] = print,
+) -> int:
+    """
+    Lease and run jobs until the queue drains.
+
+    Returns:
+        Number of jobs this worker completed
+    """
+    if tts is None:
+        from gtts import gTTS as tts
+
+    queue = JobQueue(os.path.join(shared_dir, QUEUE_NAME),
+                     **({"lease_seconds": lease_seconds} if lease_seconds else {}))
+    me = worker_id()
+    completed = 0
+    try:
+        while True:
+            job = queue.lease(me)
+            if job is None:
+                if queue.drained():
+                    return completed
+                time.sleep(poll)
+                continue
+
+            error = None
+            with Heartbeat(queue, job, me) as heartbeat:
+                try:
+                    if job.kind == "audio":
+                        result = run_audio_job(job.payload, job.key, shared_dir, tts)
+                    elif job.kind == "deck":
+                        result = run_deck_job(job.payload, shared_dir, tts)
+                    else:
+                        raise ValueError(f"unknown job kind {job.kind!r}")
+                except Exception:
+                    error = traceback.format_exc()
+
+            if heartbeat.lost:
+                log(f"{me}: lease on {job.kind} {job.key} lost; result discarded")
+            elif error is not None:
+                queue.fail(job, me, error)
+                log(f"{me}: {job.kind} {job.key} failed (attempt {job.attempts})")
+            elif queue.complete(job, me, result):
+                completed += 1
+    finally:
+        queue.close()
+
+
+# =============================================================================
+# COORDINATOR
+# =============================================================================
+
+def submit_build(shared_dir: str, modules: List[str]) -> JobQueue:
+    """Create the shared directory and queue the audio and deck jobs of a new build."""
+    for name in (MEDIA_DIR, DECKS_DIR):
+        os.makedirs(os.path.join(shared_dir, name), exist_ok=True)
+
+    queue = JobQueue(os.path.join(shared_dir, QUEUE_NAME))
+    queue.start_build()
+    queue.submit_many("audio", audio_jobs(modules), stage=AUDIO_STAGE)
+    queue.submit_many("deck", [(name, {"module": name}) for name in modules], stage=DECK_STAGE)
+    queue.close_submissions()
+    return queue
+
+
+def merge_results(queue: JobQueue, shared_dir: str) -> Dict[str, Any]:
+    """
+    Merge job results into the build manifest.
+
+    Results are keyed and sorted by job key and leave out worker names and
+    timings, so the same inputs give the same manifest however the jobs
+    were spread.
+    """
+    manifest: Dict[str, Any] = {"decks": {}, "audio": {}, "failed": []}
+    for kind in ("audio", "deck"):
+        for job in queue.results(kind):
+            if job["state"] == FAILED:
+                error = (job["error"] or "").strip().splitlines()
+                manifest["failed"].append({"kind": kind, "key": job["key"], "error": error[-1] if error else ""})
+            elif job["state"] == DONE and kind == "audio":
+                manifest["audio"][job["key"]] = job["result"]["sha1"]
+            elif job["state"] == DONE:
+                result = dict(job["result"])
+                result.pop("seconds", None)
+                manifest["decks"][job["key"]] = result
+
+    with open(os.path.join(shared_dir, MANIFEST_NAME), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2, sort_keys=True)
+    return manifest
+
+
+def coordinate(
+    shared_dir: str,
+    modules: List[str],
+    worker_command: Optional[List[str]] = None,
+    local_workers: int = 0,
+    poll: float = DEFAULT_POLL_SECONDS,
+    log: Callable[[str], None] = print,
+) -> Dict[str, Any]:
+    """
+    Queue a build, optionally start local workers, wait, and merge.
+
+    Args:
+        shared_dir: Directory every worker can reach
+        modules: Generator modules to build
+        worker_command: Command starting one worker (needed for local_workers)
+        local_workers: Worker processes to start on this machine
+        poll: Seconds between progress checks
+
+    Returns:
+        The merged build manifest
+    """
+    queue = submit_build(shared_dir, modules)
+    processes = [subprocess.Popen(worker_command) for _ in range(local_workers)]
+
+    try:
+        last = None
+        while not queue.drained():
+            counts = queue.counts()
+            if counts != last:
+                log(f"  jobs: {counts['done']} done, {counts['leased']} running, "
+                    f"{counts['pending']} pending, {counts['failed']} failed")
+                last = counts
+            if processes and all(p.poll() is not None for p in processes):
+                raise RuntimeError("all local workers exited before the queue drained")
+            time.sleep(poll)
+        for process in processes:
+            process.wait()
+        return merge_results(queue, shared_dir)
+    finally:
+        for process in processes:
+            if process.poll() is None:
+                process.terminate()
+        queue.close()
@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""
+Word frequencies from local Korean text corpora, counted in parallel.
+
+count_corpus() splits each text file into byte ranges on line
+boundaries and counts every range in a worker process (map), then adds
+the counts up (reduce). Tokens are runs of Hangul split on whitespace
+and punctuation, with a trailing particle removed (학생은 -> 학생),
+so a noun is counted however it is marked. Verbs and adjectives are
+counted by surface form (먹어요, 먹었어요); prefix_count() adds those up
+by stem.
+
+The result is written as a compact frequency table, a file that is
+memory-mapped rather than loaded:
+
+    header    magic, entries, total tokens, text size
+    offsets   uint64[entries + 1], where each token starts in text
+    counts    uint64[entries]
+    ranks     uint32[entries], 1 = most frequent
+    order     uint32[entries], entry indexes from most to least frequent
+    text      the tokens, UTF-8, in sorted order
+
+Entries are sorted by their UTF-8 bytes, so a lookup is a binary search
+over the mapping and a prefix is a contiguous range. Opening a table
+costs the same however large the corpus was.
+"""
+
+import mmap
+import os
+import re
+import struct
+from array import array
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterable, List, NamedTuple, Optional, Tuple
+
+
+DEFAULT_CHUNK_BYTES = 16 << 20
+
+MAGIC = b"KOFREQ01"
+# magic, entries, total tokens, text bytes
+HEADER = struct.Struct("<8sQQQ")
+
+HANGUL_RUN = re.compile(r"[가-힣]+")
+
+# Fields holding the headword a vocab entry is ranked by, in order of preference
+HEADWORD_FIELDS = ("korean", "dict_form", "plain", "korean_char")
+
+# Longest first, so 에서 is stripped rather than 서
+PARTICLES = sorted([
+    "께서", "에서", "에게", "한테", "까지", "부터", "으로", "처럼", "보다", "하고", "이랑", "마다", "조차", "밖에",
+    "은", "는", "이", "가", "을", "를", "에", "의", "도", "만", "로", "와", "과", "랑", "께",
+], key=len, reverse=True)
+PARTICLE_RE = re.compile("(" + "|".join(PARTICLES) + ")$")
+
+
+def tokens(text: str) -> List[str]:
+    """
+    Korean words of a text, with a trailing particle removed.
+
+    A one-syllable particle is only removed when two or more syllables
+    are left, since short words often end in a syllable that looks like
+    one (나이, 모자).
+    """
+    words = []
+    for word in HANGUL_RUN.findall(text):
+        match = PARTICLE_RE.search(word)
+        if match:
+            stem = len(word) - len(match.group(1))
+            if stem >= 2 or (stem >= 1 and len(match.group(1)) >= 2):
+                word = word[:stem]
+        words.append(word)
+    return words
+
+
+def byte_ranges(path: str, chunk_bytes: int = DEFAULT_CHUNK_BYTES) -> List[Tuple[str, int, int]]:
+    """(path, start, end) ranges covering a file; count_range() aligns them to lines."""
+    size = os.path.getsize(path)
+    return [(path, start, min(start + chunk_bytes, size)) for start in range(0, size, chunk_bytes)] or [(path, 0, 0)]
+
+
+def count_range(task: Tuple[str, int, int]) -> Counter:
+    """
+    Count the tokens of the lines starting in [start, end) of a file.
+
+    A line belongs to the range its first byte is in, so ranges split
+    anywhere still count every line exactly once.
+    """
+    path, start, end = task
+    counts: Counter = Counter()
+    with open(path, "rb") as f:
+        if start:
+            # Skip the line that started in the previous range
+            f.seek(start - 1)
+            f.readline()
+        while f.tell() < end:
+            line = f.readline()
+            if not line:
+                break
+            counts.update(tokens(line.decode("utf-8", errors="replace")))
+    return counts
+
+
+def count_corpus(
+    paths: Iterable[str],
+    workers: Optional[int] = None,
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+    on_chunk: Optional[Callable[[Tuple[str, int, int]], None]] = None,
+) -> Counter:
+    """
+    Count tokens in text files, one byte range per task, in a process pool.
+
+    Args:
+        paths: UTF-8 text files
+        workers: Worker processes (default: CPU count)
+        chunk_bytes: Bytes per task
+        on_chunk: Called with each (path, start, end) as it is counted
+    """
+    tasks = [task for path in paths for task in byte_ranges(path, chunk_bytes)]
+    total: Counter = Counter()
+    if workers == 1:
+        results = map(count_range, tasks)
+        for task, counts in zip(tasks, results):
+            total.update(counts)
+            if on_chunk:
+                on_chunk(task)
+        return total
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for task, counts in zip(tasks, pool.map(count_range, tasks)):
+            total.update(counts)
+            if on_chunk:
+                on_chunk(task)
+    return total
+
+
+def write_table(counts: Counter, path: str) -> int:
+    """
+    Write counts as a frequency table, atomically.
+
+    Returns:
+        Number of entries
+    """
+    entries = sorted((word.encode("utf-8"), count) for word, count in counts.items() if count > 0)
+    offsets = array("Q", [0])
+    for word, _ in entries:
+        offsets.append(offsets[-1] + len(word))
+    counts_array = array("Q", (count for _, count in entries))
+    # Ties broken by token, so the ranking is stable
+    order = array("I", sorted(range(len(entries)), key=lambda i: (-entries[i][1], entries[i][0])))
+    ranks = array("I", bytes(4 * len(entries)))
+    for rank, index in enumerate(order, 1):
+        ranks[index] = rank
+
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, len(entries), sum(counts_array), offsets[-1]))
+        for part in (offsets, counts_array, ranks, order):
+            f.write(part.tobytes())
+        for word, _ in entries:
+            f.write(word)
+    os.replace(tmp_path, path)
+    return len(entries)
+
+
+class FrequencyTable:
+    """
+    A frequency table file, memory-mapped.
+
+    Example:
+        >>> table = FrequencyTable("freq.bin")
+        >>> table.count("학생"), table.rank("학생")
+        (5120, 87)
+        >>> table.prefix_count("먹")
+        9311
+    """
+
+    def __init__(self, path: str):
+        """
+        Raises:
+            ValueError: Not a frequency table
+        """
+        self.path = path
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, entries, self.total, text_bytes = HEADER.unpack_from(self._map)
+        if magic != MAGIC:
+            raise ValueError(f"{path}: not a frequency table")
+        self.entries = entries
+        view = memoryview(self._map)
+        position = HEADER.size
+
+        def section(fmt: str, count: int) -> memoryview:
+            nonlocal position
+            size = struct.calcsize(fmt) * count
+            part = view[position:position + size].cast(fmt)
+            position += size
+            return part
+
+        self._offsets = section("Q", entries + 1)
+        self._counts = section("Q", entries)
+        self._ranks = section("I", entries)
+        self._order = section("I", entries)
+        self._text = view[position:position + text_bytes]
+
+    def close(self) -> None:
+        for part in (self._offsets, self._counts, self._ranks, self._order, self._text):
+            part.release()
+        self._map.close()
+
+    def __enter__(self) -> "FrequencyTable":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.entries
+
+    def _word(self, index: int) -> bytes:
+        return bytes(self._text[self._offsets[index]:self._offsets[index + 1]])
+
+    def _bisect(self, key: bytes) -> int:
+        """Index of the first entry not less than key."""
+        low, high = 0, self.entries
+        while low < high:
+            middle = (low + high) // 2
+            if self._word(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def _find(self, word: str) -> Optional[int]:
+        key = word.encode("utf-8")
+        index = self._bisect(key)
+        return index if index < self.entries and self._word(index) == key else None
+
+    def __contains__(self, word: str) -> bool:
+        return self._find(word) is not None
+
+    def count(self, word: str) -> int:
+        index = self._find(word)
+        return self._counts[index] if index is not None else 0
+
+    def rank(self, word: str) -> Optional[int]:
+        """1 for the most frequent token; None if the corpus does not have it."""
+        index = self._find(word)
+        return self._ranks[index] if index is not None else None
+
+    def prefix_count(self, prefix: str) -> int:
+        """Total count of tokens starting with prefix, e.g. every form of a verb stem."""
+        key = prefix.encode("utf-8")
+        start = self._bisect(key)
+        # Tokens with the prefix sort before the prefix followed by the highest byte
+        end = self._bisect(key + b"\xff")
+        return sum(self._counts[start:end])
+
+    def rank_of_count(self, count: int) -> int:
+        """The rank a token with this count would have: 1 + the number of tokens counted more often."""
+        low, high = 0, self.entries
+        while low < high:
+            middle = (low + high) // 2
+            if self._counts[self._order[middle]] > count:
+                low = middle + 1
+            else:
+                high = middle
+        return low + 1
+
+    def top(self, limit: int) -> List[Tuple[str, int]]:
+        """The most frequent tokens with their counts."""
+        return [(self._word(index).decode("utf-8"), self._counts[index]) for index in self._order[:limit]]
+
+
+class RankedEntry(NamedTuple):
+    """One deck entry and how often the corpus uses it."""
+    section: str
+    row: int
+    word: str
+    count: int
+    rank: Optional[int]
+
+
+def entry_frequency(table: FrequencyTable, word: str) -> Tuple[int, Optional[int]]:
+    """
+    (count, rank) of a headword.
+
+    A dictionary form (먹다) rarely appears as such, so verbs and
+    adjectives are counted over every token starting with their stem,
+    and ranked where that count would fall. A phrase counts as its
+    rarest word. A headword ending in what looks like a particle
+    (떡볶이, 나중에) is counted both as is and as tokens() strips it,
+    since the corpus holds it either way depending on what followed it.
+    """
+    if " " in word.strip():
+        return min((entry_frequency(table, part) for part in word.split()),
+                   key=lambda found: (found[1] is not None, -(found[1] or 0)))
+    stripped = tokens(word)
+    if len(stripped) == 1 and stripped[0] != word and stripped[0] in table:
+        count = table.count(word) + table.count(stripped[0])
+        return count, table.rank_of_count(count)
+    if word.endswith("다") and len(word) > 1 and word not in table:
+        count = table.prefix_count(word[:-1])
+        if not count:
+            return 0, None
+        return count, table.rank_of_count(count)
+    return table.count(word), table.rank(word)
+
+
+def rank_entries(spec, table: FrequencyTable) -> List[RankedEntry]:
+    """
+    The frequency of each entry of a deck, in deck order.
+
+    Args:
+        spec: The deck's lib.deck_spec.DeckSpec
+        table: Frequency table to look entries up in
+
+    Returns:
+        One RankedEntry per row with a headword (see HEADWORD_FIELDS)
+    """
+    ranked = []
+    for section in spec.sections:
+        fields = section.row_type._fields
+        field = next((name for name in HEADWORD_FIELDS if name in fields), None)
+        if field is None:
+            continue
+        index = fields.index(field)
+        for number, record in enumerate(section.records(), 1):
+            word = record[index].split("(")[0].strip()
+            if word:
+                ranked.append(RankedEntry(section.label, number, word, *entry_frequency(table, word)))
+    return ranked
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Hangul syllable arithmetic: jamo decomposition and composition.
+
+The 11,172 precomposed syllables U+AC00..U+D7A3 are ordered by initial
+consonant (19), then medial vowel (21), then final consonant (28,
+including none), so a syllable's jamo follow from its code point:
+
+    offset  = code - 0xAC00
+    initial = offset // 588        (588 = 21 * 28)
+    medial  = offset // 28 % 21
+    final   = offset % 28          (0 = no final)
+
+and composing is the reverse. Jamo are given as compatibility jamo
+(ㄱ, ㅏ), the letters the decks teach, or as conjoining jamo (U+1100..).
+
+The functions on one syllable or string are pure Python. The array
+functions apply the same arithmetic to whole NumPy arrays of code points
+at once, for every Korean string of a corpus; NumPy is optional and only
+they need it.
+"""
+
+from typing import Dict, Optional, Tuple
+
+
+SYLLABLE_BASE = 0xAC00
+SYLLABLE_COUNT = 11172
+MEDIAL_COUNT = 21
+FINAL_COUNT = 28
+BLOCK = MEDIAL_COUNT * FINAL_COUNT
+
+# Compatibility jamo, by index in a syllable
+INITIALS = tuple("ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ")
+MEDIALS = tuple("ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ")
+FINALS = ("",) + tuple("ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ")
+
+# First conjoining jamo of each position; conjoining finals start at index 1
+CONJOINING_BASES = (0x1100, 0x1161, 0x11A7)
+
+# (conjoining, table) -> array, built on first use
+_tables: Dict[Tuple[bool, str], object] = {}
+
+
+def numpy():
+    """Import NumPy, which the array functions require."""
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("Hangul array functions need NumPy: pip install numpy")
+    return numpy
+
+
+def is_syllable(char: str) -> bool:
+    return 0 <= ord(char) - SYLLABLE_BASE < SYLLABLE_COUNT
+
+
+def decompose(char: str) -> Optional[Tuple[int, int, int]]:
+    """(initial, medial, final) indexes of a syllable; None for anything else."""
+    offset = ord(char) - SYLLABLE_BASE
+    if not 0 <= offset < SYLLABLE_COUNT:
+        return None
+    return offset // BLOCK, offset // FINAL_COUNT % MEDIAL_COUNT, offset % FINAL_COUNT
+
+
+def compose(initial: int, medial: int, final: int = 0) -> str:
+    """
+    The syllable of jamo indexes.
+
+    Raises:
+        ValueError: An index is out of range
+    """
+    if not (0 <= initial < len(INITIALS) and 0 <= medial < MEDIAL_COUNT and 0 <= final < FINAL_COUNT):
+        raise ValueError(f"no syllable has jamo indexes ({initial}, {medial}, {final})")
+    return chr(SYLLABLE_BASE + initial * BLOCK + medial * FINAL_COUNT + final)
+
+
+def jamo(char: str) -> Tuple[str, ...]:
+    """The compatibility jamo of a syllable, without an empty final; anything else as is."""
+    indexes = decompose(char)
+    if indexes is None:
+        return (char,)
+    initial, medial, final = indexes
+    return (INITIALS[initial], MEDIALS[medial], FINALS[final]) if final else (INITIALS[initial], MEDIALS[medial])
+
+
+def breakdown(text: str) -> str:
+    """How a syllable is built, as the decks write it: "ㄲ + ㅏ", "ㅎ + ㅏ + ㄴ"."""
+    return " + ".join(part for char in text for part in jamo(char))
+
+
+def to_jamo(text: str) -> str:
+    """Text with every syllable spelled out in compatibility jamo: 한국 -> ㅎㅏㄴㄱㅜㄱ."""
+    return "".join(part for char in text for part in jamo(char))
+
+
+# Array functions (NumPy)
+
+def tables(conjoining: bool = False) -> Dict[str, object]:
+    """
+    Lookup tables as NumPy arrays, built once.
+
+    Returns:
+        "initial" (19), "medial" (21), "final" (28): jamo code point of
+        each index, 0 for no final; "syllables" (11172 x 3): the
+        (initial, medial, final) indexes of every syllable, in code
+        point order
+    """
+    np = numpy()
+    key = (conjoining, "initial")
+    if key not in _tables:
+        if conjoining:
+            initial, medial, final = (np.arange(count, dtype=np.uint32) + base
+                                      for count, base in zip((len(INITIALS), MEDIAL_COUNT, FINAL_COUNT),
+                                                             CONJOINING_BASES))
+            final[0] = 0
+        else:
+            initial, medial, final = (np.array([ord(char) if char else 0 for char in table], dtype=np.uint32)
+                                      for table in (INITIALS, MEDIALS, FINALS))
+        offsets = np.arange(SYLLABLE_COUNT)
+        syllables = np.stack([offsets // BLOCK, offsets // FINAL_COUNT % MEDIAL_COUNT, offsets % FINAL_COUNT],
+                             axis=1).astype(np.int8)
+        for name, table in (("initial", initial), ("medial", medial), ("final", final), ("syllables", syllables)):
+            table.setflags(write=False)
+            _tables[(conjoining, name)] = table
+    return {name: _tables[(conjoining, name)] for name in ("initial", "medial", "final", "syllables")}
+
+
+def codepoints(text: str):
+    """The code points of a string, as a uint32 array."""
+    np = numpy()
+    return np.frombuffer(text.encode("utf-32-le"), dtype="<u4").astype(np.uint32)
+
+
+def from_codepoints(codes) -> str:
+    """The string of an array of code points."""
+    np = numpy()
+    return np.asarray(codes, dtype="<u4").tobytes().decode("utf-32-le")
+
+
+def decompose_array(codes):
+    """
+    Jamo indexes of every code point, at once.
+
+    Args:
+        codes: Array of code points (see codepoints())
+
+    Returns:
+        (initial, medial, final) int8 arrays of the same shape, -1 in all
+        three where the code point is not a syllable
+    """
+    np = numpy()
+    offsets = np.asarray(codes).astype(np.int32) - SYLLABLE_BASE
+    not_syllable = (offsets < 0) | (offsets >= SYLLABLE_COUNT)
+    rest, final = np.divmod(offsets, FINAL_COUNT)
+    initial, medial = np.divmod(rest, MEDIAL_COUNT)
+    parts = []
+    for part in (initial, medial, final):
+        part = part.astype(np.int8)
+        part[not_syllable] = -1
+        parts.append(part)
+    return tuple(parts)
+
+
+def compose_array(initial, medial, final=None):
+    """
+    Syllable code points of jamo index arrays, at once.
+
+    Args:
+        initial, medial: Index arrays
+        final: Index array (default: no finals)
+
+    Returns:
+        uint32 array of code points
+
+    Raises:
+        ValueError: An index is out of range
+    """
+    np = numpy()
+    initial = np.asarray(initial, dtype=np.int32)
+    medial = np.asarray(medial, dtype=np.int32)
+    final = np.zeros_like(initial) if final is None else np.asarray(final, dtype=np.int32)
+    for name, part, count in (("initial", initial, len(INITIALS)), ("medial", medial, MEDIAL_COUNT),
+                              ("final", final, FINAL_COUNT)):
+        if part.size and (part.min() < 0 or part.max() >= count):
+            raise ValueError(f"{name} jamo indexes must be in 0..{count - 1}")
+    return (SYLLABLE_BASE + initial * BLOCK + medial * FINAL_COUNT + final).astype(np.uint32)
+
+
+def jamo_array(codes, conjoining: bool = False):
+    """
+    Code points with every syllable replaced by its jamo, at once.
+
+    Empty finals are dropped and other code points are kept as they are,
+    so from_codepoints(jamo_array(codepoints(text))) == to_jamo(text).
+
+    Args:
+        codes: 1-D array of code points
+        conjoining: Conjoining jamo (U+1100..) rather than compatibility jamo
+    """
+    np = numpy()
+    codes = np.asarray(codes, dtype=np.uint32)
+    table = tables(conjoining)
+    initial, medial, final = decompose_array(codes)
+    syllable = initial >= 0
+    # Index -1 reads a table's last entry; those values are masked out below
+    out = np.empty((codes.size, 3), dtype=np.uint32)
+    out[:, 0] = np.where(syllable, table["initial"][initial], codes)
+    out[:, 1] = table["medial"][medial]
+    out[:, 2] = table["final"][final]
+    keep = np.empty((codes.size, 3), dtype=bool)
+    keep[:, 0] = True
+    keep[:, 1] = syllable
+    keep[:, 2] = syllable & (final > 0)
+    return out[keep]
+
+
+def jamo_counts(codes) -> Dict[str, object]:
+    """
+    How often each jamo occurs in the syllables of an array of code points.
+
+    Returns:
+        "initial" (19), "medial" (21), "final" (28) count arrays, indexed
+        like INITIALS, MEDIALS and FINALS
+    """
+    np = numpy()
+    initial, medial, final = decompose_array(codes)
+    syllable = initial >= 0
+    return {name: np.bincount(part[syllable], minlength=count)
+            for name, part, count in (("initial", initial, len(INITIALS)), ("medial", medial, MEDIAL_COUNT),
+                                      ("final", final, FINAL_COUNT))}
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Streaming ingestion of external word lists into decks.
+
+Frequency lists and dictionary exports can run to hundreds of thousands
+of rows, so they are never loaded whole. An IngestSource reads a CSV,
+TSV or JSONL file row by row and maps its columns to the fields of a row
+type (lib.records.WordRow, SentenceRow, ...). stream_deck() then builds
+the deck one chunk at a time: validate, dedupe, synthesize the chunk's
+audio, append its notes to the package writer, and drop the chunk.
+
+What stays in memory grows only with what has to be remembered across
+chunks: the dedupe set and the set of clips packaged (8-16 bytes per
+distinct key or clip, see SeenSet), and the package writer's list of
+media paths, which it needs until the zip is written. Rows, records,
+notes and the build context's media registry never accumulate: the
+context's clips are released to the writer after every chunk.
+
+The stage cache of build_deck() is not used here: caching every row of
+a large list would hold it all again. Clips still come from the build
+context's clip cache when it has one.
+"""
+
+import csv
+import hashlib
+import itertools
+import json
+import os
+import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, Optional, Sequence
+
+import genanki
+
+from lib.build_context import BuildContext, build_context, clip_name
+from lib.deck_spec import DeckSpec, deck_model
+from lib.korean_deck_base import create_colored_html
+from lib.package_writer import StreamingPackageWriter
+from lib.records import load_records
+
+
+DEFAULT_CHUNK_SIZE = 1000
+DEFAULT_AUDIO_WORKERS = 8
+
+# Source extension -> csv delimiter (None: JSON lines)
+SOURCE_FORMATS = {".csv": ",", ".tsv": "\t", ".jsonl": None}
+
+
+def read_source(path: str, source_format: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Stream rows of a CSV, TSV (with a header line) or JSONL file as dicts.
+
+    Args:
+        path: Source file
+        source_format: "csv", "tsv" or "jsonl" (default: from the extension)
+    """
+    ext = f".{source_format}" if source_format else os.path.splitext(path)[1].lower()
+    if ext not in SOURCE_FORMATS:
+        raise ValueError(f"{path}: unknown format {ext!r} (expected one of {', '.join(SOURCE_FORMATS)})")
+    delimiter = SOURCE_FORMATS[ext]
+
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        if delimiter is None:
+            for number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except ValueError as e:
+                    raise ValueError(f"{path}:{number}: {e}")
+        else:
+            yield from csv.DictReader(f, delimiter=delimiter)
+
+
+class IngestSource:
+    """
+    An external file as a table for a Section, read lazily.
+
+    Example:
+        >>> rows = IngestSource("freq.tsv", {"korean": "lemma", "english": "gloss"})
+        >>> Section("words", rows, WordRow, fields=WORD_NOTE_FIELDS, audio="korean")
+    """
+
+    def __init__(self, path: str, columns: Dict[str, str], source_format: Optional[str] = None):
+        """
+        Args:
+            path: CSV, TSV or JSONL file
+            columns: Row field -> source column; unmapped fields get their defaults
+            source_format: See read_source()
+        """
+        self.path = path
+        self.columns = dict(columns)
+        self.source_format = source_format
+
+    def __repr__(self) -> str:
+        return f"IngestSource({self.path!r})"
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """Rows as dicts keyed by row field; empty cells are left out."""
+        columns = list(self.columns.items())
+        for number, row in enumerate(read_source(self.path, self.source_format), 1):
+            mapped = {}
+            for field, column in columns:
+                if column not in row:
+                    raise ValueError(f"{self.path}: row {number} has no column {column!r}")
+                value = row[column]
+                if value not in (None, ""):
+                    mapped[field] = value.strip() if isinstance(value, str) else value
+            yield mapped
+
+
+class SeenSet:
+    """
+    Set of 64-bit key hashes for deduping a stream, 8-16 bytes per key.
+
+    An open-addressing table in an array, instead of a Python set of
+    strings. Keys are hashed with BLAKE2b, so a false duplicate needs a
+    64-bit collision.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        size = 1
+        while size < capacity * 2:
+            size *= 2
+        self._table = array("Q", bytes(8 * size))
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    @staticmethod
+    def _hash(key: str) -> int:
+        value = int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "little")
+        # 0 marks an empty slot
+        return value or 1
+
+    def __contains__(self, key: str) -> bool:
+        value = self._hash(key)
+        mask = len(self._table) - 1
+        slot = value & mask
+        while self._table[slot]:
+            if self._table[slot] == value:
+                return True
+            slot = (slot + 1) & mask
+        return False
+
+    def add(self, key: str) -> bool:
+        """Add a key. Returns False if it was already there."""
+        if (self._count + 1) * 2 > len(self._table):
+            self._grow()
+        return self._insert(self._table, self._hash(key))
+
+    def _insert(self, table: array, value: int) -> bool:
+        mask = len(table) - 1
+        slot = value & mask
+        while True:
+            current = table[slot]
+            if current == 0:
+                table[slot] = value
+                self._count += 1
+                return True
+            if current == value:
+                return False
+            slot = (slot + 1) & mask
+
+    def _grow(self) -> None:
+        old = self._table
+        self._table = array("Q", bytes(16 * len(old)))
+        self._count = 0
+        for value in old:
+            if value:
+                self._insert(self._table, value)
+
+
+def _chunks(items: Iterable, size: int) -> Iterator[list]:
+    items = iter(items)
+    while True:
+        chunk = list(itertools.islice(items, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _clip_key(request) -> str:
+    text, filename = request
+    return f"{filename or ''}\x1f{text}"
+
+
+def stream_deck(
+    spec: DeckSpec,
+    output_file: str,
+    context: Optional[BuildContext] = None,
+    dedupe: Sequence[str] = ("korean",),
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    audio_workers: int = DEFAULT_AUDIO_WORKERS,
+    **writer_options,
+) -> StreamingPackageWriter:
+    """
+    Build a deck chunk by chunk, with memory independent of its size.
+
+    Args:
+        spec: The deck; section rows are typically IngestSources
+        output_file: Package path, relative to the working directory
+        context: Build context (default: a fresh one, cleaned up afterwards)
+        dedupe: Row fields identifying a duplicate, across all sections
+            (empty: keep every row)
+        chunk_size: Rows validated, spoken and written at a time
+        audio_workers: Threads generating a chunk's audio
+        **writer_options: Passed to StreamingPackageWriter
+
+    Returns:
+        The finished writer
+    """
+    model = deck_model(spec)
+    seen = SeenSet() if dedupe else None
+    # Clips already in the package, so a text spoken in an earlier chunk
+    # is linked without asking the context again
+    packaged = SeenSet()
+    counts: Dict[str, int] = {}
+    duplicates = 0
+    start = time.perf_counter()
+
+    with build_context(context) as context, ThreadPoolExecutor(max_workers=audio_workers) as pool:
+        output_path = os.path.join(os.getcwd(), output_file)
+        packaged_media = 0
+        with StreamingPackageWriter(output_path, spec.deck_id, spec.deck_name, spec.description,
+                                    **writer_options) as writer:
+            for section in spec.sections:
+                counts[section.label] = 0
+                key_fields = [section.row_type._fields.index(name) for name in dedupe]
+                for chunk in _chunks(section.rows, chunk_size):
+                    records = load_records(section.row_type, chunk, section.label)
+                    if section.skip is not None:
+                        records = [record for record in records if not section.skip(record)]
+                    if seen is not None:
+                        kept = []
+                        for record in records:
+                            if seen.add("\x1f".join(str(record[i]) for i in key_fields)):
+                                kept.append(record)
+                        duplicates += len(records) - len(kept)
+                        records = kept
+
+                    clips = {}
+                    missing = []
+                    for request in dict.fromkeys(filter(None, map(section.audio_request, records))):
+                        if _clip_key(request) in packaged:
+                            clips[request] = request[1] or clip_name(request[0])
+                        else:
+                            missing.append(request)
+                    for request, filename in zip(missing, pool.map(lambda request: context.audio(*request),
+                                                                   missing)):
+                        clips[request] = filename
+                        if filename:
+                            packaged.add(_clip_key(request))
+
+                    for record in records:
+                        request = section.audio_request(record)
+                        filename = clips.get(request) if request else None
+                        derived = {"audio": f"[sound:{filename}]" if filename else ""}
+                        word_pairs = section.word_pairs(record)
+                        derived["korean_colored"], derived["english_colored"] = (
+                            create_colored_html(word_pairs) if word_pairs else ("", "")
+                        )
+                        writer.add_note(genanki.Note(model=model, fields=section.note_fields(record, derived),
+                                                     guid=section.note_guid(record)))
+                    counts[section.label] += len(records)
+
+                    # Clips new in this chunk
+                    for path in context.release_media():
+                        writer.add_media_file(path)
+                        packaged_media += 1
+
+        context.stats.notes += writer.note_count
+
+    print(f"✓ Deck created: {output_file}")
+    for label, count in counts.items():
+        print(f"  - {count} {label}")
+    if seen is not None:
+        print(f"  - {duplicates} duplicates skipped")
+    print(f"  - {packaged_media} audio files, {time.perf_counter() - start:.1f}s")
+    return writer
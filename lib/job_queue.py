@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+"""
+SQLite job queue for builds spread over several processes or hosts.
+
+The queue is one SQLite file on storage every worker can reach. Workers
+lease a job for a limited time and keep the lease alive with heartbeats;
+a job whose lease runs out (worker crashed, host lost) goes back to the
+queue and is retried, up to a maximum number of attempts.
+
+Jobs carry a stage number. Only jobs of the lowest unfinished stage are
+handed out, so a later stage (deck packaging) never starts before an
+earlier one (audio synthesis) is complete.
+
+Each coordinator run is a build with its own id. Jobs are keyed within
+their build, and workers only lease jobs of the latest build, so a queue
+file can be reused: a new build runs every job it submits, whatever
+earlier builds did, and jobs left over from an abandoned build are
+ignored.
+
+Every state change runs in a BEGIN IMMEDIATE transaction with the
+rollback journal, which, unlike WAL, works on network filesystems.
+"""
+
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Any, Dict, List, Optional
+
+
+DEFAULT_LEASE_SECONDS = 60.0
+DEFAULT_MAX_ATTEMPTS = 3
+
+PENDING = "pending"
+LEASED = "leased"
+DONE = "done"
+FAILED = "failed"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    build TEXT NOT NULL,
+    stage INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    key TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    state TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    worker TEXT,
+    lease_expires REAL,
+    result TEXT,
+    error TEXT,
+    finished REAL,
+    UNIQUE (build, key)
+);
+CREATE INDEX IF NOT EXISTS ix_jobs_state ON jobs (build, state, stage);
+CREATE TABLE IF NOT EXISTS queue_meta (name TEXT PRIMARY KEY, value TEXT NOT NULL);
+"""
+
+# Jobs of the build workers take jobs from
+CURRENT_BUILD = "(SELECT value FROM queue_meta WHERE name = 'build')"
+
+
+def worker_id() -> str:
+    """host:pid, unique across the machines sharing a queue."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class Job:
+    """One leased job."""
+
+    def __init__(self, job_id: int, kind: str, key: str, payload: Dict[str, Any], attempts: int):
+        self.id = job_id
+        self.kind = kind
+        self.key = key
+        self.payload = payload
+        self.attempts = attempts
+
+
+class JobQueue:
+    """
+    Lease-based job queue in one SQLite file.
+
+    Example:
+        >>> queue = JobQueue("shared/queue.db")
+        >>> queue.start_build()
+        >>> queue.submit("audio", "audio_1a2b3c4d.mp3", {"text": "안녕"})
+        >>> job = queue.lease("host:123")
+        >>> queue.complete(job, "host:123", {"size": 5120})
+    """
+
+    def __init__(
+        self,
+        path: str,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    ):
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self._conn = sqlite3.connect(path, timeout=60, isolation_level=None, check_same_thread=False)
+        self._lock = threading.Lock()
+        columns = [row[1] for row in self._conn.execute("PRAGMA table_info(jobs)")]
+        if columns and "build" not in columns:
+            # A queue from before builds had ids holds only finished work
+            self._conn.executescript("DROP TABLE jobs; DELETE FROM queue_meta;")
+        self._conn.executescript(SCHEMA)
+        # The build this queue submits to: set by start_build() on the coordinator side
+        self.build: Optional[str] = None
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def _transaction(self, fn):
+        """Run fn(conn) in a write transaction; concurrent writers wait."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                result = fn(self._conn)
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+            return result
+
+    # -------------------------------------------------------------------------
+    # Coordinator side
+    # -------------------------------------------------------------------------
+
+    def start_build(self) -> str:
+        """
+        Start a new build that workers take jobs from, superseding any earlier one.
+
+        Jobs of earlier builds are deleted. Returns the build id.
+        """
+        build = f"{time.strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:8]}"
+
+        def start(conn):
+            conn.execute("DELETE FROM jobs WHERE build != ?", (build,))
+            conn.execute("INSERT OR REPLACE INTO queue_meta (name, value) VALUES ('build', ?)", (build,))
+            conn.execute("DELETE FROM queue_meta WHERE name = 'closed'")
+        self._transaction(start)
+        self.build = build
+        return build
+
+    def _own_build(self) -> str:
+        if self.build is None:
+            raise RuntimeError("no build started: call start_build() first")
+        return self.build
+
+    def submit(self, kind: str, key: str, payload: Dict[str, Any], stage: int = 0) -> bool:
+        """Add a job unless the build has one with the same key. Returns True if added."""
+        return self.submit_many(kind, [(key, payload)], stage) == 1
+
+    def submit_many(self, kind: str, jobs: List[tuple], stage: int = 0) -> int:
+        """Add (key, payload) jobs to the build in one transaction. Returns how many were new."""
+        build = self._own_build()
+
+        def insert(conn):
+            before = conn.total_changes
+            conn.executemany(
+                "INSERT OR IGNORE INTO jobs (build, stage, kind, key, payload) VALUES (?, ?, ?, ?, ?)",
+                [(build, stage, kind, key, json.dumps(payload, ensure_ascii=False)) for key, payload in jobs],
+            )
+            return conn.total_changes - before
+        return self._transaction(insert)
+
+    def close_submissions(self) -> None:
+        """Tell workers no more jobs are coming, so they exit once the build drains."""
+        build = self._own_build()
+        self._transaction(lambda conn: conn.execute(
+            "INSERT OR REPLACE INTO queue_meta (name, value) VALUES ('closed', ?)", (build,)
+        ))
+
+    def _meta(self, name: str) -> Optional[str]:
+        row = self._conn.execute("SELECT value FROM queue_meta WHERE name = ?", (name,)).fetchone()
+        return row[0] if row else None
+
+    @property
+    def current_build(self) -> Optional[str]:
+        """The latest build, which workers take jobs from."""
+        return self._meta("build")
+
+    @property
+    def closed(self) -> bool:
+        closed = self._meta("closed")
+        return closed is not None and closed == self.current_build
+
+    def _watched_build(self) -> Optional[str]:
+        """The build whose jobs counts() and results() report: our own, else the current one."""
+        return self.build or self.current_build
+
+    def counts(self) -> Dict[str, int]:
+        """Number of jobs of the build in each state."""
+        counts = {PENDING: 0, LEASED: 0, DONE: 0, FAILED: 0}
+        for state, count in self._conn.execute(
+                "SELECT state, count(*) FROM jobs WHERE build = ? GROUP BY state", (self._watched_build(),)):
+            counts[state] = count
+        return counts
+
+    def results(self, kind: str) -> List[Dict[str, Any]]:
+        """Finished and failed jobs of the build of one kind, ordered by key."""
+        rows = self._conn.execute(
+            "SELECT key, state, attempts, worker, result, error FROM jobs WHERE build = ? AND kind = ? "
+            "ORDER BY key",
+            (self._watched_build(), kind),
+        )
+        return [
+            {"key": key, "state": state, "attempts": attempts, "worker": worker,
+             "result": json.loads(result) if result else None, "error": error}
+            for key, state, attempts, worker, result, error in rows
+        ]
+
+    # -------------------------------------------------------------------------
+    # Worker side
+    # -------------------------------------------------------------------------
+
+    def lease(self, worker: str) -> Optional[Job]:
+        """
+        Take the next runnable job, or None if there is none right now.
+
+        Expired leases are reclaimed first: such jobs go back to pending,
+        or to failed once they have used up their attempts.
+        """
+        def take(conn):
+            now = time.time()
+            conn.execute(
+                "UPDATE jobs SET state = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, "
+                "error = COALESCE(error, 'lease expired'), worker = NULL "
+                f"WHERE build = {CURRENT_BUILD} AND state = 'leased' AND lease_expires < ?",
+                (self.max_attempts, now),
+            )
+            row = conn.execute(
+                "SELECT id, kind, key, payload, attempts FROM jobs "
+                f"WHERE build = {CURRENT_BUILD} AND state = 'pending' AND stage = "
+                f"(SELECT MIN(stage) FROM jobs WHERE build = {CURRENT_BUILD} AND state IN ('pending', 'leased')) "
+                "ORDER BY id LIMIT 1"
+            ).fetchone()
+            if row is None:
+                return None
+            job_id, kind, key, payload, attempts = row
+            conn.execute(
+                "UPDATE jobs SET state = 'leased', worker = ?, lease_expires = ?, attempts = attempts + 1 "
+                "WHERE id = ?",
+                (worker, now + self.lease_seconds, job_id),
+            )
+            return Job(job_id, kind, key, json.loads(payload), attempts + 1)
+        return self._transaction(take)
+
+    def heartbeat(self, job: Job, worker: str) -> bool:
+        """Extend a lease. Returns False if the job is no longer ours."""
+        def extend(conn):
+            cursor = conn.execute(
+                "UPDATE jobs SET lease_expires = ? WHERE id = ? AND worker = ? AND state = 'leased'",
+                (time.time() + self.lease_seconds, job.id, worker),
+            )
+            return cursor.rowcount == 1
+        return self._transaction(extend)
+
+    def complete(self, job: Job, worker: str, result: Dict[str, Any]) -> bool:
+        """Record a result. Returns False if the lease was lost to another worker."""
+        def finish(conn):
+            cursor = conn.execute(
+                "UPDATE jobs SET state = 'done', result = ?, error = NULL, finished = ? "
+                "WHERE id = ? AND worker = ? AND state = 'leased'",
+                (json.dumps(result, ensure_ascii=False), time.time(), job.id, worker),
+            )
+            return cursor.rowcount == 1
+        return self._transaction(finish)
+
+    def fail(self, job: Job, worker: str, error: str) -> bool:
+        """Give a job back for a retry, or mark it failed after the last attempt."""
+        def give_back(conn):
+            cursor = conn.execute(
+                "UPDATE jobs SET state = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, "
+                "error = ?, worker = NULL, finished = ? WHERE id = ? AND worker = ? AND state = 'leased'",
+                (self.max_attempts, error, time.time(), job.id, worker),
+            )
+            return cursor.rowcount == 1
+        return self._transaction(give_back)
+
+    def drained(self) -> bool:
+        """
+        True once the build's submissions are closed and every job is done or failed.
+
+        Raises:
+            RuntimeError: This queue's build was superseded by a newer one
+        """
+        current = self.current_build
+        if self.build is not None and current != self.build:
+            raise RuntimeError(f"build {self.build} was superseded by build {current}")
+        return self.closed and not self._conn.execute(
+            "SELECT 1 FROM jobs WHERE build = ? AND state IN ('pending', 'leased') LIMIT 1", (current,)
+        ).fetchone()
+
+
+class Heartbeat:
+    """Keeps a job's lease alive from a background thread while it runs."""
+
+    def __init__(self, queue: JobQueue, job: Job, worker: str, interval: Optional[float] = None):
+        self.queue = queue
+        self.job = job
+        self.worker = worker
+        self.interval = interval or queue.lease_seconds / 3
+        self.lost = False
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def __enter__(self) -> "Heartbeat":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            if not self.queue.heartbeat(self.job, self.worker):
+                self.lost = True
+                return
@@ -6,10 +6,11 @@ Provides common utilities, card classes, and templates.
 
 import genanki
 import os
-import tempfile
-import shutil
-from typing import List, Optional, Tuple, Dict, Any
-from gtts import gTTS
+from typing import Iterable, List, Optional, Tuple, Dict, Any
+
+from lib.build_context import BuildContext, build_context
+from lib.package_writer import StreamingPackageWriter
+from lib.sharding import MediaIndex, ShardedPackageWriter, remove_stale_outputs
 
 
 # =============================================================================
@@ -67,6 +68,7 @@ MODEL_IDS = {
     "verbs": 1482931034,
     "honorifics": 1482931035,
     "idioms": 1482931036,
+    "media_pack": 1482931038,
 }
 
 # Deck ID registry
@@ -89,12 +91,9 @@ DECK_IDS = {
     "grammar_intermediate": 1837523959,
     "idioms": 1837523960,
     "conversation_1": 1837523961,
+    "media_pack": 1837523966,
 }
 
-# Global to store audio files for cleanup
-created_audio_files = []
-
-
 class KoreanCard:
     """Base class for a Korean Anki card."""
 
@@ -171,28 +170,13 @@ class KoreanSentenceCard(KoreanCard):
         return "", ""
 
 
-def generate_audio(text: str, audio_dir: str) -> Optional[str]:
-    """Generate TTS audio file for Korean text."""
-    if not text:
-        return None
-
-    try:
-        tts = gTTS(text=text, lang='ko')
-        # Use a hash of the text to avoid duplicates
-        import hashlib
-        text_hash = hashlib.md5(text.encode('utf-8')).hexdigest()[:8]
-        audio_filename = f"audio_{text_hash}.mp3"
-        audio_path = os.path.join(audio_dir, audio_filename)
-
-        # Only create if doesn't exist
-        if not os.path.exists(audio_path):
-            tts.save(audio_path)
-            created_audio_files.append(audio_path)
-
-        return audio_filename
-    except Exception as e:
-        print(f"Warning: Could not generate audio for '{text}': {e}")
-        return None
+# Note fields of the shared word and sentence models, in model order
+# (see lib.deck_spec for the derived colored and audio fields)
+WORD_NOTE_FIELDS = [
+    "korean", "english", "romanization", "example", "example_translation",
+    "korean_colored", "english_colored", "audio",
+]
+SENTENCE_NOTE_FIELDS = ["korean", "english", "breakdown", "korean_colored", "english_colored", "audio"]
 
 
 def create_word_model() -> genanki.Model:
@@ -437,81 +421,74 @@ def generate_deck(
     deck_name: str,
     deck_id: int,
     model: genanki.Model,
-    cards: List[genanki.Note],
+    cards: Iterable[genanki.Note],
     output_file: str,
+    max_notes: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    context: Optional[BuildContext] = None,
 ) -> None:
-    """Generate an Anki deck with media files."""
-    global created_audio_files
-    created_audio_files.clear()
-
-    # Create temporary directory for audio files
-    audio_dir = tempfile.mkdtemp()
-
-    try:
-        deck = genanki.Deck(deck_id, deck_name)
-        for card in cards:
-            deck.add_note(card)
-
-        # Generate the package with media files
-        package = genanki.Package(deck)
+    """
+    Generate an Anki deck with media files.
 
-        if created_audio_files:
-            package.media_files = created_audio_files
+    Notes are streamed into the package as they are produced, so `cards`
+    may be a generator and is never held in memory as a whole.
 
+    Args:
+        max_notes: Split the deck into numbered shards of at most this many notes
+        max_bytes: Split the deck into numbered shards of roughly this many bytes
+        context: Build context the cards generate their audio in; pass the
+            same one used to make `cards`
+    """
+    with build_context(context) as context:
         # Write the package
         output_path = os.path.join(os.getcwd(), output_file)
-        package.write_to_file(output_path)
+
+        if max_notes or max_bytes:
+            with ShardedPackageWriter(
+                output_path, deck_id, deck_name, MediaIndex(context.media_files),
+                max_notes=max_notes, max_bytes=max_bytes,
+            ) as sharded:
+                sharded.add_notes(cards)
+
+            print(f"✓ Deck created: {output_file} in {len(sharded.paths)} package(s)")
+            for path, writer in zip(sharded.paths, sharded.writers):
+                print(f"  - {os.path.basename(path)}: {writer.note_count} cards, "
+                      f"{writer.media_report()}, written in {writer.format_timings()}")
+            print()
+            return
+
+        with StreamingPackageWriter(output_path, deck_id, deck_name) as writer:
+            writer.add_notes(cards)
+            for path in context.media_files:
+                writer.add_media_file(path)
+        remove_stale_outputs(output_path, [output_path])
 
         print(f"✓ Deck created: {output_file}")
-        print(f"  - {len(cards)} cards")
-        print(f"  - {len(created_audio_files)} audio files")
+        print(f"  - {writer.note_count} cards")
+        print(f"  - {writer.media_report()}")
+        print(f"  - written in {writer.format_timings()}")
         print()
 
-    finally:
-        # Clean up temp directory
-        try:
-            shutil.rmtree(audio_dir)
-        except:
-            pass
-
 
-def add_word_note(deck, model, card: KoreanWordCard, audio_dir: str) -> genanki.Note:
-    """Create a word note with optional audio and colored word alignment."""
-    audio_filename = generate_audio(card.audio_text, audio_dir)
-    audio_field = f"[sound:{audio_filename}]" if audio_filename else ""
-
-    korean_colored, english_colored = card.get_colored_html()
-
-    return genanki.Note(
-        model=model,
-        fields=[
-            card.korean,
-            card.english,
-            card.romanization,
-            card.example,
-            card.example_translation,
-            korean_colored,
-            english_colored,
-            audio_field,
-        ],
-    )
-
-
-def add_sentence_note(deck, model, card: KoreanSentenceCard, audio_dir: str) -> genanki.Note:
-    """Create a sentence note with optional audio and colored word alignment."""
-    audio_filename = generate_audio(card.audio_text, audio_dir)
-    audio_field = f"[sound:{audio_filename}]" if audio_filename else ""
+def write_package(
+    deck: genanki.Deck,
+    media_files: List[str],
+    output_file: str,
+    **writer_options,
+) -> StreamingPackageWriter:
+    """
+    Write a built deck and its media to a package.
 
-    korean_colored, english_colored = card.get_colored_html()
+    Only media the notes reference is shipped; a note referencing a file
+    that is not in `media_files` fails the build with MediaReferenceError.
 
-    return genanki.Note(
-        model=model,
-        fields=[
-            card.korean,
-            card.english,
-            card.breakdown,
-            korean_colored,
-            english_colored,
-            audio_field,
-        ],
-    )
+    Returns:
+        The finished writer, for counts, pruning and timing reports
+    """
+    output_path = os.path.join(os.getcwd(), output_file)
+    with StreamingPackageWriter(output_path, deck.deck_id, deck.name, deck.description, **writer_options) as writer:
+        writer.add_notes(deck.notes)
+        for path in media_files:
+            writer.add_media_file(path)
+    remove_stale_outputs(output_path, [output_path])
+    return writer
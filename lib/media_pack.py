@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Shared media pack for Korean Anki decks.
+
+Splits built packages into content-only packages (notes, no media) plus
+one versioned media pack holding the deduplicated clips of every deck.
+The media pack version is a digest of its contents, so it only changes
+when audio changes; text fixes ship as small content packages.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import zipfile
+from typing import Dict, List, Tuple
+
+from lib.apkg_reader import ApkgReader
+from lib.korean_deck_base import DECK_IDS, MODEL_IDS
+
+
+MANIFEST_NAME = "media_pack.json"
+
+
+class MediaEntry:
+    """One deduplicated media file and the package it is read from."""
+
+    def __init__(self, filename: str, digest: str, size: int, source: str, entry: str):
+        self.filename = filename
+        self.digest = digest
+        self.size = size
+        self.source = source
+        self.entry = entry
+
+
+def collect_media(package_paths: List[str]) -> Tuple[Dict[str, MediaEntry], Dict[str, List[str]], List[str]]:
+    """
+    Gather the media of every package, deduplicated by filename.
+
+    Audio filenames are derived from the spoken text, so two packages
+    shipping different bytes under one name hold separate TTS runs of the
+    same clip. The first copy is kept and the name is reported.
+
+    Returns:
+        Tuple of (media by filename, media filenames per package basename,
+        filenames whose bytes differed between packages)
+    """
+    media: Dict[str, MediaEntry] = {}
+    per_deck: Dict[str, List[str]] = {}
+    mismatched: List[str] = []
+
+    for path in package_paths:
+        names = []
+        with ApkgReader(path) as reader:
+            for entry, filename, size in reader.media():
+                digest = hashlib.sha1(reader.read_media(entry)).hexdigest()
+                existing = media.get(filename)
+                if existing is None:
+                    media[filename] = MediaEntry(filename, digest, size, path, entry)
+                elif existing.digest != digest and filename not in mismatched:
+                    mismatched.append(filename)
+                names.append(filename)
+        per_deck[os.path.basename(path)] = sorted(names)
+
+    return media, per_deck, mismatched
+
+
+def media_pack_version(media: Dict[str, MediaEntry]) -> str:
+    """Content version of a media pack: a digest over names and bytes."""
+    h = hashlib.sha1()
+    for filename in sorted(media):
+        h.update(filename.encode("utf-8"))
+        h.update(media[filename].digest.encode("ascii"))
+    return h.hexdigest()[:12]
+
+
+def write_content_package(source: str, output_path: str, version: str) -> int:
+    """
+    Write a copy of a package without its media.
+
+    The deck description records the media pack version the notes need.
+
+    Returns:
+        Size of the written package in bytes
+    """
+    with ApkgReader(source) as reader:
+        conn = reader.open_collection()
+        collection_name = reader.collection_name
+
+    try:
+        decks = json.loads(conn.execute("SELECT decks FROM col").fetchone()[0])
+        for deck_id, deck in decks.items():
+            if deck_id == "1":
+                continue
+            deck["desc"] = f"Requires Korean media pack v{version}"
+        conn.execute("UPDATE col SET decks = ?", (json.dumps(decks),))
+        conn.commit()
+        collection = conn.serialize()
+    finally:
+        conn.close()
+
+    with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as out:
+        out.writestr(collection_name, collection)
+        out.writestr("media", "{}")
+
+    return os.path.getsize(output_path)
+
+
+def write_media_pack(media: Dict[str, MediaEntry], output_path: str, version: str) -> int:
+    """
+    Write the shared media pack as an importable package.
+
+    The pack holds a single note whose hidden field references every clip,
+    so Anki imports all of them into the collection's media folder.
+
+    Returns:
+        Size of the written package in bytes
+    """
+    import genanki
+
+    model = genanki.Model(
+        MODEL_IDS["media_pack"],
+        "Korean Media Pack Model",
+        fields=[{"name": "Title"}, {"name": "Media"}],
+        templates=[
+            {
+                "name": "Korean Media Pack Card",
+                "qfmt": '<div style="text-align: center; font-size: 24px;">{{Title}}</div>',
+                "afmt": '<div style="text-align: center; font-size: 24px;">{{Title}}</div>',
+            },
+        ],
+    )
+    deck = genanki.Deck(DECK_IDS["media_pack"], "Korean Media Pack - 오디오")
+    deck.add_note(genanki.Note(
+        model=model,
+        fields=[
+            f"Korean media pack v{version} ({len(media)} audio files)",
+            "".join(f"[sound:{name}]" for name in sorted(media)),
+        ],
+        guid=genanki.guid_for("korean-media-pack"),
+    ))
+
+    # Extract the deduplicated clips for genanki to pick up
+    media_dir = tempfile.mkdtemp()
+
+    try:
+        paths = []
+        readers: Dict[str, ApkgReader] = {}
+        try:
+            for filename in sorted(media):
+                item = media[filename]
+                if item.source not in readers:
+                    readers[item.source] = ApkgReader(item.source)
+                path = os.path.join(media_dir, filename)
+                with open(path, "wb") as f:
+                    f.write(readers[item.source].read_media(item.entry))
+                paths.append(path)
+        finally:
+            for reader in readers.values():
+                reader.close()
+
+        package = genanki.Package(deck)
+        package.media_files = paths
+        package.write_to_file(output_path)
+
+    finally:
+        try:
+            shutil.rmtree(media_dir)
+        except:
+            pass
+
+    return os.path.getsize(output_path)
+
+
+def build_media_pack(package_paths: List[str], output_dir: str) -> Dict:
+    """
+    Split packages into content-only packages plus one shared media pack.
+
+    Writes every content package, the media pack and a manifest recording
+    the media pack version each content package needs.
+
+    Returns:
+        The manifest dict
+    """
+    os.makedirs(output_dir, exist_ok=True)
+
+    media, per_deck, mismatched = collect_media(package_paths)
+    version = media_pack_version(media)
+    pack_file = f"korean_media_pack_v{version}.apkg"
+
+    manifest = {
+        "media_pack": {
+            "version": version,
+            "file": pack_file,
+            "files": len(media),
+            "media_bytes": sum(item.size for item in media.values()),
+            "mismatched": sorted(mismatched),
+        },
+        "decks": {},
+    }
+
+    pack_path = os.path.join(output_dir, pack_file)
+    if not os.path.exists(pack_path):
+        write_media_pack(media, pack_path, version)
+    manifest["media_pack"]["bytes"] = os.path.getsize(pack_path)
+
+    for path in package_paths:
+        name = os.path.basename(path)
+        size = write_content_package(path, os.path.join(output_dir, name), version)
+        manifest["decks"][name] = {
+            "media_pack": version,
+            "media": len(per_deck[name]),
+            "bytes": size,
+        }
+
+    with open(os.path.join(output_dir, MANIFEST_NAME), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False, sort_keys=True)
+
+    return manifest
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Conversion between the legacy and anki21b package layouts.
+
+The collection database is carried over byte for byte; only its
+compression and the media container change. compare_packages() checks
+that two packages hold the same notes, cards, models, decks and media
+regardless of layout.
+"""
+
+import hashlib
+import json
+import zipfile
+from typing import Dict, List
+
+from lib import anki21b
+from lib.apkg_reader import ApkgReader
+from lib.package_writer import PACKAGE_FORMATS, media_compress_type
+
+
+def convert_package(
+    source: str,
+    output_path: str,
+    package_format: str = "anki21b",
+    zstd_level: int = anki21b.DEFAULT_ZSTD_LEVEL,
+) -> None:
+    """
+    Re-pack a package in the given layout.
+
+    Raises:
+        ValueError: if package_format is unknown
+    """
+    if package_format not in PACKAGE_FORMATS:
+        raise ValueError(f"Unknown package format {package_format!r}; expected one of {PACKAGE_FORMATS}")
+
+    with ApkgReader(source) as reader, zipfile.ZipFile(output_path, "w") as outzip:
+        collection = reader.collection_bytes()
+
+        if package_format == "anki2":
+            outzip.writestr(anki21b.LEGACY_COLLECTION_NAME, collection, compress_type=zipfile.ZIP_DEFLATED)
+            media_json = {}
+            for entry, filename, _ in reader.media():
+                outzip.writestr(entry, reader.read_media(entry), compress_type=media_compress_type(filename))
+                media_json[entry] = filename
+            outzip.writestr("media", json.dumps(media_json), compress_type=zipfile.ZIP_DEFLATED)
+            return
+
+        compressor = anki21b.zstd().ZstdCompressor(level=zstd_level)
+        outzip.writestr(anki21b.LEGACY_COLLECTION_NAME, anki21b.legacy_stub_collection(),
+                        compress_type=zipfile.ZIP_DEFLATED)
+        outzip.writestr(anki21b.COLLECTION_NAME, compressor.compress(collection))
+
+        # anki21b media entries are numbered in manifest order
+        manifest = []
+        for idx, (entry, filename, _) in enumerate(reader.media()):
+            data = reader.read_media(entry)
+            outzip.writestr(str(idx), compressor.compress(data))
+            manifest.append((filename, len(data), hashlib.sha1(data).digest()))
+        outzip.writestr("media", compressor.compress(anki21b.encode_media_entries(manifest)))
+        outzip.writestr("meta", anki21b.encode_meta(anki21b.VERSION_LATEST))
+
+
+def _package_contents(path: str) -> Dict[str, object]:
+    with ApkgReader(path) as reader:
+        media = {filename: hashlib.sha1(reader.read_media(entry)).hexdigest()
+                 for entry, filename, _ in reader.media()}
+        conn = reader.open_collection()
+
+    try:
+        models_json, decks_json = conn.execute("SELECT models, decks FROM col").fetchone()
+        return {
+            "models": json.loads(models_json),
+            "decks": json.loads(decks_json),
+            "notes": conn.execute("SELECT guid, mid, tags, flds FROM notes ORDER BY guid").fetchall(),
+            "cards": conn.execute(
+                "SELECT n.guid, c.ord, c.did FROM cards c JOIN notes n ON n.id = c.nid ORDER BY n.guid, c.ord"
+            ).fetchall(),
+            "media": media,
+        }
+    finally:
+        conn.close()
+
+
+def compare_packages(a: str, b: str) -> List[str]:
+    """
+    Differences in content between two packages, in any layouts.
+
+    Returns:
+        One line per differing part; empty if the packages are equivalent
+    """
+    first, second = _package_contents(a), _package_contents(b)
+    problems = []
+    for part in ("models", "decks", "notes", "cards"):
+        if first[part] != second[part]:
+            problems.append(f"{part} differ")
+    for name in sorted(set(first["media"]) | set(second["media"])):
+        if first["media"].get(name) != second["media"].get(name):
+            problems.append(f"media {name} differs")
+    return problems
@@ -0,0 +1,459 @@
+#!/usr/bin/env python3
+"""
+Streaming .apkg writer for large Korean decks.
+
+genanki's Package keeps every Note in Deck.notes and inserts them one row
+at a time when the package is written. StreamingPackageWriter instead
+accepts notes from any iterable, buffers at most one batch of rows, and
+inserts each batch with executemany into a throwaway build database, so
+peak memory stays flat regardless of note count.
+
+Media that is already compressed (MP3, images) is stored as-is, while the
+collection is deflated at a configurable level. Media entries are read,
+checksummed and, for anki21b, compressed in worker threads while the main
+thread writes the archive through zipfile's public API.
+
+Every note field is scanned for media references as it is added. When the
+package is closed, a reference with no matching media file fails the
+build, and media files no note references are left out.
+
+package_format="anki21b" writes the newer package layout instead (see
+lib.anki21b): zstd-compressed collection and media plus a protobuf media
+manifest.
+"""
+
+import hashlib
+import itertools
+import json
+import os
+import re
+import sqlite3
+import tempfile
+import time
+import zipfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import genanki
+from genanki.apkg_col import APKG_COL
+from genanki.apkg_schema import APKG_SCHEMA
+
+from lib import anki21b
+
+
+# Rows buffered before each executemany + commit
+DEFAULT_BATCH_SIZE = 5000
+
+# The build database is written once and zipped, so it needs no durability
+BUILD_PRAGMAS = [
+    "PRAGMA journal_mode = OFF",
+    "PRAGMA synchronous = OFF",
+    "PRAGMA locking_mode = EXCLUSIVE",
+    "PRAGMA cache_size = -16000",
+]
+
+# Formats that deflate cannot shrink; stored uncompressed
+STORED_EXTENSIONS = {
+    ".mp3", ".ogg", ".opus", ".m4a", ".aac", ".flac",
+    ".jpg", ".jpeg", ".png", ".gif", ".webp", ".mp4", ".webm",
+}
+
+DEFAULT_COLLECTION_LEVEL = 6
+DEFAULT_MEDIA_LEVEL = 6
+
+PACKAGE_FORMATS = ("anki2", "anki21b")
+
+# Below this many media files the thread pool costs more than it saves
+PARALLEL_MEDIA_THRESHOLD = 32
+
+# [sound:file.mp3] and <img src="file.png"> references in note fields
+MEDIA_REF_RE = re.compile(r"""\[sound:([^\]]+)\]|<img[^>]*?\ssrc=["']?([^"'>\s]+)""", re.IGNORECASE)
+
+NOTE_INSERT = "INSERT INTO notes VALUES(?,?,?,?,?,?,?,?,?,?,?)"
+CARD_INSERT = "INSERT INTO cards VALUES(?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)"
+
+
+class MediaReferenceError(ValueError):
+    """A note references a media file the package does not include."""
+
+
+def media_references(text: str) -> List[str]:
+    """Media filenames referenced by one field."""
+    return [sound or img for sound, img in MEDIA_REF_RE.findall(text)]
+
+
+def _split_schema(schema: str):
+    """Split the collection schema into table DDL and deferred index DDL."""
+    tables, indexes = [], []
+    for statement in schema.split(";"):
+        statement = statement.strip()
+        if not statement:
+            continue
+        if statement.upper().startswith("CREATE INDEX"):
+            indexes.append(statement)
+        else:
+            tables.append(statement)
+    return tables, indexes
+
+
+def media_compress_type(filename: str) -> int:
+    """Zip compression for a media file, based on its extension."""
+    if os.path.splitext(filename)[1].lower() in STORED_EXTENSIONS:
+        return zipfile.ZIP_STORED
+    return zipfile.ZIP_DEFLATED
+
+
+def _prepare_media_entry(
+    path: str, arcname: str, zstd_level: Optional[int] = None
+) -> Tuple[zipfile.ZipInfo, bytes, str, int]:
+    """
+    Read, checksum and (for anki21b) compress one media file.
+
+    Runs in worker threads; zstd and hashlib release the GIL on large
+    buffers, so several files are processed at once. With a zstd level
+    the payload is zstd-compressed and stored, as the anki21b format
+    expects. Otherwise it is the file as is: most media is stored, and
+    the rest is deflated by ZipFile.writestr(), as zipfile has no public
+    way to write an entry compressed elsewhere.
+
+    Returns:
+        Tuple of (zip entry info, payload to write, sha1 hex digest, original size)
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+
+    zinfo = zipfile.ZipInfo(arcname, date_time=time.localtime(os.path.getmtime(path))[:6])
+    zinfo.external_attr = 0o600 << 16
+
+    if zstd_level is not None:
+        payload = anki21b.zstd().ZstdCompressor(level=zstd_level).compress(data)
+        zinfo.compress_type = zipfile.ZIP_STORED
+    else:
+        payload = data
+        zinfo.compress_type = media_compress_type(path)
+
+    return zinfo, payload, hashlib.sha1(data).hexdigest(), len(data)
+
+
+def _write_prepared_entry(outzip: zipfile.ZipFile, zinfo: zipfile.ZipInfo, payload: bytes, level: int) -> None:
+    """Append an entry prepared by _prepare_media_entry(), deflating it here if its type asks for that."""
+    outzip.writestr(zinfo, payload, compresslevel=level)
+
+
+class StreamingPackageWriter:
+    """
+    Write one deck to an .apkg from a stream of genanki Notes.
+
+    Example:
+        >>> with StreamingPackageWriter("out.apkg", DECK_ID, "My Deck") as writer:
+        ...     writer.add_notes(note for note in make_notes())
+        ...     writer.add_media_file(path)
+    """
+
+    def __init__(
+        self,
+        output_path: str,
+        deck_id: int,
+        deck_name: str,
+        description: str = "",
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        timestamp: Optional[float] = None,
+        collection_level: int = DEFAULT_COLLECTION_LEVEL,
+        media_level: int = DEFAULT_MEDIA_LEVEL,
+        media_workers: Optional[int] = None,
+        verify_media: bool = True,
+        package_format: str = "anki2",
+        zstd_level: int = anki21b.DEFAULT_ZSTD_LEVEL,
+        id_gen: Optional[Iterator[int]] = None,
+    ):
+        """
+        Args:
+            id_gen: Source of note and card IDs (default: counting up from
+                the timestamp in milliseconds); packages meant to be
+                imported into one collection must share one
+        """
+        if package_format not in PACKAGE_FORMATS:
+            raise ValueError(f"Unknown package format {package_format!r}; expected one of {PACKAGE_FORMATS}")
+
+        self.output_path = output_path
+        self.deck = genanki.Deck(deck_id, deck_name, description)
+        self.batch_size = batch_size
+        self.timestamp = time.time() if timestamp is None else timestamp
+        self.collection_level = collection_level
+        self.media_level = media_level
+        self.media_workers = media_workers
+        self.verify_media = verify_media
+        self.package_format = package_format
+        self.zstd_level = zstd_level
+        self.media_files: List[str] = []
+        self.pruned_media: List[str] = []
+        self.pruned_bytes = 0
+        self.media_checksums: Dict[str, str] = {}
+        self.note_count = 0
+        self.card_count = 0
+        self.timings: Dict[str, float] = {"notes": 0.0}
+
+        self._models = {}
+        self._referenced = set()
+        self._manifest: List[Tuple[str, int, bytes]] = []
+        self._note_rows = []
+        self._card_rows = []
+        self._id_gen = itertools.count(int(self.timestamp * 1000)) if id_gen is None else id_gen
+        self._closed = False
+
+        fd, self._db_path = tempfile.mkstemp(suffix=".anki2")
+        os.close(fd)
+        # close() may run on a worker thread (see lib.sharding)
+        self._conn = sqlite3.connect(self._db_path, isolation_level=None, check_same_thread=False)
+        for pragma in BUILD_PRAGMAS:
+            self._conn.execute(pragma)
+
+        tables, self._indexes = _split_schema(APKG_SCHEMA)
+        for statement in tables:
+            self._conn.execute(statement)
+        self._conn.executescript(APKG_COL)
+
+    def __enter__(self) -> "StreamingPackageWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def add_note(self, note: genanki.Note) -> None:
+        """Buffer one note; flushes when the batch is full."""
+        model = note.model
+        if len(model.fields) != len(note.fields):
+            raise ValueError(
+                f"Note has {len(note.fields)} fields but model {model.name} has {len(model.fields)}"
+            )
+        cards = [(card.ord, card.suspend) for card in note.cards]
+        self._buffer_note(model, note.fields, note.guid, note._format_tags(), note.sort_field, cards, note.due)
+
+    def add_assembled_note(self, model: genanki.Model, fields: List[str], guid: str, card_ords: List[int]) -> None:
+        """
+        Buffer an untagged note whose guid and cards are already known.
+
+        Skips what genanki works out per note (guid hash, card templates),
+        for notes assembled by an earlier build (see lib.stage_cache).
+        """
+        if len(model.fields) != len(fields):
+            raise ValueError(f"Note has {len(fields)} fields but model {model.name} has {len(model.fields)}")
+        self._buffer_note(model, fields, guid, "  ", fields[model.sort_field_index],
+                          [(ord_, False) for ord_ in card_ords], 0)
+
+    def _buffer_note(self, model, fields, guid, tags, sort_field, cards, due) -> None:
+        self._models.setdefault(model.model_id, model)
+
+        for field in fields:
+            if "[sound:" in field or "<img" in field or "<IMG" in field:
+                self._referenced.update(media_references(field))
+
+        mod = int(self.timestamp)
+        note_id = next(self._id_gen)
+        self._note_rows.append((
+            note_id, guid, model.model_id, mod, -1, tags,
+            "\x1f".join(fields), sort_field, 0, 0, "",
+        ))
+        for ord_, suspend in cards:
+            queue = -1 if suspend else 0
+            self._card_rows.append((
+                next(self._id_gen), note_id, self.deck.deck_id, ord_, mod, -1,
+                0, queue, due, 0, 0, 0, 0, 0, 0, 0, 0, "",
+            ))
+
+        if len(self._note_rows) >= self.batch_size:
+            self.flush()
+
+    def add_notes(self, notes: Iterable[genanki.Note]) -> int:
+        """Consume notes from any iterable. Returns how many were added."""
+        start = time.perf_counter()
+        added = 0
+        for note in notes:
+            self.add_note(note)
+            added += 1
+        self.timings["notes"] += time.perf_counter() - start
+        return added
+
+    def add_media_file(self, path: str) -> None:
+        """Include a media file in the package."""
+        self.media_files.append(path)
+
+    def flush(self) -> None:
+        """Insert buffered rows in one transaction."""
+        if not self._note_rows:
+            return
+        self._conn.execute("BEGIN")
+        self._conn.executemany(NOTE_INSERT, self._note_rows)
+        self._conn.executemany(CARD_INSERT, self._card_rows)
+        self._conn.execute("COMMIT")
+        self.note_count += len(self._note_rows)
+        self.card_count += len(self._card_rows)
+        self._note_rows.clear()
+        self._card_rows.clear()
+
+    def _write_collection_json(self) -> None:
+        """Store the deck and model definitions in the col row."""
+        decks = json.loads(self._conn.execute("SELECT decks FROM col").fetchone()[0])
+        decks[str(self.deck.deck_id)] = self.deck.to_json()
+
+        models = json.loads(self._conn.execute("SELECT models FROM col").fetchone()[0])
+        for model_id, model in self._models.items():
+            models[str(model_id)] = model.to_json(self.timestamp, self.deck.deck_id)
+
+        self._conn.execute("UPDATE col SET decks = ?, models = ?", (json.dumps(decks), json.dumps(models)))
+
+    def close(self) -> str:
+        """Finish the collection and write the package. Returns its path."""
+        if self._closed:
+            return self.output_path
+
+        try:
+            start = time.perf_counter()
+            self.flush()
+            self._write_collection_json()
+            for statement in self._indexes:
+                self._conn.execute(statement)
+            self._conn.close()
+            self.timings["collection"] = time.perf_counter() - start
+
+            if self.verify_media:
+                self._verify_media()
+            self._write_zip()
+        finally:
+            self._closed = True
+            self._remove_db()
+
+        self.timings["total"] = sum(self.timings.values())
+        return self.output_path
+
+    def _verify_media(self) -> None:
+        """
+        Check media references against the media files.
+
+        Raises:
+            MediaReferenceError: if a note references a file that is missing
+        """
+        provided: Dict[str, str] = {}
+        for path in self.media_files:
+            provided.setdefault(os.path.basename(path), path)
+
+        dangling = sorted(self._referenced - provided.keys())
+        if dangling:
+            shown = ", ".join(dangling[:5]) + (f" (+{len(dangling) - 5} more)" if len(dangling) > 5 else "")
+            raise MediaReferenceError(
+                f"{self.output_path}: {len(dangling)} referenced media files missing: {shown}"
+            )
+
+        # Drop unreferenced files and repeated paths
+        kept = []
+        for path in self.media_files:
+            name = os.path.basename(path)
+            if name in self._referenced and provided.get(name) == path:
+                kept.append(path)
+                del provided[name]
+            else:
+                self.pruned_media.append(path)
+                self.pruned_bytes += os.path.getsize(path)
+        self.media_files = kept
+
+    def media_report(self) -> str:
+        """Shipped media count, plus what was pruned if anything."""
+        report = f"{len(self.media_files)} audio files"
+        if self.pruned_media:
+            report += f" ({len(self.pruned_media)} unreferenced or repeated pruned, {self.pruned_bytes / 1024:.1f} KB)"
+        return report
+
+    def _write_zip(self) -> None:
+        """Write the collection, media and media manifest into the package."""
+        jobs = [(path, str(idx)) for idx, path in enumerate(self.media_files)]
+        zstd_level = self.zstd_level if self.package_format == "anki21b" else None
+
+        def prepare(job):
+            return _prepare_media_entry(job[0], job[1], zstd_level)
+
+        start = time.perf_counter()
+        with zipfile.ZipFile(self.output_path, "w") as outzip:
+            if len(jobs) < PARALLEL_MEDIA_THRESHOLD or self.media_workers == 1:
+                self._write_collection_entries(outzip)
+                for job in jobs:
+                    self._write_media_entry(outzip, prepare(job))
+            else:
+                workers = self.media_workers or min(32, (os.cpu_count() or 1) + 4)
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    # Bound the prepared payloads held in memory at once
+                    window = workers * 2
+                    job_iter = iter(jobs)
+                    pending = deque(pool.submit(prepare, job) for job in itertools.islice(job_iter, window))
+
+                    # Media preparation overlaps with compressing the collection
+                    self._write_collection_entries(outzip)
+
+                    while pending:
+                        self._write_media_entry(outzip, pending.popleft().result())
+                        for job in itertools.islice(job_iter, 1):
+                            pending.append(pool.submit(prepare, job))
+
+            self._write_media_manifest(outzip)
+        self.timings["zip"] = time.perf_counter() - start
+
+    def _write_collection_entries(self, outzip: zipfile.ZipFile) -> None:
+        if self.package_format == "anki2":
+            outzip.write(
+                self._db_path, anki21b.LEGACY_COLLECTION_NAME,
+                compress_type=zipfile.ZIP_DEFLATED, compresslevel=self.collection_level,
+            )
+            return
+
+        outzip.writestr(anki21b.LEGACY_COLLECTION_NAME, anki21b.legacy_stub_collection(),
+                        compress_type=zipfile.ZIP_DEFLATED)
+
+        # Stream the collection through zstd so it is never fully in memory
+        zinfo = zipfile.ZipInfo(anki21b.COLLECTION_NAME, date_time=time.localtime()[:6])
+        zinfo.compress_type = zipfile.ZIP_STORED
+        force_zip64 = os.path.getsize(self._db_path) > zipfile.ZIP64_LIMIT // 2
+        compressor = anki21b.zstd().ZstdCompressor(level=self.zstd_level)
+        with open(self._db_path, "rb") as src, outzip.open(zinfo, "w", force_zip64=force_zip64) as dest:
+            compressor.copy_stream(src, dest)
+
+    def _write_media_entry(self, outzip: zipfile.ZipFile, prepared: Tuple[zipfile.ZipInfo, bytes, str, int]) -> None:
+        zinfo, payload, digest, size = prepared
+        _write_prepared_entry(outzip, zinfo, payload, self.media_level)
+        name = os.path.basename(self.media_files[int(zinfo.filename)])
+        self.media_checksums[name] = digest
+        self._manifest.append((name, size, bytes.fromhex(digest)))
+
+    def _write_media_manifest(self, outzip: zipfile.ZipFile) -> None:
+        if self.package_format == "anki2":
+            media_json = {str(idx): name for idx, (name, _, _) in enumerate(self._manifest)}
+            outzip.writestr("media", json.dumps(media_json), compress_type=zipfile.ZIP_DEFLATED)
+            return
+
+        manifest = anki21b.encode_media_entries(self._manifest)
+        outzip.writestr("media", anki21b.zstd().ZstdCompressor(level=self.zstd_level).compress(manifest))
+        outzip.writestr("meta", anki21b.encode_meta(anki21b.VERSION_LATEST))
+
+    def format_timings(self) -> str:
+        """One-line summary of where write time went."""
+        parts = [f"{name} {self.timings[name]:.2f}s" for name in ("notes", "collection", "zip") if name in self.timings]
+        return f"{self.timings.get('total', 0.0):.2f}s ({', '.join(parts)})"
+
+    def abort(self) -> None:
+        """Discard the build database without writing a package."""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._conn.close()
+        except sqlite3.Error:
+            pass
+        self._remove_db()
+
+    def _remove_db(self) -> None:
+        try:
+            os.remove(self._db_path)
+        except OSError:
+            pass
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Typed row records for deck data tables.
+
+Every kind of row is a NamedTuple: fields are named and typed, trailing
+optional fields have defaults, and a record costs about the memory of the
+plain tuple it replaces. Row kinds shared by several decks live here;
+a deck with its own table layout declares its row type next to the data.
+
+Tables are validated once, when a Section loads them (load_records):
+arity and field types are checked there, so nothing downstream looks at
+a row's shape again.
+"""
+
+from typing import Any, Callable, List, NamedTuple, Optional, Sequence, Tuple, Type, Union, get_args, get_origin, get_type_hints
+
+
+# (korean, english) pairs colored alike on both sides of a card
+WordPairs = List[Tuple[str, str]]
+
+
+class WordRow(NamedTuple):
+    """A word for the shared word model."""
+    korean: str
+    english: str
+    romanization: str = ""
+    example: str = ""
+    example_translation: str = ""
+    word_pairs: Optional[WordPairs] = None
+
+
+class SentenceRow(NamedTuple):
+    """A sentence for the shared sentence model."""
+    korean: str
+    english: str
+    breakdown: str = ""
+    word_pairs: Optional[WordPairs] = None
+
+
+class VocabRow(NamedTuple):
+    """A vocabulary entry with an example sentence."""
+    korean: str
+    english: str
+    roman: str
+    example: str
+    ex_trans: str
+    word_pairs: Optional[WordPairs] = None
+
+
+def _checker(hint: Any) -> Callable[[Any], bool]:
+    """A test for values fitting a type hint of the kinds row types use, built once per field."""
+    if hint is Any:
+        return lambda value: True
+    if hint is type(None):
+        return lambda value: value is None
+    origin = get_origin(hint)
+    if origin is Union:
+        checks = [_checker(arg) for arg in get_args(hint)]
+        return lambda value: any(check(value) for check in checks)
+    if origin is list:
+        (item,) = get_args(hint)
+        check = _checker(item)
+        return lambda value: isinstance(value, (list, tuple)) and all(map(check, value))
+    if origin is tuple:
+        checks = [_checker(item) for item in get_args(hint)]
+        return lambda value: (isinstance(value, (list, tuple)) and len(value) == len(checks)
+                              and all(check(v) for check, v in zip(checks, value)))
+    return lambda value: isinstance(value, hint)
+
+
+def load_records(row_type: Type[NamedTuple], rows: Sequence[Any], label: str = "rows") -> List[NamedTuple]:
+    """
+    Convert and validate a data table, once.
+
+    Args:
+        row_type: NamedTuple class of the table's rows
+        rows: Records of row_type, plain tuples in field order (trailing
+            optional fields may be left out), dicts keyed by field name
+            (see lib.data_files), or objects with attributes named like
+            the fields
+        label: Table name for error messages
+
+    Returns:
+        The rows as row_type records
+
+    Raises:
+        ValueError: A row has the wrong number of values or a value of the
+            wrong type
+    """
+    fields = row_type._fields
+    required = len(fields) - len(row_type._field_defaults)
+    hints = get_type_hints(row_type)
+    checks = [(name, hints[name], _checker(hints[name])) for name in fields]
+
+    records = []
+    for number, row in enumerate(rows, 1):
+        if isinstance(row, row_type):
+            record = row
+        elif isinstance(row, tuple):
+            if not required <= len(row) <= len(fields):
+                raise ValueError(f"{label}: row {number} has {len(row)} values, expected "
+                                 f"{required}-{len(fields)} ({', '.join(fields)}): {row!r}")
+            record = row_type(*row)
+        else:
+            try:
+                if isinstance(row, dict):
+                    record = row_type(**row)
+                else:
+                    record = row_type(**{name: getattr(row, name) for name in fields if hasattr(row, name)})
+            except TypeError as e:
+                raise ValueError(f"{label}: row {number}: {e}")
+
+        for (name, hint, check), value in zip(checks, record):
+            if not check(value):
+                raise ValueError(f"{label}: row {number} field {name} should be {hint}, got {value!r}")
+        records.append(record)
+    return records
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Size-bounded sharding of large decks into several packages.
+
+Notes are assigned to numbered shards in stream order. A shard is closed
+once it reaches the note or byte limit, and every shard carries the media
+its own notes reference, so each one imports on its own. All shards use
+the same deck ID and name, and note GUIDs depend only on note content,
+so shards can be imported in any order and merge into one deck. Note and
+card IDs come from one counter shared by every shard, so no two shards
+give the same ID to different notes or cards.
+
+Closed shards are finished (indexes, compression, zip) in worker threads
+while the next shard is being filled.
+"""
+
+import glob
+import itertools
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional
+
+import genanki
+
+from lib.package_writer import MediaReferenceError, StreamingPackageWriter, media_references
+
+
+# Approximate collection bytes per note and per card beyond field text
+NOTE_OVERHEAD = 96
+CARD_OVERHEAD = 64
+
+
+class MediaIndex:
+    """
+    Filename -> path lookup over a list that grows while notes are made.
+
+    Audio is generated just before the note that uses it, so lookups only
+    ever need to catch up with the entries appended since the last miss.
+    """
+
+    def __init__(self, paths: List[str]):
+        self._paths = paths
+        self._seen = 0
+        self._by_name: Dict[str, str] = {}
+
+    def __call__(self, filename: str) -> Optional[str]:
+        if filename not in self._by_name:
+            for path in self._paths[self._seen:]:
+                self._by_name[os.path.basename(path)] = path
+            self._seen = len(self._paths)
+        return self._by_name.get(filename)
+
+
+def shard_path(output_path: str, number: int) -> str:
+    """decks/15_x.apkg -> decks/15_x.part01.apkg"""
+    base, ext = os.path.splitext(output_path)
+    return f"{base}.part{number:02d}{ext}"
+
+
+def remove_stale_outputs(output_path: str, keep: Iterable[str]) -> List[str]:
+    """
+    Delete packages an earlier build of the same deck left behind.
+
+    A deck is written either as output_path or as its numbered shards, and
+    the number of shards follows the data, so a rebuild may leave the plain
+    package, surplus shards, or every shard of the other layout in place.
+
+    Args:
+        output_path: The deck's unsharded package path
+        keep: The packages this build wrote
+
+    Returns:
+        The removed paths
+    """
+    keep = {os.path.abspath(path) for path in keep}
+    base, ext = os.path.splitext(output_path)
+    candidates = [output_path] + sorted(glob.glob(f"{glob.escape(base)}.part[0-9][0-9]*{glob.escape(ext)}"))
+    removed = []
+    for path in candidates:
+        if os.path.abspath(path) not in keep and os.path.exists(path):
+            os.remove(path)
+            removed.append(path)
+    return removed
+
+
+class ShardedPackageWriter:
+    """
+    Stream notes into as many packages as the size limits require.
+
+    Example:
+        >>> with ShardedPackageWriter("decks/big.apkg", DECK_ID, "Big", resolve_media,
+        ...                           max_notes=5000) as writer:
+        ...     writer.add_notes(make_notes())
+        >>> writer.paths
+        ['decks/big.part01.apkg', 'decks/big.part02.apkg', ...]
+    """
+
+    def __init__(
+        self,
+        output_path: str,
+        deck_id: int,
+        deck_name: str,
+        resolve_media: Callable[[str], Optional[str]],
+        max_notes: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        workers: Optional[int] = None,
+        **writer_options,
+    ):
+        if not max_notes and not max_bytes:
+            raise ValueError("ShardedPackageWriter needs max_notes or max_bytes")
+
+        self.output_path = output_path
+        self.deck_id = deck_id
+        self.deck_name = deck_name
+        self.resolve_media = resolve_media
+        self.max_notes = max_notes
+        self.max_bytes = max_bytes
+        self.writer_options = writer_options
+        timestamp = writer_options.get("timestamp")
+        self._id_gen = itertools.count(int((time.time() if timestamp is None else timestamp) * 1000))
+        self.paths: List[str] = []
+        self.writers: List[StreamingPackageWriter] = []
+        self.note_count = 0
+
+        self._pool = ThreadPoolExecutor(max_workers=workers or min(4, os.cpu_count() or 1))
+        self._futures = []
+        self._current: Optional[StreamingPackageWriter] = None
+        self._current_media = set()
+        self._current_notes = 0
+        self._current_bytes = 0
+
+    def __enter__(self) -> "ShardedPackageWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def _open_shard(self) -> None:
+        path = shard_path(self.output_path, len(self.paths) + 1)
+        self._current = StreamingPackageWriter(path, self.deck_id, self.deck_name, id_gen=self._id_gen,
+                                               **self.writer_options)
+        self.paths.append(path)
+        self.writers.append(self._current)
+        self._current_media = set()
+        self._current_notes = 0
+        self._current_bytes = 0
+
+    def _close_shard(self) -> None:
+        if self._current is not None:
+            self._futures.append(self._pool.submit(self._current.close))
+            self._current = None
+
+    def _note_media(self, note: genanki.Note) -> Dict[str, str]:
+        """Media filename -> path for every file the note references."""
+        media = {}
+        for field in note.fields:
+            for filename in media_references(field):
+                path = self.resolve_media(filename)
+                if path is None:
+                    raise MediaReferenceError(f"{self.output_path}: referenced media file missing: {filename}")
+                media[filename] = path
+        return media
+
+    def add_note(self, note: genanki.Note) -> None:
+        """Place a note, and the media it needs, into the current shard."""
+        media = self._note_media(note)
+        note_bytes = (
+            sum(len(field.encode("utf-8")) for field in note.fields)
+            + NOTE_OVERHEAD + CARD_OVERHEAD * len(note.model.templates)
+        )
+
+        if self._current is None:
+            self._open_shard()
+
+        new_media = {name: path for name, path in media.items() if name not in self._current_media}
+        added_bytes = note_bytes + sum(os.path.getsize(path) for path in new_media.values())
+
+        full = (
+            (self.max_notes and self._current_notes >= self.max_notes)
+            or (self.max_bytes and self._current_notes and self._current_bytes + added_bytes > self.max_bytes)
+        )
+        if full:
+            self._close_shard()
+            self._open_shard()
+            new_media = media
+            added_bytes = note_bytes + sum(os.path.getsize(path) for path in media.values())
+
+        self._current.add_note(note)
+        for name, path in new_media.items():
+            self._current.add_media_file(path)
+            self._current_media.add(name)
+        self._current_notes += 1
+        self._current_bytes += added_bytes
+        self.note_count += 1
+
+    def add_notes(self, notes: Iterable[genanki.Note]) -> int:
+        """Consume notes from any iterable. Returns how many were added."""
+        added = 0
+        for note in notes:
+            self.add_note(note)
+            added += 1
+        return added
+
+    def close(self) -> List[str]:
+        """
+        Finish every shard and remove packages of earlier builds this one
+        does not replace. Returns the written package paths.
+        """
+        try:
+            self._close_shard()
+            for future in self._futures:
+                future.result()
+        except BaseException:
+            self.abort()
+            raise
+        finally:
+            self._pool.shutdown()
+
+        # A deck that fits in one package keeps its plain name
+        if len(self.paths) == 1:
+            os.replace(self.paths[0], self.output_path)
+            self.paths = [self.output_path]
+        remove_stale_outputs(self.output_path, self.paths)
+
+        return self.paths
+
+    def abort(self) -> None:
+        """Discard every shard, including ones already written."""
+        if self._current is not None:
+            self._current.abort()
+            self._current = None
+        # Let shards being finished complete before removing them
+        self._pool.shutdown()
+        for writer in self.writers:
+            writer.abort()
+        for path in self.paths:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        self.paths = []
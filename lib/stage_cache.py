@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Content-addressed outputs of the deck build stages.
+
+build_deck() runs a deck as five stages, each keyed only by its own
+inputs:
+
+    rows      section data -> records        key: the section's rows
+    html      word_pairs -> colored HTML     key: word_pairs + palette
+    audio     text -> clip                   key: TTS backend, language, text
+    notes     fields -> guid, cards          key: model + field values
+    package   notes + media -> .apkg         key: every note and clip key
+
+A stage output is reused when its key is unchanged, so a new palette
+re-renders HTML without touching audio, and editing one row re-renders,
+re-speaks and re-assembles that row only. The package is not rewritten
+at all when nothing it is made of changed.
+
+Each deck keeps its outputs in one JSON file. Saving keeps only the
+entries the build used, so the cache never outgrows the deck. A process
+that builds repeatedly (see lib.build_daemon) keeps the last build's
+outputs in memory and only rereads a file another process rewrote.
+"""
+
+import hashlib
+import json
+import os
+from typing import Any, Dict, Optional, Tuple
+
+
+STAGES = ("rows", "html", "audio", "notes", "package")
+
+# path -> (mtime_ns of the saved file, outputs), for StageCache.open()
+_saved: Dict[str, Tuple[int, Dict[str, Dict[str, Any]]]] = {}
+
+
+def digest(*parts: Any) -> str:
+    """Stable key for JSON-serializable parts."""
+    data = json.dumps(parts, ensure_ascii=False, sort_keys=True, separators=(",", ":"), default=_plain)
+    return hashlib.sha1(data.encode("utf-8")).hexdigest()
+
+
+def _plain(value: Any) -> Any:
+    """JSON fallback: functions by their code, objects by their attributes."""
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    if hasattr(value, "__code__"):
+        code = value.__code__
+        return [code.co_code.hex(), repr(code.co_consts), code.co_names]
+    if hasattr(value, "__dict__"):
+        return vars(value)
+    return repr(value)
+
+
+class StageStats:
+    """Hits and misses per stage."""
+
+    def __init__(self):
+        self.hits: Dict[str, int] = {stage: 0 for stage in STAGES}
+        self.misses: Dict[str, int] = {stage: 0 for stage in STAGES}
+
+    def hit(self, stage: str, count: int = 1) -> None:
+        self.hits[stage] += count
+
+    def miss(self, stage: str, count: int = 1) -> None:
+        self.misses[stage] += count
+
+    def merge(self, other: "StageStats") -> None:
+        for stage in STAGES:
+            self.hits[stage] += other.hits[stage]
+            self.misses[stage] += other.misses[stage]
+
+    def format(self) -> str:
+        """e.g. "rows 2/2, html 51/52, audio 52/52, notes 51/52, package 0/1" (cached/total)."""
+        return ", ".join(
+            f"{stage} {self.hits[stage]}/{self.hits[stage] + self.misses[stage]}"
+            for stage in STAGES if self.hits[stage] + self.misses[stage]
+        )
+
+    def __repr__(self) -> str:
+        return f"StageStats({self.format() or 'empty'})"
+
+
+class StageCache:
+    """
+    Stage outputs of one deck, loaded from and saved to a JSON file.
+
+    With no path the cache starts empty and is never saved, so every
+    stage runs; builds without a cache directory behave as before.
+
+    Example:
+        >>> cache = StageCache.open(".build_cache/stages/1234.json")
+        >>> html = cache.get("html", key)
+        >>> if html is None:
+        ...     html = cache.put("html", key, render(pairs))
+        >>> cache.save()
+    """
+
+    def __init__(self, path: Optional[str] = None, previous: Optional[Dict[str, Dict[str, Any]]] = None):
+        self.path = path
+        self.stats = StageStats()
+        self._previous: Dict[str, Dict[str, Any]] = {stage: dict((previous or {}).get(stage, {})) for stage in STAGES}
+        self._used: Dict[str, Dict[str, Any]] = {stage: {} for stage in STAGES}
+
+    @classmethod
+    def open(cls, path: str) -> "StageCache":
+        """
+        The cache at `path`, for one build.
+
+        Reuses the outputs this process saved there last, unless the file
+        changed since; otherwise reads the file.
+        """
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            return cls(path)
+        saved = _saved.get(path)
+        if saved and saved[0] == mtime_ns:
+            return cls(path, saved[1])
+        try:
+            with open(path, encoding="utf-8") as f:
+                stored = json.load(f)
+        except (OSError, ValueError):
+            # A damaged cache only costs a full rebuild
+            return cls(path)
+        _saved[path] = (mtime_ns, stored)
+        return cls(path, stored)
+
+    def get(self, stage: str, key: str, count: bool = True) -> Optional[Any]:
+        """A stage output from this or the previous build, or None."""
+        value = self._used[stage].get(key)
+        if value is None:
+            value = self._previous[stage].get(key)
+            if value is not None:
+                self._used[stage][key] = value
+        if count:
+            if value is None:
+                self.stats.miss(stage)
+            else:
+                self.stats.hit(stage)
+        return value
+
+    def put(self, stage: str, key: str, value: Any) -> Any:
+        """Record a stage output. Returns the value."""
+        self._used[stage][key] = value
+        return value
+
+    def save(self) -> None:
+        """Write the outputs this build used, atomically."""
+        if not self.path:
+            return
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._used, f, ensure_ascii=False, sort_keys=True)
+        os.replace(tmp_path, self.path)
+        _saved[self.path] = (os.stat(self.path).st_mtime_ns, self._used)
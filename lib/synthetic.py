@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""
+Synthetic deck content at any size, for scale and stress runs.
+
+The real decks hold a few hundred notes each; write_corpus() writes
+data files of any size that go through the same build path:
+
+    <data_dir>/synthetic/words.jsonl       WordRow: headword, gloss,
+                                           romanization, example and the
+                                           word_pairs coloring it
+    <data_dir>/synthetic/sentences.jsonl   SentenceRow: sentence, gloss,
+                                           breakdown and word_pairs
+
+synthetic_specs() returns their DeckSpecs, built with lib.deck_spec like
+any deck (with SilentTTS, nothing is sent to a TTS service).
+
+Content is modelled on the real data (see Profile): syllables are drawn
+with the frequencies of the real Korean text, words have its lengths
+in syllables and sentences its lengths in words, and glosses come from
+its English. Example sentences draw words from the lexicon by a Zipf
+law, so common words recur as in real text, and follow each with a
+particle or ending in the form its last syllable takes (을 after a final
+consonant, 를 after a vowel). A share of entries repeat an earlier
+Korean text with another meaning, as homonyms do, which exercises clip
+reuse. The rows pass lib.validation.
+
+The same seed, size and data give the same files.
+"""
+
+import json
+import os
+import random
+import re
+from collections import Counter
+from itertools import accumulate
+from typing import Callable, Dict, List, Optional, Sequence
+
+from lib.data_files import DATA_DIR, DataFile, deck_data_files
+from lib.deck_spec import DeckSpec, Section
+from lib.hangul import decompose
+from lib.korean_deck_base import SENTENCE_NOTE_FIELDS, WORD_NOTE_FIELDS, create_sentence_model, create_word_model
+from lib.records import SentenceRow, WordRow
+
+
+DECK_DIR = "synthetic"
+WORDS_FILE = f"{DECK_DIR}/words.jsonl"
+SENTENCES_FILE = f"{DECK_DIR}/sentences.jsonl"
+
+WORDS_DECK_ID = 1837599001
+SENTENCES_DECK_ID = 1837599002
+
+DEFAULT_DUPLICATE_RATE = 0.05
+DEFAULT_SENTENCE_SHARE = 0.3
+
+# Particles after a noun, and endings closing a sentence, with rough weights.
+# Each is a pair of forms: after a final consonant, and after a vowel
+# (see attach())
+PARTICLES = {("은", "는"): 14, ("이", "가"): 13, ("을", "를"): 14, ("에", "에"): 6, ("에서", "에서"): 4,
+             ("의", "의"): 3, ("도", "도"): 3, ("과", "와"): 2, ("으로", "로"): 2, ("까지", "까지"): 1,
+             ("부터", "부터"): 1}
+ENDINGS = {("해요", "해요"): 10, ("이에요", "예요"): 10, ("있어요", "있어요"): 6, ("없어요", "없어요"): 2,
+           ("했어요", "했어요"): 4, ("할 거예요", "할 거예요"): 2, ("합니다", "합니다"): 3}
+
+# Final consonant index of ㄹ, after which 으로 is 로
+FINAL_RIEUL = 8
+
+HANGUL_WORD = re.compile(r"[가-힣]+")
+ENGLISH_WORD = re.compile(r"[a-z]{3,}")
+
+# Revised Romanization of each jamo, by position in a syllable
+INITIALS = ["g", "kk", "n", "d", "tt", "r", "m", "b", "pp", "s", "ss", "", "j", "jj", "ch", "k", "t", "p", "h"]
+MEDIALS = ["a", "ae", "ya", "yae", "eo", "e", "yeo", "ye", "o", "wa", "wae", "oe", "yo", "u", "wo", "we", "wi",
+           "yu", "eu", "ui", "i"]
+FINALS = ["", "k", "k", "k", "n", "n", "n", "t", "l", "k", "m", "l", "l", "l", "p", "l", "m", "p", "p", "t", "t",
+          "ng", "t", "t", "k", "t", "p", "t"]
+
+
+def attach(word: str, forms: tuple) -> str:
+    """
+    The form of a particle or ending that follows a word.
+
+    Args:
+        word: Ends in a Hangul syllable
+        forms: (after a final consonant, after a vowel), e.g. ("을", "를")
+    """
+    final = decompose(word[-1])[2]
+    if not final or (final == FINAL_RIEUL and forms[0] == "으로"):
+        return forms[1]
+    return forms[0]
+
+
+def romanize(text: str) -> str:
+    """Syllable-by-syllable Revised Romanization, without sound changes across syllables."""
+    out = []
+    for char in text:
+        code = ord(char) - 0xAC00
+        if 0 <= code < 11172:
+            out.append(INITIALS[code // 588] + MEDIALS[code // 28 % 21] + FINALS[code % 28])
+        else:
+            out.append(char)
+    return "".join(out)
+
+
+class Profile:
+    """
+    Distributions of the real deck data that synthetic content follows.
+
+    Attributes:
+        syllables: Hangul syllables and their counts
+        word_lengths: Syllables per word and their counts
+        sentence_lengths: Words per sentence and their counts
+        glosses: English words, with repeats as often as they occur
+    """
+
+    def __init__(self, data_dir: str = DATA_DIR):
+        syllables: Counter = Counter()
+        word_lengths: Counter = Counter()
+        sentence_lengths: Counter = Counter()
+        glosses: List[str] = []
+        modules = sorted(name for name in os.listdir(data_dir)
+                         if name != DECK_DIR and os.path.isdir(os.path.join(data_dir, name)))
+        for module in modules:
+            for path in deck_data_files(module, data_dir):
+                for row in DataFile(os.path.relpath(path, data_dir), data_dir):
+                    for field, value in row.items():
+                        if not isinstance(value, str):
+                            continue
+                        words = HANGUL_WORD.findall(value)
+                        if words:
+                            syllables.update("".join(words))
+                            word_lengths.update(map(len, words))
+                            sentence_lengths[len(words)] += 1
+                        if field in ("english", "meaning", "example_translation", "ex_trans"):
+                            glosses.extend(ENGLISH_WORD.findall(value.lower()))
+        if not syllables or not glosses:
+            raise ValueError(f"{data_dir}: no Korean and English text to model content on")
+        self.syllables = syllables
+        # Sentence words carry particles and endings, added separately
+        self.word_lengths = Counter({length: count for length, count in word_lengths.items() if length <= 4})
+        self.sentence_lengths = Counter({length: count for length, count in sentence_lengths.items()
+                                         if 2 <= length <= 8})
+        self.glosses = glosses
+
+
+class _Sampler:
+    """Draws from a weighted table, a batch at a time."""
+
+    def __init__(self, rng: random.Random, weights: Dict, batch: int = 4096):
+        self.rng = rng
+        self.values = list(weights)
+        self.cum_weights = list(accumulate(weights.values()))
+        self.batch = batch
+        self.pending: List = []
+
+    def __call__(self):
+        if not self.pending:
+            self.pending = self.rng.choices(self.values, cum_weights=self.cum_weights, k=self.batch)
+        return self.pending.pop()
+
+
+class SyntheticCorpus:
+    """
+    Generator of synthetic word and sentence rows.
+
+    Example:
+        >>> corpus = SyntheticCorpus(seed=1)
+        >>> corpus.word_row()
+        {'korean': '지시', 'english': 'movie', 'romanization': 'jisi', ...}
+    """
+
+    def __init__(
+        self,
+        profile: Optional[Profile] = None,
+        seed: int = 0,
+        duplicate_rate: float = DEFAULT_DUPLICATE_RATE,
+        lexicon_size: int = 20000,
+    ):
+        """
+        Args:
+            profile: Distributions to follow (default: those of data/)
+            seed: Random seed
+            duplicate_rate: Share of rows repeating an earlier row's Korean
+                text with another meaning
+            lexicon_size: Distinct words example sentences are drawn from
+        """
+        profile = profile or Profile()
+        self.rng = random.Random(seed)
+        self.duplicate_rate = duplicate_rate
+        self._syllable = _Sampler(self.rng, profile.syllables)
+        self._word_length = _Sampler(self.rng, profile.word_lengths)
+        self._sentence_length = _Sampler(self.rng, profile.sentence_lengths)
+        self._particle = _Sampler(self.rng, PARTICLES)
+        self._ending = _Sampler(self.rng, ENDINGS)
+        self._gloss = _Sampler(self.rng, Counter(profile.glosses))
+        self.lexicon = self._lexicon(lexicon_size)
+        # Word i is drawn in proportion to 1 / (i + 1)
+        self._common_word = _Sampler(self.rng, {i: 1 / (i + 1) for i in range(len(self.lexicon))})
+        self._headwords: set = set()
+        self._earlier: Dict[str, List[Dict[str, object]]] = {"words": [], "sentences": []}
+        self._seen: Dict[str, set] = {"words": set(), "sentences": set()}
+
+    def _new_word(self) -> str:
+        return "".join(self._syllable() for _ in range(self._word_length()))
+
+    def _lexicon(self, size: int) -> List[tuple]:
+        words: Dict[str, str] = {}
+        while len(words) < size:
+            words.setdefault(self._new_word(), self._gloss())
+        return list(words.items())
+
+    def _sentence(self, first: Optional[tuple] = None) -> tuple:
+        """(Korean, English, breakdown, word_pairs) of a sentence, starting with `first` if given."""
+        words = [first or self.lexicon[self._common_word()]]
+        words += [self.lexicon[self._common_word()] for _ in range(max(self._sentence_length(), 2) - 1)]
+        pairs, breakdown = [], []
+        for i, (word, gloss) in enumerate(words):
+            suffix = attach(word, self._ending() if i == len(words) - 1 else self._particle())
+            part = word + suffix + ("." if i == len(words) - 1 else "")
+            pairs.append([part, gloss])
+            breakdown.append(f"{word}({gloss}) + {suffix}")
+        english = " ".join(gloss for _, gloss in words).capitalize() + "."
+        return " ".join(part for part, _ in pairs), english, " + ".join(breakdown), pairs
+
+    def _homonym(self, kind: str) -> Optional[Dict[str, object]]:
+        """An earlier row's copy with a new meaning, duplicate_rate of the time."""
+        earlier = self._earlier[kind]
+        if earlier and self.rng.random() < self.duplicate_rate:
+            row = dict(self.rng.choice(earlier))
+            row["english"] = f"{row['english']} ({self._gloss()})"
+            return row
+        return None
+
+    def _row(self, kind: str, new_row: Callable[[], Dict[str, object]]) -> Dict[str, object]:
+        """A homonym or a new row, never one with the Korean text and meaning of an earlier row."""
+        seen = self._seen[kind]
+        row = self._homonym(kind)
+        # Hashes rather than the texts keep a million rows' keys small
+        while row is None or hash((row["korean"], row["english"])) in seen:
+            row = new_row()
+        seen.add(hash((row["korean"], row["english"])))
+        if len(self._earlier[kind]) < 10000:
+            self._earlier[kind].append(row)
+        return row
+
+    def _new_word_row(self) -> Dict[str, object]:
+        word = self._new_word()
+        while word in self._headwords:
+            word = self._new_word()
+        self._headwords.add(word)
+        gloss = self._gloss()
+        example, translation, _, pairs = self._sentence((word, gloss))
+        return {"korean": word, "english": gloss, "romanization": romanize(word), "example": example,
+                "example_translation": translation, "word_pairs": pairs}
+
+    def _new_sentence_row(self) -> Dict[str, object]:
+        korean, english, breakdown, pairs = self._sentence()
+        return {"korean": korean, "english": english, "breakdown": breakdown, "word_pairs": pairs}
+
+    def word_row(self) -> Dict[str, object]:
+        """A WordRow: a new headword with an example sentence using it, or a homonym."""
+        return self._row("words", self._new_word_row)
+
+    def sentence_row(self) -> Dict[str, object]:
+        """A SentenceRow: a sentence of lexicon words with its breakdown, or one with another meaning."""
+        return self._row("sentences", self._new_sentence_row)
+
+
+def write_corpus(
+    data_dir: str,
+    notes: int,
+    seed: int = 0,
+    duplicate_rate: float = DEFAULT_DUPLICATE_RATE,
+    sentence_share: float = DEFAULT_SENTENCE_SHARE,
+    profile: Optional[Profile] = None,
+) -> Dict[str, int]:
+    """
+    Write the synthetic data files, one row at a time.
+
+    Args:
+        data_dir: Root to write synthetic/ under
+        notes: Rows in total
+        seed: Random seed
+        duplicate_rate: See SyntheticCorpus
+        sentence_share: Share of rows that are sentences
+        profile: Distributions to follow (default: those of data/)
+
+    Returns:
+        Rows written per data file (relative path)
+    """
+    corpus = SyntheticCorpus(profile, seed, duplicate_rate)
+    sentences = round(notes * sentence_share)
+    tables = [(WORDS_FILE, notes - sentences, corpus.word_row), (SENTENCES_FILE, sentences, corpus.sentence_row)]
+    os.makedirs(os.path.join(data_dir, DECK_DIR), exist_ok=True)
+    for relpath, count, make_row in tables:
+        path = os.path.join(data_dir, relpath)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(f"# Synthetic rows: seed {seed}, {count} of {notes} notes\n")
+            for _ in range(count):
+                f.write(json.dumps(make_row(), ensure_ascii=False) + "\n")
+    return {relpath: count for relpath, count, _ in tables}
+
+
+def synthetic_specs(data_dir: str) -> Sequence:
+    """DeckSpecs of the synthetic data files under data_dir."""
+    return [
+        DeckSpec(
+            deck_id=WORDS_DECK_ID,
+            deck_name="Synthetic - Words",
+            model=create_word_model,
+            sections=[Section("synthetic words", DataFile(WORDS_FILE, data_dir), WordRow,
+                              fields=WORD_NOTE_FIELDS, audio="korean")],
+        ),
+        DeckSpec(
+            deck_id=SENTENCES_DECK_ID,
+            deck_name="Synthetic - Sentences",
+            model=create_sentence_model,
+            sections=[Section("synthetic sentences", DataFile(SENTENCES_FILE, data_dir), SentenceRow,
+                              fields=SENTENCE_NOTE_FIELDS, audio="korean")],
+        ),
+    ]
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Schema and consistency checks over every deck's rows, in one pass.
+
+The row types (lib.records) check what a field holds; these checks look
+at what it says:
+
+    shape       rows fit their row type; required fields are not blank;
+                word_pairs are non-blank (korean, english) pairs
+    hangul      Korean fields hold no English words (text in parentheses,
+                acronyms like "TV" and units after digits are allowed)
+    word_pairs  the Korean parts spell the example (or the field they
+                color), give or take spacing and punctuation; text with
+                numerals and parts written as rules (하나→한) are not
+                compared, as the parts spell those out
+    duplicates  no two rows of a section speak the same text with the
+                same meaning (see DUPLICATE_KEY)
+    headword    the example uses the word it illustrates; a warning for
+                verbs and adjectives (다), whose conjugation makes this a
+                heuristic, an error for every other word
+
+Errors listed in data/known_issues.tsv are reported as KNOWN instead,
+so the check passes on the data as it is and fails on anything new;
+entries that no longer match anything are reported as warnings.
+
+Everything a check needs per row is worked out once per section: field
+indexes are resolved and the matchers are compiled at import, so a row
+costs a few regex calls. The full corpus takes a few milliseconds once
+its data files are parsed.
+"""
+
+import csv
+import functools
+import importlib
+import os
+import re
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from lib.content_repo import KOREAN_FIELDS
+from lib.data_files import DATA_DIR
+from lib.records import load_records
+
+
+ERROR = "error"
+WARNING = "warning"
+# An error listed in the known issues file
+KNOWN = "known"
+
+KNOWN_ISSUES_PATH = os.path.join(DATA_DIR, "known_issues.tsv")
+
+# Fields that hold Korean text wherever a row type has them
+HANGUL_FIELDS = ("korean", "korean_char", "character", "dict_form", "stem", "formal", "informal", "plain",
+                 "casual", "polite", "honorific", "particle", "prompt", "response", "audio_word",
+                 "example", "examples")
+
+# Fields word_pairs may color, in order of preference
+WORD_PAIR_TARGETS = ("example", "examples", "korean", "response", "prompt")
+
+# What identifies a row within a section, besides the text it speaks: its
+# Korean text and its meaning
+DUPLICATE_KEY = (KOREAN_FIELDS + ("name", "level"), ("english", "meaning", "usage", "rule"))
+
+# A word with a lowercase letter, not a unit right after a number
+ENGLISH_WORD = re.compile(r"(?<![0-9A-Za-z])[A-Za-z]*[a-z][A-Za-z']*")
+PARENTHESES = re.compile(r"\([^)\n]*\)|\[[^\]\n]*\]")
+# Everything but Hangul syllables, jamo and letters/digits
+NOT_TEXT = re.compile(r"[^0-9A-Za-zᄀ-ᇿㄱ-ㆎ가-힣]+")
+DIGITS = re.compile(r"[0-9]")
+HANGUL_WORD = re.compile(r"[가-힣]+")
+
+
+class Issue(NamedTuple):
+    """One problem found in a row."""
+    severity: str
+    check: str
+    module: str
+    section: str
+    row: int
+    field: str
+    message: str
+
+    def format(self) -> str:
+        return f"{self.module} / {self.section} row {self.row} {self.field}: {self.message}"
+
+
+class KnownIssue(NamedTuple):
+    """An accepted error: module, check and field, and text its message contains."""
+    module: str
+    check: str
+    field: str
+    text: str
+    reason: str
+
+    def matches(self, issue: Issue) -> bool:
+        return (issue.module, issue.check, issue.field) == (self.module, self.check, self.field) \
+            and self.text in issue.message
+
+
+@functools.lru_cache(maxsize=None)
+def known_issues(path: str = KNOWN_ISSUES_PATH) -> Tuple[KnownIssue, ...]:
+    """The entries of a known issues file (none if it does not exist)."""
+    if not os.path.exists(path):
+        return ()
+    with open(path, encoding="utf-8", newline="") as f:
+        lines = (line for line in f if line.strip() and not line.startswith("#"))
+        return tuple(KnownIssue(row["module"], row["check"], row["field"], row["text"], row["reason"])
+                     for row in csv.DictReader(lines, delimiter="\t", quoting=csv.QUOTE_NONE))
+
+
+def _mark_known(issues: List[Issue], known: Iterable[KnownIssue], used: Optional[set] = None) -> List[Issue]:
+    """Issues with errors matching a known issue marked KNOWN; matched entries are added to used."""
+    marked = []
+    for issue in issues:
+        if issue.severity == ERROR:
+            entry = next((entry for entry in known if entry.matches(issue)), None)
+            if entry is not None:
+                issue = issue._replace(severity=KNOWN)
+                if used is not None:
+                    used.add(entry)
+        marked.append(issue)
+    return marked
+
+
+def _normalized(text: str) -> str:
+    return NOT_TEXT.sub("", PARENTHESES.sub("", text))
+
+
+def _initial(syllable: str) -> int:
+    return (ord(syllable) - 0xAC00) // 588
+
+
+def _uses_headword(word: str, text: str) -> bool:
+    """True if text contains word, a verb matching on its stem up to the last syllable's initial."""
+    text = text.replace(" ", "")
+    if not (word.endswith("다") and len(word) > 1):
+        return word in text
+    head, last = word[:-2], word[-2]
+    start = text.find(head)
+    while start != -1:
+        end = start + len(head)
+        if end < len(text) and "가" <= text[end] <= "힣" and _initial(text[end]) == _initial(last):
+            return True
+        start = text.find(head, start + 1)
+    return False
+
+
+class _SectionChecks:
+    """The checks for one section, with field indexes resolved once."""
+
+    def __init__(self, section):
+        self.section = section
+        fields = section.row_type._fields
+        self.fields = fields
+        defaults = section.row_type._field_defaults
+        self.required = [(i, name) for i, name in enumerate(fields)
+                         if name not in defaults and section.row_type.__annotations__.get(name) is str]
+        self.hangul = [(i, name) for i, name in enumerate(fields) if name in HANGUL_FIELDS]
+        self.word_pairs = fields.index("word_pairs") if "word_pairs" in fields else None
+        self.targets = [(i, name) for i, name in enumerate(fields) if name in WORD_PAIR_TARGETS]
+        self.targets.sort(key=lambda target: WORD_PAIR_TARGETS.index(target[1]))
+        korean, meaning = (next((name for name in names if name in fields), None) for names in DUPLICATE_KEY)
+        self.key_field = section.audio if isinstance(section.audio, str) else korean or ""
+        self.key = [fields.index(name) for name in (korean, meaning) if name]
+        self.headword = (fields.index("korean"), fields.index("example")) \
+            if {"korean", "example"} <= set(fields) else None
+
+    def run(self, record, issue: Callable[..., None], seen: Dict[Tuple[str, ...], int], number: int) -> None:
+        # Each check first looks at all its fields at once; rows are almost always clean
+        if not all(record[i].strip() for i, _ in self.required):
+            for i, name in self.required:
+                if not record[i].strip():
+                    issue(ERROR, "shape", number, name, "is blank")
+
+        if ENGLISH_WORD.search(PARENTHESES.sub("", "\n".join(record[i] for i, _ in self.hangul))):
+            for i, name in self.hangul:
+                english = ENGLISH_WORD.findall(PARENTHESES.sub("", record[i]))
+                if english:
+                    issue(ERROR, "hangul", number, name,
+                          f"English in a Korean field ({' '.join(english)}): {record[i]!r}")
+
+        word_pairs = record[self.word_pairs] if self.word_pairs is not None else None
+        if word_pairs:
+            blank = [pair for pair in word_pairs if not (pair[0].strip() and pair[1].strip())]
+            if blank:
+                issue(ERROR, "shape", number, "word_pairs", f"blank part in {blank[0]!r}")
+            korean = "".join(pair[0] for pair in word_pairs)
+            name, text = next(((name, record[i]) for i, name in self.targets if record[i]), (None, None))
+            if text and not DIGITS.search(text + korean) and "→" not in korean:
+                spelled = _normalized(korean)
+                if not any(_normalized(line) == spelled for line in text.split("\n")):
+                    issue(ERROR, "word_pairs", number, "word_pairs",
+                          f"Korean parts {korean!r} do not spell {name} {text!r}")
+
+        key = tuple(record[i] for i in self.key)
+        if self.section.audio is not None:
+            request = self.section.audio_request(record)
+            key = (request[0] if request else "",) + key
+        if key and key[0]:
+            if key in seen:
+                issue(ERROR, "duplicates", number, self.key_field,
+                      f"{' / '.join(dict.fromkeys(key))!r} already in row {seen[key]}")
+            else:
+                seen[key] = number
+
+        if self.headword is not None:
+            word, example = record[self.headword[0]], record[self.headword[1]]
+            if (example and HANGUL_WORD.fullmatch(word) and not DIGITS.search(example)
+                    and not _uses_headword(word, example)):
+                issue(WARNING if word.endswith("다") else ERROR, "headword", number, "example",
+                      f"does not use {word!r}: {example!r}")
+
+
+def validate_spec(spec, module: str = "", used: Optional[set] = None) -> List[Issue]:
+    """
+    Check every row of a deck.
+
+    Args:
+        spec: The deck's lib.deck_spec.DeckSpec
+        module: Generator module, for reports and known issues
+        used: Set the known issues matched are added to
+
+    Returns:
+        The issues, in row order
+    """
+    issues: List[Issue] = []
+    for section in spec.sections:
+        def issue(severity, check, number, field, message):
+            issues.append(Issue(severity, check, module, section.label, number, field, message))
+
+        try:
+            rows = list(section.rows)
+        except ValueError as e:
+            issue(ERROR, "shape", 0, "", f"unreadable: {e}")
+            continue
+        try:
+            records = load_records(section.row_type, rows, section.label)
+        except ValueError:
+            # Report every bad row, not just the first
+            records = []
+            for number, row in enumerate(rows, 1):
+                try:
+                    records.extend(load_records(section.row_type, [row], section.label))
+                except ValueError as e:
+                    issue(ERROR, "shape", number, "", str(e).replace(f"{section.label}: row 1", "").strip(" :"))
+                    records.append(None)
+
+        checks = _SectionChecks(section)
+        seen: Dict[Tuple[str, ...], int] = {}
+        for number, record in enumerate(records, 1):
+            if record is not None and not (section.skip and section.skip(record)):
+                checks.run(record, issue, seen, number)
+    return _mark_known(issues, [entry for entry in known_issues() if entry.module == module], used)
+
+
+def validate_modules(modules: Iterable[str]) -> List[Issue]:
+    """
+    Check the DECK_SPEC of each generator module; modules without one are skipped.
+
+    Known issues of the checked modules that no longer match an error are
+    reported as warnings, so the file does not outlive the data it describes.
+    """
+    issues: List[Issue] = []
+    checked = set()
+    used = set()
+    for name in modules:
+        spec = getattr(importlib.import_module(name), "DECK_SPEC", None)
+        if spec is not None:
+            issues.extend(validate_spec(spec, name, used))
+            checked.add(name)
+    for entry in known_issues():
+        if entry.module in checked and entry not in used:
+            issues.append(Issue(WARNING, entry.check, entry.module, os.path.relpath(KNOWN_ISSUES_PATH), 0,
+                                entry.field, f"known issue no longer found: {entry.text!r}"))
+    return issues
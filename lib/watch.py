@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Source watching for incremental deck rebuilds.
+
+Each generator module depends on its own file, on every repository
+module it imports, directly or through lib/, and on its data files
+(data/<module>/, see lib.data_files). When files change, only the
+generators depending on them are rebuilt. Combined with the clip cache
+of BuildContext, editing one row re-synthesizes just that row's audio.
+
+Watching polls modification times, so it needs no extra dependencies and
+behaves the same on every platform.
+"""
+
+import ast
+import glob
+import os
+import time
+from typing import Callable, Dict, Iterable, List, Set
+
+from lib.build_runner import GENERATOR_GLOB
+from lib.data_files import deck_data_files
+
+
+DEFAULT_INTERVAL = 0.5
+
+# Changes closer together than this are handled as one edit
+SETTLE_SECONDS = 0.3
+
+
+def local_imports(path: str, root: str) -> Set[str]:
+    """Repository files imported by one source file."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            tree = ast.parse(f.read(), path)
+    except (OSError, SyntaxError):
+        # Mid-edit or deleted; the rebuild itself reports the problem
+        return set()
+
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names.add(node.module)
+            # from lib import anki21b
+            names.update(f"{node.module}.{alias.name}" for alias in node.names)
+
+    files = set()
+    for name in names:
+        candidate = os.path.join(root, *name.split(".")) + ".py"
+        if os.path.exists(candidate):
+            files.add(os.path.abspath(candidate))
+    return files
+
+
+class DependencyGraph:
+    """Which repository files each generator module depends on."""
+
+    def __init__(self, root: str, modules: Iterable[str]):
+        self.root = root
+        self.dependencies: Dict[str, Set[str]] = {}
+        cache: Dict[str, Set[str]] = {}
+        for module in modules:
+            start = os.path.abspath(os.path.join(root, module + ".py"))
+            seen = {start}
+            pending = [start]
+            while pending:
+                path = pending.pop()
+                if path not in cache:
+                    cache[path] = local_imports(path, root)
+                for dependency in cache[path] - seen:
+                    seen.add(dependency)
+                    pending.append(dependency)
+            self.dependencies[module] = seen | set(deck_data_files(module, os.path.abspath(os.path.join(root, "data"))))
+
+    @property
+    def files(self) -> Set[str]:
+        """Every file some generator depends on."""
+        return set().union(*self.dependencies.values()) if self.dependencies else set()
+
+    def affected(self, changed: Iterable[str]) -> List[str]:
+        """Generators depending on any of the changed files, in module order."""
+        changed = {os.path.abspath(path) for path in changed}
+        return [module for module, files in self.dependencies.items() if files & changed]
+
+
+def snapshot(paths: Iterable[str]) -> Dict[str, int]:
+    """Modification time of every path that exists."""
+    times = {}
+    for path in paths:
+        try:
+            times[path] = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            pass
+    return times
+
+
+def watch(
+    root: str,
+    modules: List[str],
+    rebuild: Callable[[List[str], List[str]], None],
+    interval: float = DEFAULT_INTERVAL,
+) -> None:
+    """
+    Call rebuild(affected_modules, changed_files) whenever sources change.
+
+    Runs until interrupted. The dependency graph is recomputed after every
+    change, so new imports are picked up.
+    """
+    graph = DependencyGraph(root, modules)
+    watched = graph.files | {os.path.abspath(p) for p in glob.glob(os.path.join(root, GENERATOR_GLOB))}
+    before = snapshot(watched)
+
+    while True:
+        time.sleep(interval)
+        now = snapshot(watched)
+        if now == before:
+            continue
+
+        # Let editors finish writing (save-to-temp-and-rename, formatters)
+        time.sleep(SETTLE_SECONDS)
+        now = snapshot(watched)
+        changed = sorted(path for path in set(before) | set(now) if before.get(path) != now.get(path))
+
+        graph = DependencyGraph(root, modules)
+        watched = graph.files | {os.path.abspath(p) for p in glob.glob(os.path.join(root, GENERATOR_GLOB))}
+        before = snapshot(watched)
+
+        affected = graph.affected(changed)
+        rebuild(affected, [os.path.relpath(path, root) for path in changed])
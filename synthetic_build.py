@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Korean Synthetic Deck Build
+
+Generates synthetic word and sentence data of any size (see
+lib/synthetic.py) and builds it through the same path as the real decks,
+with silent audio in place of TTS, to see how the pipeline scales. The
+same seed and size give the same data, so runs are reproducible; run
+again with the same --dir to time a cached rebuild.
+
+Usage:
+    python3 synthetic_build.py --notes 100000
+    python3 synthetic_build.py --notes 1000000 --seed 7 --dir /tmp/synthetic
+    python3 synthetic_build.py --notes 5000 --validate --no-build
+"""
+
+import argparse
+import os
+import resource
+import shutil
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Add lib to path
+sys.path.insert(0, os.path.join(ROOT, 'lib'))
+
+from lib.build_context import BuildContext, SilentTTS
+from lib.deck_spec import build_deck
+from lib.synthetic import DEFAULT_DUPLICATE_RATE, DEFAULT_SENTENCE_SHARE, Profile, synthetic_specs, write_corpus
+from lib.validation import ERROR, validate_spec
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic deck data and build it with silent audio.")
+    parser.add_argument("--notes", type=int, default=10000, help="notes in total (default: 10000)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--duplicate-rate", type=float, default=DEFAULT_DUPLICATE_RATE,
+                        help=f"share of rows repeating an earlier Korean text (default: {DEFAULT_DUPLICATE_RATE})")
+    parser.add_argument("--sentence-share", type=float, default=DEFAULT_SENTENCE_SHARE,
+                        help=f"share of rows that are sentences (default: {DEFAULT_SENTENCE_SHARE})")
+    parser.add_argument("--dir", help="keep data, cache and packages here (default: a temporary directory)")
+    parser.add_argument("--no-cache", action="store_true", help="build without the clip and stage caches")
+    parser.add_argument("--validate", action="store_true", help="check the rows before building")
+    parser.add_argument("--no-build", action="store_true", help="only generate the data")
+    args = parser.parse_args()
+
+    workdir = args.dir or tempfile.mkdtemp(prefix="synthetic_")
+    data_dir = os.path.join(workdir, "data")
+    try:
+        start = time.perf_counter()
+        written = write_corpus(data_dir, args.notes, args.seed, args.duplicate_rate, args.sentence_share,
+                               Profile())
+        seconds = time.perf_counter() - start
+        size = sum(os.path.getsize(os.path.join(data_dir, relpath)) for relpath in written)
+        print(f"✓ {args.notes} rows generated in {seconds:.1f}s ({size / 1e6:.1f} MB, seed {args.seed})")
+        for relpath, count in written.items():
+            print(f"  - {relpath}: {count}")
+
+        specs = synthetic_specs(data_dir)
+        if args.validate:
+            start = time.perf_counter()
+            issues = [issue for spec in specs for issue in validate_spec(spec, "synthetic")]
+            errors = [issue for issue in issues if issue.severity == ERROR]
+            print(f"{'✗' if errors else '✓'} {len(errors)} errors, {len(issues) - len(errors)} warnings "
+                  f"in {time.perf_counter() - start:.1f}s")
+            for issue in errors[:20]:
+                print(f"  - {issue.format()}")
+            if errors:
+                return 1
+        if args.no_build:
+            return 0
+
+        os.makedirs(os.path.join(workdir, "decks"), exist_ok=True)
+        cache_dir = None if args.no_cache else os.path.join(workdir, ".build_cache")
+        notes, generated, cached, stages = 0, 0, 0, {}
+        start = time.perf_counter()
+        for spec in specs:
+            # One context per deck, as in a full build
+            with BuildContext(tts=SilentTTS, cache_dir=cache_dir) as context:
+                build_deck(spec, os.path.join(workdir, "decks", f"{spec.deck_id}.apkg"), context)
+            stats = context.stats
+            notes += stats.notes
+            generated += stats.audio_generated
+            cached += stats.audio_cached
+            for stage, stage_seconds in stats.stage_seconds.items():
+                stages[stage] = stages.get(stage, 0.0) + stage_seconds
+            print()
+        seconds = time.perf_counter() - start
+        package_bytes = sum(os.path.getsize(os.path.join(workdir, "decks", f"{spec.deck_id}.apkg")) for spec in specs)
+        peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+        print(f"✓ {notes} notes built in {seconds:.1f}s ({notes / seconds:.0f} notes/s), "
+              f"peak memory {peak_mb:.0f} MB, packages {package_bytes / 1e6:.1f} MB")
+        print("  - " + ", ".join(f"{stage} {stage_seconds:.1f}s" for stage, stage_seconds in stages.items()))
+        print(f"  - clips: {generated} generated, {cached} from cache")
+        return 0
+    finally:
+        if not args.dir:
+            shutil.rmtree(workdir)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
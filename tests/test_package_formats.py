@@ -0,0 +1,79 @@
+"""
+The legacy (.anki2) and anki21b layouts of one deck hold the same notes,
+cards and media when read back through ApkgReader.
+"""
+
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from lib.apkg_reader import ApkgReader
+from lib.build_context import BuildContext
+from lib.deck_spec import build_deck
+
+pytest.importorskip("zstandard")
+
+
+class TextTTS:
+    """Stand-in for gTTS whose clips hold their text, so each clip differs."""
+
+    def __init__(self, text, lang="ko"):
+        self.text = text
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            f.write(self.text.encode("utf-8") * 64)
+
+
+def read_package(path):
+    """(notes, cards, media) of a package, keyed so they compare across builds."""
+    with ApkgReader(path) as reader:
+        conn = reader.open_collection()
+        try:
+            notes = sorted(conn.execute("SELECT guid, mid, tags, flds FROM notes"))
+            cards = sorted(conn.execute(
+                "SELECT n.guid, c.ord, c.did, c.queue FROM cards c JOIN notes n ON n.id = c.nid"))
+        finally:
+            conn.close()
+        media = {name: reader.read_media(entry) for entry, name in reader.media_map().items()}
+        return reader.is_anki21b, notes, cards, media
+
+
+@pytest.fixture(scope="module")
+def packages(tmp_path_factory):
+    import korean_time
+
+    work_dir = tmp_path_factory.mktemp("formats")
+    paths = {}
+    for package_format in ("anki2", "anki21b"):
+        paths[package_format] = str(work_dir / f"korean_time.{package_format}.apkg")
+        with BuildContext(tts=TextTTS) as context:
+            build_deck(korean_time.DECK_SPEC, paths[package_format], context, package_format=package_format)
+    return {package_format: read_package(path) for package_format, path in paths.items()}
+
+
+def test_layouts(packages):
+    assert not packages["anki2"][0]
+    assert packages["anki21b"][0]
+
+
+def test_same_notes(packages):
+    legacy, modern = packages["anki2"][1], packages["anki21b"][1]
+    assert legacy
+    assert modern == legacy
+
+
+def test_same_cards(packages):
+    legacy, modern = packages["anki2"][2], packages["anki21b"][2]
+    assert len(legacy) >= len(packages["anki2"][1])
+    assert modern == legacy
+
+
+def test_same_media(packages):
+    legacy, modern = packages["anki2"][3], packages["anki21b"][3]
+    assert legacy and all(legacy.values())
+    assert modern == legacy
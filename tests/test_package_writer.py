@@ -0,0 +1,61 @@
+"""
+StreamingPackageWriter writes media through zipfile's public API: in anki2
+stored formats are stored and the rest deflated, in anki21b every entry is a
+stored zstd frame, and every entry reads back intact.
+"""
+
+import os
+import sys
+import zipfile
+
+import genanki
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from lib.apkg_reader import ApkgReader
+from lib.package_writer import PARALLEL_MEDIA_THRESHOLD, StreamingPackageWriter
+
+MODEL = genanki.Model(1607392319, "Test", fields=[{"name": "Front"}],
+                      templates=[{"name": "Card", "qfmt": "{{Front}}", "afmt": "{{Front}}"}])
+
+
+def media_files(directory, count):
+    """count files alternating between incompressible .mp3 and compressible .txt."""
+    paths = []
+    for i in range(count):
+        if i % 2:
+            path, data = os.path.join(directory, f"note_{i}.txt"), f"text {i} ".encode() * 200
+        else:
+            path, data = os.path.join(directory, f"clip_{i}.mp3"), os.urandom(2000)
+        with open(path, "wb") as f:
+            f.write(data)
+        paths.append(path)
+    return paths
+
+
+@pytest.mark.parametrize("count", [4, PARALLEL_MEDIA_THRESHOLD * 2])
+@pytest.mark.parametrize("package_format", ["anki2", "anki21b"])
+def test_media_entries(tmp_path, count, package_format):
+    if package_format == "anki21b":
+        pytest.importorskip("zstandard")
+    paths = media_files(str(tmp_path), count)
+    output = str(tmp_path / "out.apkg")
+    with StreamingPackageWriter(output, 1, "Test", package_format=package_format) as writer:
+        for path in paths:
+            writer.add_note(genanki.Note(model=MODEL, fields=[f"[sound:{os.path.basename(path)}]"]))
+            writer.add_media_file(path)
+
+    with zipfile.ZipFile(output) as archive:
+        assert archive.testzip() is None
+    with ApkgReader(output) as reader:
+        by_name = {name: entry for entry, name in reader.media_map().items()}
+        assert sorted(by_name) == sorted(os.path.basename(path) for path in paths)
+        for path in paths:
+            entry = by_name[os.path.basename(path)]
+            compress_type = reader.zip.getinfo(entry).compress_type
+            stored = package_format == "anki21b" or path.endswith(".mp3")
+            assert compress_type == (zipfile.ZIP_STORED if stored else zipfile.ZIP_DEFLATED)
+            with open(path, "rb") as f:
+                assert reader.read_media(entry) == f.read()
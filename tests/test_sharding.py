@@ -0,0 +1,54 @@
+"""
+A rebuild leaves only the packages it wrote: the plain package or the
+shards of an earlier layout, and surplus shards, are removed.
+"""
+
+import os
+import sys
+
+import genanki
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from lib.sharding import ShardedPackageWriter, shard_path
+
+MODEL = genanki.Model(1607392320, "Test", fields=[{"name": "Front"}],
+                      templates=[{"name": "Card", "qfmt": "{{Front}}", "afmt": "{{Front}}"}])
+
+
+def build(output_path, count, max_notes):
+    with ShardedPackageWriter(output_path, 1, "Test", lambda filename: None, max_notes=max_notes) as writer:
+        writer.add_notes(genanki.Note(model=MODEL, fields=[f"note {i}"]) for i in range(count))
+    return writer.paths
+
+
+def leave_behind(*paths):
+    for path in paths:
+        with open(path, "wb") as f:
+            f.write(b"stale")
+
+
+def packages(directory):
+    return sorted(name for name in os.listdir(directory) if name.endswith(".apkg"))
+
+
+def test_fewer_shards(tmp_path):
+    output = str(tmp_path / "deck.apkg")
+    leave_behind(output, *(shard_path(output, number) for number in range(1, 6)))
+    assert build(output, 5, max_notes=2) == [shard_path(output, number) for number in (1, 2, 3)]
+    assert packages(tmp_path) == ["deck.part01.apkg", "deck.part02.apkg", "deck.part03.apkg"]
+
+
+def test_no_longer_sharded(tmp_path):
+    output = str(tmp_path / "deck.apkg")
+    leave_behind(shard_path(output, 1), shard_path(output, 2))
+    assert build(output, 3, max_notes=10) == [output]
+    assert packages(tmp_path) == ["deck.apkg"]
+
+
+def test_other_decks_untouched(tmp_path):
+    output = str(tmp_path / "deck.apkg")
+    leave_behind(str(tmp_path / "deck_2.apkg"), str(tmp_path / "other.part01.apkg"))
+    build(output, 3, max_notes=2)
+    assert packages(tmp_path) == ["deck.part01.apkg", "deck.part02.apkg", "deck_2.apkg", "other.part01.apkg"]
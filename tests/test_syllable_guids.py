@@ -0,0 +1,36 @@
+"""
+The syllable deck keeps the note GUIDs of the published package, so
+re-importing it updates notes already in Anki instead of duplicating them.
+"""
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from lib.apkg_reader import ApkgReader
+from lib.build_context import BuildContext, SilentTTS
+from lib.deck_spec import build_deck
+
+PUBLISHED = os.path.join(ROOT, "decks", "02_korean_syllables.apkg")
+
+
+def note_guids(path):
+    """(GUID, first field) of every note, in package order."""
+    with ApkgReader(path) as reader:
+        conn = reader.open_collection()
+        try:
+            return [(guid, flds.split("\x1f")[0]) for guid, flds in
+                    conn.execute("SELECT guid, flds FROM notes ORDER BY id")]
+        finally:
+            conn.close()
+
+
+def test_guids_match_published_package(tmp_path):
+    import korean_syllables
+
+    path = str(tmp_path / "02_korean_syllables.apkg")
+    with BuildContext(tts=SilentTTS) as context:
+        build_deck(korean_syllables.DECK_SPEC, path, context)
+    assert note_guids(path) == note_guids(PUBLISHED)
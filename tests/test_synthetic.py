@@ -0,0 +1,49 @@
+"""
+Synthetic rows attach particles and endings in the form the preceding
+syllable takes: 은/이/을/과/으로/이에요 after a final consonant (로 after
+ㄹ), 는/가/를/와/로/예요 after a vowel.
+"""
+
+import os
+import re
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from lib.synthetic import ENDINGS, PARTICLES, SyntheticCorpus
+
+FORMS = {form: forms for forms in list(PARTICLES) + list(ENDINGS) for form in forms}
+BREAKDOWN_PART = re.compile(r"([가-힣]+)\([^)]*\) \+ ([^+]+?)(?: \+ |$)")
+
+
+def expected_form(word, forms):
+    final = (ord(word[-1]) - 0xAC00) % 28
+    if final == 0 or (final == 8 and forms[1] == "로"):
+        return forms[1]
+    return forms[0]
+
+
+@pytest.fixture(scope="module")
+def corpus():
+    return SyntheticCorpus(seed=1)
+
+
+def test_sentence_particles_agree(corpus):
+    checked = 0
+    for _ in range(300):
+        for word, suffix in BREAKDOWN_PART.findall(corpus.sentence_row()["breakdown"]):
+            assert suffix == expected_form(word, FORMS[suffix]), f"{word} + {suffix}"
+            checked += 1
+    assert checked > 300
+
+
+def test_example_particles_agree(corpus):
+    for _ in range(300):
+        row = corpus.word_row()
+        first = row["word_pairs"][0][0]
+        suffix = first[len(row["korean"]):].rstrip(".")
+        assert first.startswith(row["korean"])
+        assert suffix == expected_form(row["korean"], FORMS[suffix]), f"{row['korean']} + {suffix}"
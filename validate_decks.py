@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Korean Deck Data Validator
+
+Checks every row of every deck in one pass: row shape and blank fields,
+English in Korean fields, word_pairs that do not spell their example,
+duplicate rows and examples missing their headword (see lib.validation).
+Exits non-zero if there are errors; warnings are heuristic and only
+listed with --warnings, and errors already recorded in
+data/known_issues.tsv are only counted, or listed with --known.
+
+Usage: python3 validate_decks.py [--warnings] [--known] [deck ...]
+"""
+
+import argparse
+import collections
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Add lib to path
+sys.path.insert(0, os.path.join(ROOT, 'lib'))
+
+from lib.build_runner import discover_generators
+from lib.validation import ERROR, KNOWN, KNOWN_ISSUES_PATH, WARNING, validate_modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check every deck's data for errors.")
+    parser.add_argument("decks", nargs="*", help="generator modules to check (default: all)")
+    parser.add_argument("--warnings", action="store_true", help="also list warnings")
+    parser.add_argument("--known", action="store_true", help="also list known errors")
+    args = parser.parse_args()
+
+    sys.path.insert(0, ROOT)
+    available = discover_generators(ROOT)
+    modules = [name.replace(".py", "") for name in args.decks] or available
+    unknown = [name for name in modules if name not in available]
+    if unknown:
+        parser.error(f"unknown generator(s): {', '.join(unknown)}")
+
+    start = time.perf_counter()
+    issues = validate_modules(modules)
+    elapsed = time.perf_counter() - start
+
+    errors = [issue for issue in issues if issue.severity == ERROR]
+    warnings = [issue for issue in issues if issue.severity == WARNING]
+    known = [issue for issue in issues if issue.severity == KNOWN]
+    for issue in errors + (warnings if args.warnings else []) + (known if args.known else []):
+        print(f"{'✗' if issue.severity == ERROR else '!' if issue.severity == WARNING else '-'} {issue.format()}")
+
+    counts = collections.Counter(issue.check for issue in errors)
+    print(f"\n{'✗' if errors else '✓'} {len(modules)} decks checked in {elapsed * 1000:.0f}ms: "
+          f"{len(errors)} errors, {len(warnings)} warnings, "
+          f"{len(known)} known errors ({os.path.relpath(KNOWN_ISSUES_PATH, ROOT)})")
+    for check, count in counts.most_common():
+        print(f"  - {count} {check}")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Korean Word Frequencies
+
+Counts the words of local Korean text corpora in parallel into a
+frequency table, then ranks deck entries against it without rescanning
+the corpus: entries the corpus rarely or never uses are flagged.
+
+Usage:
+    python3 word_frequency.py count corpus/*.txt -o freq.bin
+    python3 word_frequency.py count news.txt wiki.txt -o freq.bin --jobs 8
+    python3 word_frequency.py top freq.bin -n 50
+    python3 word_frequency.py rank freq.bin korean_vocab_1_basic korean_vocab_common
+    python3 word_frequency.py rank freq.bin korean_vocab_2_intermediate --flag-below 20000 --sort
+"""
+
+import argparse
+import importlib
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Add lib to path
+sys.path.insert(0, os.path.join(ROOT, 'lib'))
+
+from lib.frequency import DEFAULT_CHUNK_BYTES, FrequencyTable, count_corpus, rank_entries, write_table
+
+VOCAB_DECKS = ["korean_vocab_1_basic", "korean_vocab_2_intermediate", "korean_vocab_common"]
+
+
+def count(args) -> int:
+    missing = [path for path in args.corpus if not os.path.isfile(path)]
+    if missing:
+        print(f"✗ No such file: {', '.join(missing)}")
+        return 1
+    size = sum(os.path.getsize(path) for path in args.corpus)
+    start = time.perf_counter()
+    counts = count_corpus(args.corpus, workers=args.jobs, chunk_bytes=args.chunk_mb << 20)
+    count_seconds = time.perf_counter() - start
+    entries = write_table(counts, args.output)
+    seconds = time.perf_counter() - start
+    print(f"✓ {sum(counts.values())} tokens, {entries} distinct, from {size / 1e6:.1f} MB "
+          f"in {count_seconds:.1f}s ({size / 1e6 / max(count_seconds, 1e-9):.1f} MB/s)")
+    print(f"  - {args.output}: {os.path.getsize(args.output) / 1024:.0f} KB, written in {seconds - count_seconds:.1f}s")
+    return 0
+
+
+def top(args) -> int:
+    with FrequencyTable(args.table) as table:
+        for rank, (word, word_count) in enumerate(table.top(args.n), 1):
+            print(f"  {rank:>6}  {word}  {word_count} ({word_count / table.total * 1e6:.0f} per million)")
+    return 0
+
+
+def rank(args) -> int:
+    sys.path.insert(0, ROOT)
+    flagged = 0
+    with FrequencyTable(args.table) as table:
+        for module in args.decks or VOCAB_DECKS:
+            spec = getattr(importlib.import_module(module), "DECK_SPEC", None)
+            if spec is None:
+                print(f"✗ {module}: no DECK_SPEC")
+                continue
+            entries = rank_entries(spec, table)
+            if args.sort:
+                entries.sort(key=lambda entry: (entry.rank is None, entry.rank or 0))
+            rare = [entry for entry in entries if entry.rank is None or entry.rank > args.flag_below]
+            flagged += len(rare)
+            print(f"{'✓' if not rare else '✗'} {module}: {len(entries)} entries, "
+                  f"{len(rare)} unseen or below rank {args.flag_below}")
+            for entry in entries if args.all else rare:
+                rank_text = f"#{entry.rank}" if entry.rank else "unseen"
+                print(f"  - {entry.word}: {rank_text}, {entry.count}  [{entry.section} #{entry.row}]")
+    return 1 if flagged and args.strict else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Count word frequencies in Korean text and rank deck entries.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    count_parser = commands.add_parser("count", help="count UTF-8 text files into a frequency table")
+    count_parser.add_argument("corpus", nargs="+", help="plain-text files")
+    count_parser.add_argument("-o", "--output", required=True, help="frequency table to write")
+    count_parser.add_argument("--jobs", type=int, default=None, help="worker processes (default: CPU count)")
+    count_parser.add_argument("--chunk-mb", type=int, default=DEFAULT_CHUNK_BYTES >> 20,
+                              help=f"MB of text per task (default: {DEFAULT_CHUNK_BYTES >> 20})")
+
+    top_parser = commands.add_parser("top", help="most frequent words")
+    top_parser.add_argument("table")
+    top_parser.add_argument("-n", type=int, default=50)
+
+    rank_parser = commands.add_parser("rank", help="rank deck entries by frequency")
+    rank_parser.add_argument("table")
+    rank_parser.add_argument("decks", nargs="*", help=f"generator modules (default: {', '.join(VOCAB_DECKS)})")
+    rank_parser.add_argument("--flag-below", type=int, default=10000, metavar="RANK",
+                             help="flag entries ranked below this (default: 10000)")
+    rank_parser.add_argument("--sort", action="store_true", help="most frequent first, not deck order")
+    rank_parser.add_argument("--all", action="store_true", help="list every entry, not just flagged ones")
+    rank_parser.add_argument("--strict", action="store_true", help="exit 1 if any entry is flagged")
+
+    args = parser.parse_args()
+    return {"count": count, "top": top, "rank": rank}[args.command](args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())